@@ -0,0 +1,297 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A batch engine that plays many games at once with NumPy. Every game's token step counts, statuses, and
+# board occupancy are kept in arrays, and each turn of every game is played together with array operations that follow
+# the same priority rules, kicks, doubling, and bounce back as LudoGame.play_game(). Gives the same positions as
+# play_game() for every game. Needs NumPy.
+
+import numpy as np
+
+from LudoGame import BOARD_SPACES, SPACE_INDEX, SPACE_TABLES, MIN_STEPS, MAX_STEPS
+
+SEATS = "ABCD"
+NUM_SPACES = len(BOARD_SPACES)
+NO_SPACE = -1  # board index for "H", "R", "E" and bounce backs
+NO_SEAT = -1  # seat for padding and for turns of a player that isn't valid
+
+# Step counts past 57 bounce back to 114 - steps.
+FINISH_STEPS = 57
+
+
+def build_board_index():
+    """
+    Builds the table of board space indexes for every seat and step count, with NO_SPACE for anything that isn't a board
+    space. Indexed by [seat index, step count - MIN_STEPS].
+
+    :return: numpy array of int16
+    """
+    table = np.full((len(SEATS), MAX_STEPS - MIN_STEPS + 1), NO_SPACE, dtype=np.int16)
+    for seat_index, char in enumerate(SEATS):
+        for offset, name in enumerate(SPACE_TABLES[char][0]):
+            if name in SPACE_INDEX:
+                table[seat_index, offset] = SPACE_INDEX[name]
+    return table
+
+
+BOARD_INDEX = build_board_index()
+
+# Token statuses, the same codes as LudoState.
+HOME = 0
+READY = 1
+ON_BOARD = 2
+FINISHED = 3
+
+
+class BatchGames:
+    """
+    Holds the state of many games in NumPy arrays, one row per game. Turns are given as 2 arrays of seat indexes and
+    rolls with a row per game, padded with NO_SEAT after the last turn of a game. play() plays every game one turn at a
+    time so the work of a turn is shared by all the games in the batch.
+    """
+    def __init__(self, players_lists):
+        count = len(players_lists)
+        self._players_lists = [sorted(char.upper() for char in players_list) for players_list in players_lists]
+        self._steps = np.full((count, len(SEATS), 2), -1, dtype=np.int16)
+        self._status = np.zeros((count, len(SEATS), 2), dtype=np.int8)
+        self._doubled = np.zeros((count, len(SEATS)), dtype=bool)
+        self._in_play = np.zeros((count, len(SEATS)), dtype=bool)
+        self._counts = np.zeros((count, NUM_SPACES), dtype=np.int8)  # tokens on each space, like Board
+        self._owners = np.zeros((count, NUM_SPACES), dtype=np.int8)  # seat index of the tokens on each space
+        for game, players_list in enumerate(self._players_lists):
+            if len(players_list) == 1:  # play_game() stops right away when every Player but 1 is a winner
+                continue
+            for char in players_list:
+                self._in_play[game, SEATS.index(char)] = True
+
+    def get_steps(self):
+        """
+        Returns the array of step counts, indexed by [game, seat index, token index].
+
+        :return: numpy array of int16
+        """
+        return self._steps
+
+    def get_positions(self):
+        """
+        Returns the list play_game() would return for every game: the space name of token p and then token q for every
+        Player in the game.
+
+        :return: list of list of str
+        """
+        steps = self._steps.tolist()
+        positions = []
+        for game, players_list in enumerate(self._players_lists):
+            game_positions = []
+            for char in players_list:
+                names = SPACE_TABLES[char][0]
+                p_steps, q_steps = steps[game][SEATS.index(char)]
+                game_positions.append(names[p_steps - MIN_STEPS])
+                game_positions.append(names[q_steps - MIN_STEPS])
+            positions.append(game_positions)
+        return positions
+
+    def play(self, seats, rolls):
+        """
+        Plays the turns of every game. Rolls must be 1 - 6.
+
+        :param seats: numpy array of int, shape (games, turns). Seat index of each turn, NO_SEAT for padding.
+        :param rolls: numpy array of int, shape (games, turns). Roll of each turn.
+        :return: None
+        """
+        seats = np.asarray(seats, dtype=np.int64)
+        rolls = np.asarray(rolls, dtype=np.int16)
+        if seats.shape != rolls.shape or seats.shape[0] != self._steps.shape[0]:
+            raise ValueError("seats and rolls need one row per game")
+        if np.any((seats != NO_SEAT) & ((rolls < 1) | (rolls > 6))):
+            raise ValueError("rolls must be 1 - 6")
+        for turn in range(seats.shape[1]):
+            self.play_turn(seats[:, turn], rolls[:, turn])
+
+    def play_turn(self, seats, rolls):
+        """
+        Plays one turn in every game with the priority rules of LudoGame.play_turn(): move both tokens if doubled, get a
+        token out of Home on a 6, finish a token on an exact roll, kick out an opponent, and otherwise move the token
+        that is furthest behind.
+
+        :param seats: numpy array of int, shape (games,). Seat index of the turn in each game, NO_SEAT to skip.
+        :param rolls: numpy array of int, shape (games,). Roll of the turn in each game.
+        :return: None
+        """
+        games = np.nonzero(seats != NO_SEAT)[0]
+        seat = seats[games]
+        games, seat = games[self._in_play[games, seat]], seat[self._in_play[games, seat]]
+        status = self._status[games, seat]
+        playing = ~((status[:, 0] == FINISHED) & (status[:, 1] == FINISHED))  # skip Players that are all done
+        games, seat, status = games[playing], seat[playing], status[playing]
+        roll = rolls[games]
+        if games.size == 0:
+            return
+
+        # Doubled Players move both tokens together, skipping a token that can't move.
+        doubled = self._doubled[games, seat]
+        for token in (0, 1):
+            movable = doubled & self.can_move(games, seat, token, roll)
+            self.move(games[movable], seat[movable], token, roll[movable])
+        todo = ~doubled
+
+        # Rule 1: get a token out of Home on a 6, token p first.
+        for token in (0, 1):
+            chosen = todo & (roll == 6) & (status[:, token] == HOME)
+            self.move(games[chosen], seat[chosen], token, roll[chosen])
+            todo &= ~chosen
+
+        # Rule 2: finish a token on an exact roll, token p first.
+        steps = self._steps[games, seat]
+        for token in (0, 1):
+            chosen = todo & (steps[:, token] + roll == FINISH_STEPS)
+            self.move(games[chosen], seat[chosen], token, roll[chosen])
+            todo &= ~chosen
+
+        # Rule 3: kick out an opponent, the token furthest behind if both can.
+        p_steps, q_steps = steps[:, 0], steps[:, 1]
+        p_kick = todo & (p_steps + roll != q_steps) & self.lands_on_token(games, seat, p_steps + roll)
+        q_kick = todo & (q_steps + roll != p_steps) & self.lands_on_token(games, seat, q_steps + roll)
+        kick_token = np.where(p_kick & q_kick, np.where(p_steps < q_steps, 0, 1), np.where(p_kick, 0, 1))
+        for token in (0, 1):
+            chosen = (p_kick | q_kick) & (kick_token == token) & self.can_move(games, seat, token, roll)
+            self.move(games[chosen], seat[chosen], token, roll[chosen])
+            todo &= ~chosen
+
+        # Rule 4: move the token furthest behind, or the other one if it can't move.
+        first = np.where(p_steps < q_steps, 0, 1)
+        first_moves = self.can_move(games, seat, first, roll)
+        chosen_token = np.where(first_moves, first, 1 - first)
+        chosen = todo & (first_moves | self.can_move(games, seat, 1 - first, roll))
+        for token in (0, 1):
+            mask = chosen & (chosen_token == token)
+            double = self.move(games[mask], seat[mask], token, roll[mask])
+            self._doubled[games[mask][double], seat[mask][double]] = True
+        # A Player can't become done in a turn where nothing moved, so the winners check of play_turn() never adds one.
+
+    def can_move(self, games, seat, token, roll):
+        """
+        Returns which games could move the token, the same cases move_token() does not raise InvalidTokenError for.
+
+        :param games: numpy array of int. Game indexes.
+        :param seat: numpy array of int. Seat index in each game.
+        :param token: int or numpy array of int. 0 for token p, 1 for token q, either for all games or for each game.
+        :param roll: numpy array of int. Roll in each game.
+        :return: numpy array of bool
+        """
+        steps = self._steps[games, seat, token]
+        return ~(((steps == -1) & (roll != 6)) | (steps == FINISH_STEPS))
+
+    def lands_on_token(self, games, seat, future_steps):
+        """
+        Returns which games have a token on the board space for future_steps. Bounce backs, "R", and "E" never do.
+
+        :param games: numpy array of int. Game indexes.
+        :param seat: numpy array of int. Seat index in each game.
+        :param future_steps: numpy array of int. Step count after the move.
+        :return: numpy array of bool
+        """
+        space = BOARD_INDEX[seat, np.minimum(future_steps, MAX_STEPS) - MIN_STEPS]
+        on_board = space != NO_SPACE
+        occupied = np.zeros(games.size, dtype=bool)
+        occupied[on_board] = self._counts[games[on_board], space[on_board]] > 0
+        return occupied
+
+    def move(self, games, seat, token, roll):
+        """
+        Moves one token in each of the games like LudoGame.move_token(). Every game must be able to move the token.
+        Kicks out opponent tokens, and sends a doubled opponent's tokens both back to Home.
+
+        :param games: numpy array of int. Game indexes, each at most once.
+        :param seat: numpy array of int. Seat index in each game.
+        :param token: int. 0 for token p, 1 for token q.
+        :param roll: numpy array of int. Roll in each game.
+        :return: numpy array of bool. True for the games where the token landed on a friendly token.
+        """
+        double = np.zeros(games.size, dtype=bool)
+        if games.size == 0:
+            return double
+        start_steps = self._steps[games, seat, token]
+
+        leaving_home = start_steps == -1
+        self._steps[games[leaving_home], seat[leaving_home], token] = 0
+        self._status[games[leaving_home], seat[leaving_home], token] = READY
+
+        moving = ~leaving_home
+        games, seat, roll, start_steps = games[moving], seat[moving], roll[moving], start_steps[moving]
+        end_steps = start_steps + roll
+        end_steps = np.where(end_steps > FINISH_STEPS, 2 * FINISH_STEPS - end_steps, end_steps)  # bounce back
+        start_space = BOARD_INDEX[seat, start_steps - MIN_STEPS]
+        end_space = BOARD_INDEX[seat, end_steps - MIN_STEPS]
+        finishing = end_steps == FINISH_STEPS
+
+        on_board = ~finishing
+        occupied = np.zeros(games.size, dtype=bool)
+        occupied[on_board] = self._counts[games[on_board], end_space[on_board]] > 0
+        owners = np.full(games.size, NO_SEAT, dtype=np.int64)
+        owners[occupied] = self._owners[games[occupied], end_space[occupied]]
+        double[moving] = occupied & (owners == seat)
+        hostile = occupied & (owners != seat)
+
+        from_space = start_space != NO_SPACE  # everything but the ready position
+        self._counts[games[from_space], start_space[from_space]] -= 1
+        self._counts[games[hostile], end_space[hostile]] = 0
+        self._counts[games[on_board], end_space[on_board]] += 1
+        self._owners[games[on_board], end_space[on_board]] = seat[on_board]
+        self._steps[games, seat, token] = end_steps
+        self._status[games[finishing], seat[finishing], token] = FINISHED
+        from_ready = start_steps == 0
+        self._status[games[from_ready], seat[from_ready], token] = ON_BOARD
+        self.send_home(games[hostile], owners[hostile], end_space[hostile])
+        return double
+
+    def send_home(self, games, victim, space):
+        """
+        Resets the tokens that were kicked off a space. A doubled victim has both tokens reset and is no longer doubled,
+        like Player.reset_status_and_steps().
+
+        :param games: numpy array of int. Game indexes.
+        :param victim: numpy array of int. Seat index of the kicked Player in each game.
+        :param space: numpy array of int. Board index of the space the tokens were kicked off.
+        :return: None
+        """
+        doubled = self._doubled[games, victim]
+        for token in (0, 1):
+            steps = self._steps[games, victim, token]
+            kicked = doubled | (BOARD_INDEX[victim, steps - MIN_STEPS] == space)
+            self._steps[games[kicked], victim[kicked], token] = -1
+            self._status[games[kicked], victim[kicked], token] = HOME
+        self._doubled[games, victim] = False
+
+
+def encode_turns(turns_lists):
+    """
+    Turns lists of (player char, step count) tuples into the padded seat and roll arrays BatchGames.play() takes. Turns
+    for anything that isn't "A", "B", "C", or "D" get NO_SEAT so they are skipped.
+
+    :param turns_lists: list of list of tuples.
+    :return: tuple of (numpy array of int8, numpy array of int8)
+    """
+    length = max((len(turns_list) for turns_list in turns_lists), default=0)
+    seats = np.full((len(turns_lists), length), NO_SEAT, dtype=np.int8)
+    rolls = np.zeros((len(turns_lists), length), dtype=np.int8)
+    for game, turns_list in enumerate(turns_lists):
+        for turn, (player_char, steps) in enumerate(turns_list):
+            if isinstance(player_char, str) and player_char.upper() in SEATS:
+                seats[game, turn] = SEATS.index(player_char.upper())
+            rolls[game, turn] = steps
+    return seats, rolls
+
+
+def play_games(players_lists, turns_lists):
+    """
+    Plays every game in the batch and returns the list of positions play_game() returns for each one.
+
+    :param players_lists: list of list of str. Players of each game.
+    :param turns_lists: list of list of tuples. Turns of each game.
+    :return: list of list of str
+    """
+    batch = BatchGames(players_lists)
+    seats, rolls = encode_turns(turns_lists)
+    batch.play(seats, rolls)
+    return batch.get_positions()
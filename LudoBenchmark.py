@@ -0,0 +1,752 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Benchmarks for LudoGame. Generates deterministic turn lists and reports how many turns per second
+# play_game() can get through. Can also load an older copy of LudoGame.py (for example one saved with
+# "git show HEAD~1:LudoGame.py > old_LudoGame.py") so the numbers before and after a change can be compared. The
+# --suite mode times the hot methods of Board, Player, and LudoGame one by one and full games of 2 to 4 players, writes
+# the results as JSON, and fails when a result is slower than a saved baseline by more than a threshold.
+
+import argparse
+import copy
+import importlib.util
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import LudoGame
+from LudoState import CompactGame
+
+
+def make_turns(players_list, num_turns, seed=0):
+    """
+    Makes a deterministic turns list by rolling a seeded die. A roll of 6 gives the same player another roll, and the
+    bonus roll never gives a third roll.
+
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param num_turns: int. How many turns to generate.
+    :param seed: int. Seed for the random number generator.
+    :return: list of tuples. Tuple is (player char, step count) for that turn.
+    """
+    rng = random.Random(seed)
+    turns = []
+    seat = 0
+    while len(turns) < num_turns:
+        player_char = players_list[seat % len(players_list)]
+        roll = rng.randint(1, 6)
+        turns.append((player_char, roll))
+        if roll == 6 and len(turns) < num_turns:  # extra roll on a 6
+            turns.append((player_char, rng.randint(1, 6)))
+        seat += 1
+    return turns
+
+
+def load_module(path, name="baseline_LudoGame"):
+    """
+    Imports a LudoGame.py from a file path so an older version can be benchmarked next to the current one.
+
+    :param path: str. Path to the LudoGame.py file.
+    :param name: str. Module name to give the imported file.
+    :return: module
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def turns_per_second(module, players_list, turns_list, repeat=3):
+    """
+    Times play_game() on the same turns list a few times and returns the best turns per second.
+
+    :param module: module. A LudoGame module with a LudoGame class.
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param turns_list: list of tuples. Tuple is (player char, step count) for that turn.
+    :param repeat: int. How many times to time the game.
+    :return: float, or None if the game could not be played (for example a RecursionError).
+    """
+    game = module.LudoGame()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            game.play_game(list(players_list), turns_list)
+        except RecursionError:
+            return None
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return len(turns_list) / best
+
+
+def bytes_per_game(make_game, count=2000):
+    """
+    Uses tracemalloc to measure how many bytes each live game takes, by keeping count games made by make_game() alive
+    at once and dividing the memory they use.
+
+    :param make_game: function. Takes the int number of the game and returns the game object to keep.
+    :param count: int. How many games to keep alive.
+    :return: float
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [make_game(num) for num in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del games
+    return (after - before) / count
+
+
+def memory_report(count=2000):
+    """
+    Prints the bytes per game of a LudoGame with its Board and Players next to a CompactGame holding the same state.
+
+    :param count: int. How many games to measure with.
+    :return: None
+    """
+    players_list = ["A", "B", "C", "D"]
+    games = []
+    for num in range(count):
+        game = LudoGame.LudoGame()
+        game.play_game(list(players_list), make_turns(players_list, 200, seed=num))
+        games.append(game)
+    states = [CompactGame.from_game(game) for game in games]
+    print("{:<14}{:>16}".format("state", "bytes/game"))
+    print("{:<14}{:>16,.0f}".format("LudoGame", bytes_per_game(lambda num: states[num].to_game(), count)))
+    print("{:<14}{:>16,.0f}".format("CompactGame", bytes_per_game(lambda num: CompactGame.from_game(games[num]),
+                                                                   count)))
+
+
+def batch_report(num_turns=400):
+    """
+    Prints games per second and turns per second of LudoBatch for growing batch sizes, next to play_game() called once
+    per game. Needs NumPy.
+
+    :param num_turns: int. Turns in every game.
+    :return: None
+    """
+    import LudoBatch
+
+    players_list = ["A", "B", "C", "D"]
+    print("{:<12}{:>10}{:>16}{:>16}".format("engine", "games", "games/second", "turns/second"))
+    for count in (1, 10, 100, 1000, 10000):
+        turns_lists = [make_turns(players_list, num_turns, seed=num) for num in range(count)]
+        if count <= 1000:
+            game = LudoGame.LudoGame()
+            start = time.perf_counter()
+            for turns_list in turns_lists:
+                game.play_game(list(players_list), turns_list)
+            elapsed = time.perf_counter() - start
+            print("{:<12}{:>10,}{:>16,.0f}{:>16,.0f}".format("play_game", count, count / elapsed,
+                                                              count * num_turns / elapsed))
+        start = time.perf_counter()
+        LudoBatch.play_games([players_list] * count, turns_lists)
+        elapsed = time.perf_counter() - start
+        print("{:<12}{:>10,}{:>16,.0f}{:>16,.0f}".format("LudoBatch", count, count / elapsed,
+                                                          count * num_turns / elapsed))
+
+
+def pool_report(count=4000, num_turns=400):
+    """
+    Prints games per second of LudoPool with 1, 2, 4, and all cores, next to play_game() in this process.
+
+    :param count: int. Games to play.
+    :param num_turns: int. Turns in every game.
+    :return: None
+    """
+    import os
+    import LudoPool
+
+    players_list = ["A", "B", "C", "D"]
+    jobs = [(players_list, make_turns(players_list, num_turns, seed=num)) for num in range(count)]
+    game = LudoGame.LudoGame()
+    start = time.perf_counter()
+    for players, turns_list in jobs:
+        game.play_game(list(players), turns_list)
+    serial = count / (time.perf_counter() - start)
+    print("cores available: {}".format(os.cpu_count()))
+    print("{:<12}{:>16}{:>10}".format("workers", "games/second", "speedup"))
+    print("{:<12}{:>16,.0f}{:>10.2f}".format("in process", serial, 1.0))
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        for _ in LudoPool.play_games(jobs, workers=workers, chunksize=128):
+            pass
+        rate = count / (time.perf_counter() - start)
+        print("{:<12}{:>16,.0f}{:>10.2f}".format(workers, rate, rate / serial))
+
+
+def fork_report(prefix_turns=80, continuations=300, depth=10):
+    """
+    Prints the microseconds per explored continuation when a mid-game position is forked with the undo log, with a
+    CompactGame snapshot, with copy.deepcopy(), and by replaying the whole game with play_game().
+
+    :param prefix_turns: int. Turns played before the position that is explored.
+    :param continuations: int. Continuations tried from the position.
+    :param depth: int. Turns in every continuation.
+    :return: None
+    """
+    players_list = ["A", "B", "C", "D"]
+    prefix = make_turns(players_list, prefix_turns)
+    tries = [make_turns(players_list, depth, seed=num + 1) for num in range(continuations)]
+    game = LudoGame.LudoGame()
+    game.play_game(list(players_list), prefix)
+
+    def with_undo():
+        game.start_undo_log()
+        for turns_list in tries:
+            mark = game.get_undo_mark()
+            for player_char, steps in turns_list:
+                game.play_turn(player_char, steps)
+            game.undo(mark)
+        game.stop_undo_log()
+
+    def with_snapshot():
+        snapshot = CompactGame.from_game(game)
+        for turns_list in tries:
+            for player_char, steps in turns_list:
+                game.play_turn(player_char, steps)
+            snapshot.to_game(game)
+
+    def with_deepcopy():
+        for turns_list in tries:
+            fork = copy.deepcopy(game)
+            for player_char, steps in turns_list:
+                fork.play_turn(player_char, steps)
+
+    def with_replay():
+        replay = LudoGame.LudoGame()
+        for turns_list in tries:
+            replay.play_game(list(players_list), prefix + turns_list)
+
+    print("{:<12}{:>22}".format("fork", "us/continuation"))
+    for label, explore in (("undo log", with_undo), ("snapshot", with_snapshot), ("deepcopy", with_deepcopy),
+                           ("replay", with_replay)):
+        start = time.perf_counter()
+        explore()
+        print("{:<12}{:>22,.1f}".format(label, (time.perf_counter() - start) / continuations * 1e6))
+
+
+def track_spaces(player):
+    """
+    Returns the shared track spaces, as ints, of the Player's tokens that are on the shared track.
+
+    :param player: LudoGame.Player
+    :return: list of int
+    """
+    return [int(player.get_space_name(steps)) for steps in (player.get_token_p_step_count(),
+                                                            player.get_token_q_step_count()) if 1 <= steps <= 50]
+
+
+def reset_module_game(game, players_list):
+    """
+    Gets a game ready for a new game with reset_game(), or, for an older LudoGame that doesn't have it, the way its
+    play_game() did: reset_board(), reset_player() of every seat, and start() of the Players in the game.
+
+    :param game: LudoGame. Of any version of the module.
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :return: None
+    """
+    if hasattr(game, "reset_game"):
+        game.reset_game(players_list)
+        return
+    players = vars(game)["_players"]  # the old module has no getter for Players that aren't in play
+    game.get_board().reset_board()
+    for player in players.values():
+        player.reset_player()
+    for char in players_list:
+        players[char.upper()].start()
+
+
+def traced_bytes(run, kept):
+    """
+    Uses tracemalloc to measure the bytes run() allocates. The kept objects stay alive while measuring, so lists that
+    run() replaces can't be freed and hide the new ones.
+
+    :param run: function taking no parameters.
+    :param kept: list. Objects to keep alive.
+    :return: int
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    run()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return allocated
+
+
+def reset_bytes(module, players_list, turns_list):
+    """
+    Measures the bytes getting a played game ready for a new one allocates, with reset_module_game(). Every object the
+    Board and game held before the reset is kept alive while measuring.
+
+    :param module: module. A LudoGame module with a LudoGame class.
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param turns_list: list of tuples. Turns played before the reset so the board isn't empty.
+    :return: int
+    """
+    game = module.LudoGame()
+    game.play_game(list(players_list), turns_list)
+    board = game.get_board()
+    kept = list(vars(board).values()) + list(board.get_board().values()) + list(vars(game).values())
+    return traced_bytes(lambda: reset_module_game(game, players_list), kept)
+
+
+def pool_bytes(players_list, turns_list):
+    """
+    Measures the bytes GamePool.release() of a played game and acquire() of the next one allocate together. Every object
+    the Board and game held before is kept alive while measuring.
+
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param turns_list: list of tuples. Turns played before the release so the board isn't empty.
+    :return: int
+    """
+    pool = LudoGame.GamePool(1)
+    game = pool.acquire()
+    game.play_game(list(players_list), turns_list)
+    board = game.get_board()
+    kept = list(vars(board).values()) + list(board.get_board().values()) + list(vars(game).values())
+    acquired = [None]  # made before measuring so holding the acquired game allocates nothing
+
+    def release_and_acquire():
+        pool.release(game)
+        acquired[0] = pool.acquire(players_list)
+    return traced_bytes(release_and_acquire, kept)
+
+
+def reset_report(baseline=None, count=5000, num_turns=100):
+    """
+    Prints the bytes allocated to get a game ready for a new game and the time per game of short games, for a new
+    LudoGame every game, a LudoGame reused with reset_game(), and games from a GamePool. With a baseline module, also
+    for the baseline's reused LudoGame.
+
+    :param baseline: module or None. An older LudoGame module to compare against.
+    :param count: int. Games to time.
+    :param num_turns: int. Turns in every game.
+    :return: None
+    """
+    players_list = ["A", "B", "C", "D"]
+    turns_lists = [make_turns(players_list, num_turns, seed=num) for num in range(count)]
+    rows = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fresh = LudoGame.LudoGame()
+    new_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del fresh
+
+    def new_games():
+        for turns_list in turns_lists:
+            LudoGame.LudoGame().play_game(list(players_list), turns_list)
+    rows.append(("new LudoGame", new_bytes, new_games))
+    modules = [("reset_game", LudoGame)]
+    if baseline is not None:
+        modules.insert(0, ("baseline reset", baseline))
+    for label, module in modules:
+        reused = module.LudoGame()
+
+        def reused_games():
+            for turns_list in turns_lists:
+                reused.play_game(list(players_list), turns_list)
+        rows.append((label, reset_bytes(module, players_list, turns_lists[0]), reused_games))
+    pool = LudoGame.GamePool(1)
+
+    def pooled_games():
+        for turns_list in turns_lists:
+            game = pool.acquire()
+            game.play_game(list(players_list), turns_list)
+            pool.release(game)
+    rows.append(("GamePool", pool_bytes(players_list, turns_lists[0]), pooled_games))
+
+    print("{:<16}{:>20}{:>14}".format("setup", "bytes allocated", "us/game"))
+    for label, allocated, run in rows:
+        print("{:<16}{:>20,}{:>14,.1f}".format(label, allocated, best_time(run, 3) / count * 1e6))
+
+
+def layout_report(num_games=300, seed=0):
+    """
+    Prints the turns per second of full random games with every seat playing, and the bytes a LudoGame takes, for every
+    preset of LudoGame.LAYOUTS.
+
+    :param num_games: int. Games to play on each layout.
+    :param seed: int. Seed of the dice.
+    :return: None
+    """
+    import LudoSimulator
+
+    print("{:<12}{:>7}{:>8}{:>14}{:>16}{:>10}".format("layout", "seats", "tokens", "turns/game", "turns/second",
+                                                      "bytes"))
+    for name, layout in LudoGame.LAYOUTS.items():
+        game = LudoGame.LudoGame(layout)
+        players_list = list(layout.get_seats())
+        rng = LudoSimulator.chunk_rng(seed, 0)
+        turns = 0
+        start = time.perf_counter()
+        for _ in range(num_games):
+            turns += LudoSimulator.play_random_game(game, players_list, rng)[1]
+        elapsed = time.perf_counter() - start
+        size = bytes_per_game(lambda num: LudoGame.LudoGame(layout), count=200)
+        print("{:<12}{:>7}{:>8}{:>14,.1f}{:>16,.0f}{:>10,.0f}".format(name, len(players_list), layout.get_token_count(),
+                                                                     turns / num_games, turns / elapsed, size))
+
+
+def rules_report(num_games=1000, seed=0):
+    """
+    Prints the turns per second of full random 4 player games for every preset of LudoGame.RULE_SETS, and how that
+    compares to the README rules.
+
+    :param num_games: int. Games to play with each rule set.
+    :param seed: int. Seed of the dice.
+    :return: None
+    """
+    import LudoSimulator
+
+    print("{:<14}{:>14}{:>16}{:>12}".format("rules", "turns/game", "turns/second", "vs classic"))
+    classic_rate = None
+    for name, rules in LudoGame.RULE_SETS.items():
+        game = LudoGame.LudoGame(rules=rules)
+        rng = LudoSimulator.chunk_rng(seed, 0)
+        turns = 0
+        start = time.perf_counter()
+        for _ in range(num_games):
+            turns += LudoSimulator.play_random_game(game, ["A", "B", "C", "D"], rng)[1]
+        rate = turns / (time.perf_counter() - start)
+        classic_rate = classic_rate or rate
+        print("{:<14}{:>14,.1f}{:>16,.0f}{:>+12.1%}".format(name, turns / num_games, rate, rate / classic_rate - 1))
+
+
+def targeted_turns(players_list, num_turns, seed=0, want="kick"):
+    """
+    Makes a deterministic turns list heavy on kicks ("kick") or stacks ("stack"). Tries every roll for each turn and
+    keeps the one that kicks an opponent out (or doubles the Player up, or kicks a doubled opponent so it can double up
+    again), and otherwise the one that leaves the most tokens of different Players (or of the same Player) 1 - 6 spaces
+    apart so the next turns get a chance to. Ties are broken by a seeded shuffle. Plays the turns on a LudoGame with the
+    undo log on to see what each roll does.
+
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param num_turns: int. How many turns to generate.
+    :param seed: int. Seed for the random number generator.
+    :param want: str. "kick" or "stack".
+    :return: list of tuples. Tuple is (player char, step count) for that turn.
+    """
+    rng = random.Random(seed)
+    game = LudoGame.LudoGame()
+    players_list = sorted(players_list)
+    game.reset_game(players_list)
+    game.start_undo_log()
+    players = [game.get_player_by_position(char) for char in players_list]
+
+    def close_pairs(player):
+        if want == "kick":  # tokens of different Players
+            spaces = [track_spaces(other) for other in players]
+            return sum(1 for first, second in itertools.permutations(range(len(players)), 2)
+                       for a in spaces[first] for b in spaces[second] if 1 <= (b - a) % 56 <= 6)
+        p_steps = player.get_token_p_step_count()
+        q_steps = player.get_token_q_step_count()
+        return 1 if not player.get_doubled() and 0 <= p_steps < 57 and 0 <= q_steps < 57 and \
+            1 <= abs(p_steps - q_steps) <= 6 else 0
+
+    turns = []
+    seat = 0
+    while len(turns) < num_turns:
+        player_char = players_list[seat % len(players_list)]
+        player = players[seat % len(players_list)]
+        seat += 1
+        rolls = list(range(1, 7))
+        rng.shuffle(rolls)
+        best_score = None
+        roll = rolls[0]
+        for candidate in rolls:
+            mark = game.get_undo_mark()
+            doubled = [other.get_doubled() for other in players]
+            moves = game.play_turn(player_char, candidate)
+            if want == "kick":
+                hit = any(move.kicked for move in moves)
+            else:  # doubles the Player up, or splits a doubled opponent so it can double up again
+                hit = player.get_doubled() and not doubled[players.index(player)] or \
+                    any(was_doubled and not other.get_doubled() for other, was_doubled in zip(players, doubled))
+            score = (1000 if hit else 0) + close_pairs(player)
+            game.undo(mark)
+            if best_score is None or score > best_score:
+                best_score, roll = score, candidate
+        turns.append((player_char, roll))
+        game.play_turn(player_char, roll)
+        game.stop_undo_log()  # keeps the undo log from growing with every turn
+        game.start_undo_log()
+    return turns
+
+
+def best_time(run, repeat):
+    """
+    Calls run() repeat times and returns the fastest time in seconds.
+
+    :param run: function. Takes no parameters.
+    :param repeat: int
+    :return: float
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def micro_benchmarks(repeat=5, loops=20000):
+    """
+    Times the hot methods one at a time on fixed positions. Methods that change the board make a move and then the
+    move back, so every loop starts from the same position.
+
+    :param repeat: int. Times each benchmark is run, the fastest counts.
+    :param loops: int. Loops in each run.
+    :return: dict with str as keys and float nanoseconds per call as values
+    """
+    results = {}
+    players_list = ["A", "B", "C", "D"]
+    game = LudoGame.LudoGame()
+    game.play_game(list(players_list), make_turns(players_list, 80))
+    player = game.get_player_by_position("A")
+    spaces = LudoGame.BOARD_SPACES
+
+    def space_names():
+        get_space_name = player.get_space_name
+        for _ in range(loops // 59):
+            for steps in range(-1, 58):
+                get_space_name(steps)
+    results["Player.get_space_name"] = best_time(space_names, repeat) / (loops // 59 * 59)
+
+    board = game.get_board()
+
+    def occupants():
+        get_occupant = board.get_occupant
+        for _ in range(loops // len(spaces)):
+            for space in spaces:
+                get_occupant(space)
+    results["Board.get_occupant"] = best_time(occupants, repeat) / (loops // len(spaces) * len(spaces))
+
+    empty_board = LudoGame.Board()
+    empty_board.add_token("5", "a_p")
+
+    def move_pieces():
+        move_piece = empty_board.move_piece
+        for _ in range(loops // 2):
+            move_piece("a_p", "5", "9")
+            move_piece("a_p", "9", "5")
+    results["Board.move_piece"] = best_time(move_pieces, repeat) / (loops // 2 * 2)
+
+    def player_lookups():
+        get_player_by_position = game.get_player_by_position
+        for _ in range(loops // 4):
+            for char in players_list:
+                get_player_by_position(char)
+    results["LudoGame.get_player_by_position"] = best_time(player_lookups, repeat) / (loops // 4 * 4)
+
+    def token_moves():
+        get_token_move = game.get_token_move
+        for _ in range(loops // 12):
+            for steps in range(1, 7):
+                get_token_move(player, "p", steps)
+                get_token_move(player, "q", steps)
+    results["LudoGame.get_token_move"] = best_time(token_moves, repeat) / (loops // 12 * 12)
+
+    def all_moves():
+        legal_moves = game.legal_moves
+        for _ in range(loops // 6):
+            for steps in range(1, 7):
+                legal_moves(player, steps)
+    results["LudoGame.legal_moves"] = best_time(all_moves, repeat) / (loops // 6 * 6)
+
+    mover = LudoGame.LudoGame()
+    mover.reset_game(["A", "B"])
+    mover.play_turn("A", 6)
+    mover.play_turn("A", 5)
+    moving = mover.get_player_by_position("A")
+    forward = mover.get_token_move(moving, "p", 3)
+    back = LudoGame.TokenMove("p", forward.end_steps, forward.start_steps, forward.end_space, forward.start_space, (),
+                              False, False, False)
+
+    def apply_moves():
+        apply_move = mover.apply_move
+        for _ in range(loops // 2):
+            apply_move(moving, forward)
+            apply_move(moving, back)
+    results["LudoGame.apply_move"] = best_time(apply_moves, repeat) / (loops // 2 * 2)
+
+    turns_list = make_turns(players_list, 400)
+
+    def play_turns():
+        for _ in range(loops // len(turns_list)):
+            game.reset_game(players_list)
+            play_turn = game.play_turn
+            for player_char, steps in turns_list:
+                play_turn(player_char, steps)
+    results["LudoGame.play_turn"] = best_time(play_turns, repeat) / (loops // len(turns_list) * len(turns_list))
+    return {name: seconds * 1e9 for name, seconds in results.items()}
+
+
+# Full games the suite plays: name -> (players_list, how the turns are made, number of turns).
+MACRO_CASES = {
+    "play_game 2p short": (["A", "C"], "random", 500),
+    "play_game 3p short": (["A", "B", "C"], "random", 500),
+    "play_game 4p short": (["A", "B", "C", "D"], "random", 500),
+    "play_game 2p long": (["A", "C"], "random", 100000),
+    "play_game 3p long": (["A", "B", "C"], "random", 100000),
+    "play_game 4p long": (["A", "B", "C", "D"], "random", 100000),
+    "play_game 4p kick-heavy": (["A", "B", "C", "D"], "kick", 2000),
+    "play_game 4p stack-heavy": (["A", "B", "C", "D"], "stack", 2000),
+}
+
+
+def macro_benchmarks(repeat=5):
+    """
+    Times play_game() on every case of MACRO_CASES.
+
+    :param repeat: int. Times each game is played, the fastest counts.
+    :return: dict with str as keys and float nanoseconds per turn as values
+    """
+    results = {}
+    game = LudoGame.LudoGame()
+    for name, (players_list, kind, num_turns) in MACRO_CASES.items():
+        if kind == "random":
+            turns_list = make_turns(players_list, num_turns)
+        else:
+            turns_list = targeted_turns(players_list, num_turns, want=kind)
+        seconds = best_time(lambda: game.play_game(list(players_list), turns_list), repeat)
+        results[name] = seconds / num_turns * 1e9
+    return results
+
+
+def run_suite(repeat=5):
+    """
+    Runs the micro and macro benchmarks and returns the machine-readable results. Every result is nanoseconds per call
+    or per turn, so lower is better for all of them.
+
+    :param repeat: int. Times each benchmark is run, the fastest counts.
+    :return: dict
+    """
+    results = micro_benchmarks(repeat)
+    results.update(macro_benchmarks(repeat))
+    return {
+        "version": 1,
+        "unit": "ns",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare_results(current, baseline, threshold=0.10):
+    """
+    Compares suite results with a baseline. A benchmark regresses if it takes more than threshold longer than in the
+    baseline. Benchmarks missing from either side are left out.
+
+    :param current: dict. From run_suite().
+    :param baseline: dict. From run_suite(), usually loaded from a JSON file.
+    :param threshold: float. Allowed slowdown, 0.10 for 10%.
+    :return: list of tuples. Tuple is (name, baseline ns, current ns, change, True if it regressed).
+    """
+    rows = []
+    for name, value in current["results"].items():
+        if name in baseline["results"]:
+            base = baseline["results"][name]
+            change = value / base - 1.0
+            rows.append((name, base, value, change, change > threshold))
+    return rows
+
+
+def suite_report(json_path=None, baseline_path=None, threshold=0.10, repeat=5):
+    """
+    Runs the suite, prints the results, writes them to json_path, and compares them with the baseline file.
+
+    :param json_path: str or None. File to write the results to.
+    :param baseline_path: str or None. Results file of an earlier run to compare against.
+    :param threshold: float. Allowed slowdown before a benchmark counts as a regression.
+    :param repeat: int. Times each benchmark is run, the fastest counts.
+    :return: int. 1 if anything regressed, 0 otherwise.
+    """
+    current = run_suite(repeat)
+    if json_path:
+        with open(json_path, "w") as json_file:
+            json.dump(current, json_file, indent=2, sort_keys=True)
+    if not baseline_path:
+        print("{:<34}{:>14}".format("benchmark", "ns"))
+        for name, value in current["results"].items():
+            print("{:<34}{:>14,.1f}".format(name, value))
+        return 0
+    with open(baseline_path) as json_file:
+        baseline = json.load(json_file)
+    regressions = 0
+    print("{:<34}{:>14}{:>14}{:>10}".format("benchmark", "baseline ns", "current ns", "change"))
+    for name, base, value, change, regressed in compare_results(current, baseline, threshold):
+        regressions += regressed
+        print("{:<34}{:>14,.1f}{:>14,.1f}{:>+10.1%}{}".format(name, base, value, change,
+                                                              "  REGRESSION" if regressed else ""))
+    print("{} regression(s) beyond {:.0%}".format(regressions, threshold))
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark LudoGame.play_game() turns per second.")
+    parser.add_argument("--baseline", help="path to an older LudoGame.py to compare against")
+    parser.add_argument("--players", default="ABCD", help="players in the game, for example ABCD")
+    parser.add_argument("--memory", action="store_true", help="report bytes per game instead of turns per second")
+    parser.add_argument("--batch", action="store_true", help="report LudoBatch throughput by batch size")
+    parser.add_argument("--pool", action="store_true", help="report LudoPool scaling by number of workers")
+    parser.add_argument("--fork", action="store_true", help="report the cost of exploring continuations of a game")
+    parser.add_argument("--reset", action="store_true", help="report allocations and time of getting a game ready")
+    parser.add_argument("--layouts", action="store_true", help="report turns per second on every board layout")
+    parser.add_argument("--rules", action="store_true", help="report turns per second with every set of house rules")
+    parser.add_argument("--suite", action="store_true", help="run the micro and macro benchmark suite")
+    parser.add_argument("--json", help="with --suite, write the results to this JSON file")
+    parser.add_argument("--compare", help="with --suite, JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="with --compare, allowed slowdown (0.10 = 10%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="with --suite, runs of each benchmark")
+    args = parser.parse_args(argv)
+
+    if args.suite:
+        return suite_report(args.json, args.compare, args.threshold, args.repeat)
+    if args.reset:
+        reset_report(load_module(args.baseline) if args.baseline else None)
+        return
+
+    if args.layouts:
+        layout_report()
+        return
+    if args.rules:
+        rules_report()
+        return
+    if args.memory:
+        memory_report()
+        return
+    if args.batch:
+        batch_report()
+        return
+    if args.pool:
+        pool_report()
+        return
+    if args.fork:
+        fork_report()
+        return
+
+    players_list = list(args.players.upper())
+    modules = [("current", LudoGame)]
+    if args.baseline:
+        modules.insert(0, ("baseline", load_module(args.baseline)))
+
+    print("{:<10}{:>12}{:>16}".format("version", "turns", "turns/second"))
+    for num_turns in (500, 900, 10000, 1000000):
+        turns_list = make_turns(players_list, num_turns)
+        for label, module in modules:
+            rate = turns_per_second(module, players_list, turns_list, repeat=1 if num_turns > 10000 else 3)
+            result = "RecursionError" if rate is None else "{:,.0f}".format(rate)
+            print("{:<10}{:>12,}{:>16}".format(label, num_turns, result))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Seat-rotation canonicalization of game states. The 4 seats of the classic board are the same seat turned
+# 14 spaces around the track (starts 1/15/29/43, ends 50/8/22/36), and every rule works on step counts, so a game seen
+# from seat B is the same game as one seen from seat A with every Player moved up a seat. rotate_state() turns a
+# CompactGame by some number of seats, and canonical_key() turns it so the Player to move sits in seat "A" (or, with
+# nobody to move, to the smallest of the 4 turnings) and returns a hashable key and the shift that undoes it. A cache or
+# table keyed on canonical_key() holds one entry where it would hold up to 4. check_rotations() plays random games from
+# a state and from every turning of it and checks that they give the same positions. Every RuleSet gives each seat the
+# same rules, so the turnings hold for all of them; a key doesn't hold the RuleSet, so keep one table per RuleSet.
+
+import argparse
+import random
+import sys
+
+from LudoGame import LudoGame, RULE_SETS
+from LudoState import CompactGame, SEATS, TOKENS, STEP_BITS, STATUS_BITS, GHOST_BITS, IN_PLAY_SHIFT, FINISHED_SHIFT
+from LudoState import DOUBLED_SHIFT, SIX_PLAYER_SHIFT, SIX_PLAYER_BITS, SIX_STREAK_SHIFT, WINNER_BITS, FINISH_SHIFT
+from LudoState import FINISH_TOKEN_BITS
+
+SEAT_COUNT = len(SEATS)
+SEAT_TOKEN_BITS = STEP_BITS * len(TOKENS)  # bits of _tokens per seat
+SEAT_STATUS_BITS = STATUS_BITS * len(TOKENS)  # bits of _statuses per seat
+SEAT_GHOST_BITS = GHOST_BITS * len(TOKENS) * 6  # bits of _ghosts per seat, 2 slots on each of the 6 home row spaces
+
+
+def rotate_bits(value, shift, seat_bits):
+    """
+    Moves the block of seat_bits bits of every seat up shift seats, the block of "D" going around to "A".
+
+    :param value: int. SEAT_COUNT blocks of seat_bits bits, seat "A" in the lowest.
+    :param shift: int. 0 - 3 seats.
+    :param seat_bits: int. Bits per seat.
+    :return: int
+    """
+    total_bits = seat_bits * SEAT_COUNT
+    shift_bits = seat_bits * shift
+    return ((value << shift_bits) | (value >> (total_bits - shift_bits))) & ((1 << total_bits) - 1)
+
+
+def rotate_entries(value, entry_bits, seat_of, shift):
+    """
+    Moves every entry of a 0-ended list packed in value up shift seats. Each entry is an id + 1.
+
+    :param value: int. Entries of entry_bits bits, first in the lowest.
+    :param entry_bits: int.
+    :param seat_of: int. Ids per seat, 1 for a seat id and 2 for a token id.
+    :param shift: int. 0 - 3 seats.
+    :return: int
+    """
+    mask = (1 << entry_bits) - 1
+    rotated = 0
+    offset = 0
+    while value:
+        entry_id = (value & mask) - 1
+        rotated |= ((entry_id + shift * seat_of) % (SEAT_COUNT * seat_of) + 1) << offset
+        value >>= entry_bits
+        offset += entry_bits
+    return rotated
+
+
+def rotate_seat(char, shift):
+    """
+    Returns the seat shift seats after char, "D" going around to "A". Anything that isn't a seat is returned as is,
+    like play_turn() skipping a turn for an unknown Player.
+
+    :param char: str. "A", "B", "C", or "D".
+    :param shift: int.
+    :return: str
+    """
+    if char not in SEATS:
+        return char
+    return SEATS[(SEATS.index(char) + shift) % SEAT_COUNT]
+
+
+def rotate_turns(turns_list, shift):
+    """
+    Returns the turns with every Player moved up shift seats.
+
+    :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+    :param shift: int.
+    :return: list of tuples.
+    """
+    return [(rotate_seat(player_char, shift), steps) for player_char, steps in turns_list]
+
+
+def rotate_state(state, shift):
+    """
+    Returns the CompactGame of the same game with every Player moved up shift seats: the step counts, statuses, and
+    flags of seat "A" become those of "B", and so on, along with the winners, the finish, the ghost tokens, and the
+    Player of the three_sixes streak. The RuleSet stays the same. A negative shift turns the other way, so
+    rotate_state(rotate_state(state, s), -s) == state.
+
+    :param state: CompactGame
+    :param shift: int.
+    :return: CompactGame
+    """
+    shift %= SEAT_COUNT
+    if not shift:
+        return state
+    tokens, statuses, flags, order, ghosts = state.get_fields()
+    rotated_flags = 0
+    for flag_shift in (IN_PLAY_SHIFT, FINISHED_SHIFT, DOUBLED_SHIFT):
+        seat_flags = (flags >> flag_shift) & ((1 << SEAT_COUNT) - 1)
+        rotated_flags |= rotate_bits(seat_flags, shift, 1) << flag_shift
+    six_seat = (flags >> SIX_PLAYER_SHIFT) & ((1 << SIX_PLAYER_BITS) - 1)
+    rotated_flags |= rotate_entries(six_seat, SIX_PLAYER_BITS, 1, shift) << SIX_PLAYER_SHIFT
+    rotated_flags |= flags >> SIX_STREAK_SHIFT << SIX_STREAK_SHIFT  # the count of 6s stays as it is
+    winners = rotate_entries(order & ((1 << FINISH_SHIFT) - 1), WINNER_BITS, 1, shift)
+    finish = rotate_entries(order >> FINISH_SHIFT, FINISH_TOKEN_BITS, len(TOKENS), shift)
+    return CompactGame(rotate_bits(tokens, shift, SEAT_TOKEN_BITS), rotate_bits(statuses, shift, SEAT_STATUS_BITS),
+                       rotated_flags, winners | (finish << FINISH_SHIFT), rotate_bits(ghosts, shift, SEAT_GHOST_BITS),
+                       state.get_rules())
+
+
+def canonical_key(state, to_move=None):
+    """
+    Returns the rotation-normalized key of a state and the shift that undoes it. With a Player to move, the state is
+    turned so that Player sits in seat "A"; without one, it is turned to the smallest of its 4 turnings. Two states that
+    are turnings of each other (with their Players to move in the same place) get the same key. The key is a tuple of
+    the seat to move ("A", or "" for nobody) and the 5 CompactGame fields, so it goes back to the exact state with
+    state_from_key() and the state's RuleSet.
+
+    :param state: CompactGame
+    :param to_move: str or None. "A", "B", "C", or "D" for the Player about to roll.
+    :return: tuple of (tuple, int). The key and the shift to give state_from_key().
+    """
+    if to_move is not None:
+        shift = -SEATS.index(to_move) % SEAT_COUNT
+        return ("A", *rotate_state(state, shift).get_fields()), -shift % SEAT_COUNT
+    best_fields, best_shift = state.get_fields(), 0
+    for shift in range(1, SEAT_COUNT):
+        fields = rotate_state(state, shift).get_fields()
+        if fields < best_fields:
+            best_fields, best_shift = fields, shift
+    return ("", *best_fields), -best_shift % SEAT_COUNT
+
+
+def state_from_key(key, shift=0, rules=None):
+    """
+    Turns a key from canonical_key() back into a state and the Player to move. With the shift canonical_key() returned,
+    that is the state it was given; with 0, it is the canonical state.
+
+    :param key: tuple. Key from canonical_key().
+    :param shift: int. Shift from canonical_key().
+    :param rules: RuleSet or None. The RuleSet of the state, CLASSIC_RULES if None.
+    :return: tuple of (CompactGame, str or None)
+    """
+    to_move = rotate_seat(key[0], shift) if key[0] else None
+    return rotate_state(CompactGame(*key[1:], rules), shift), to_move
+
+
+def game_key(game, to_move=None):
+    """
+    canonical_key() of the state of a LudoGame on the classic layout.
+
+    :param game: LudoGame
+    :param to_move: str or None. "A", "B", "C", or "D" for the Player about to roll.
+    :return: tuple of (tuple, int)
+    """
+    return canonical_key(CompactGame.from_game(game), to_move)
+
+
+def random_turns(rng, players_list, count):
+    """
+    Makes count turns of seeded rolls, the Players taking turns in order with a bonus roll after a 6.
+
+    :param rng: random.Random
+    :param players_list: list of str. Sorted list of "A", "B", "C", or "D" players.
+    :param count: int.
+    :return: list of tuples. Tuple is (player char, step count) for that turn.
+    """
+    turns = []
+    seat = 0
+    while len(turns) < count:
+        roll = rng.randint(1, 6)
+        turns.append((players_list[seat], roll))
+        if roll == 6 and len(turns) < count:
+            turns.append((players_list[seat], rng.randint(1, 6)))
+        seat = (seat + 1) % len(players_list)
+    return turns
+
+
+def expect(condition, message, shift):
+    """
+    Raises AssertionError if a check of check_rotations() failed. Unlike an assert statement, it still checks when
+    Python runs with -O.
+
+    :param condition: True/False. The result of the check.
+    :param message: str. What differs.
+    :param shift: int. The shift it differs at.
+    :return: None
+    """
+    if not condition:
+        raise AssertionError("{} at shift {}".format(message, shift))
+
+
+def check_rotations(num_games=200, seed=0, rules=None):
+    """
+    Plays random games and checks that turning a game by any number of seats doesn't change how it plays. For every
+    game, play_game() of the turned players and turns must give the turned positions, and the state after a random
+    number of turns, turned and loaded with CompactGame.to_game(), must play the rest of the turned turns to the turned
+    positions of the original. Also checks that canonical_key() gives every turning the same key and that
+    state_from_key() gives back the state. Raises AssertionError at the first difference, with or without python -O.
+
+    :param num_games: int.
+    :param seed: int. Seed for the random number generator.
+    :param rules: RuleSet or None. The house rules to play with, the README rules if None.
+    :return: dict. Games checked, states keyed, and how many different raw and canonical keys they had.
+    """
+    rng = random.Random(seed)
+    game = LudoGame(rules=rules)
+    other = LudoGame(rules=rules)
+    raw_keys = set()
+    canonical_keys = set()
+    states = 0
+    for _ in range(num_games):
+        players_list = sorted(rng.sample(SEATS, rng.randint(2, SEAT_COUNT)))
+        turns = random_turns(rng, players_list, rng.randint(20, 400))
+        cut = rng.randint(0, len(turns))
+        game.reset_game(players_list)
+        game.iter_play_game(players_list, turns[:cut])
+        middle = CompactGame.from_game(game)
+        game.iter_play_game(players_list, turns[cut:])
+        end = CompactGame.from_game(game)
+        expected = game.get_positions(players_list)
+        to_move = turns[cut][0] if cut < len(turns) else None
+        for shift in range(SEAT_COUNT):
+            rotated_players = sorted(rotate_seat(char, shift) for char in players_list)
+            other.play_game(list(rotated_players), rotate_turns(turns, shift))
+            expect(CompactGame.from_game(other) == rotate_state(end, shift), "play_game() differs", shift)
+            rotate_state(middle, shift).to_game(other)
+            other.iter_play_game(rotated_players, rotate_turns(turns[cut:], shift))
+            finished = CompactGame.from_game(other)
+            expect(finished == rotate_state(end, shift), "resumed game differs", shift)
+            # space names differ by seat, so the positions are compared after turning the game back
+            expect(rotate_state(finished, -shift).get_positions(players_list) == expected, "positions differ", shift)
+            rotated = rotate_state(middle, shift)
+            key, undo = canonical_key(rotated, rotate_seat(to_move, shift) if to_move else None)
+            expect(key == canonical_key(middle, to_move)[0], "canonical key differs", shift)
+            expect(state_from_key(key, undo, rules)[0] == rotated, "state_from_key() differs", shift)
+            raw_keys.add((to_move and rotate_seat(to_move, shift), rotated))
+            canonical_keys.add(key)
+            states += 1
+    return {"games": num_games, "states": states, "raw_keys": len(raw_keys), "canonical_keys": len(canonical_keys)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that seat rotations of random games play the same.")
+    parser.add_argument("--games", type=int, default=200, help="random games to check")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random number generator")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS) + ["all"],
+                        help="house rules to play with, or all to check every preset")
+    args = parser.parse_args(argv)
+
+    for name in sorted(RULE_SETS) if args.rules == "all" else [args.rules]:
+        result = check_rotations(args.games, args.seed, RULE_SETS[name])
+        print("{}: {:,} games, every turning plays the same".format(name, result["games"]))
+        print("{:,} states: {:,} different raw keys, {:,} canonical keys ({:.2f}x fewer)".format(
+            result["states"], result["raw_keys"], result["canonical_keys"],
+            result["raw_keys"] / result["canonical_keys"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Checkpoint and resume for long replay jobs. ReplayJob plays every game of a GameLog file and writes the
+# positions play_game() returns to a JSONL file, and every so many seconds it saves a checkpoint: the input cursor (game
+# and turn), how much of the output file is done, and the whole engine state of the game being played packed as a
+# CompactGame (Board occupancy, every Player's step counts, statuses, and flags, the winners, and the finish). A
+# checkpoint is written to a temporary file, synced, and renamed over the old one, so the file on disk is always a whole
+# checkpoint. Running the same job again picks up from the last checkpoint instead of from game one, turn 0.
+
+import argparse
+import collections
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+
+from LudoGame import LudoGame, RULE_SETS
+from LudoLog import GameLog, TURNS
+from LudoState import CompactGame
+
+MAGIC = b"LUDC"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")  # magic, version, number of CompactGame fields
+CURSOR = struct.Struct("<QQQQQ")  # game, turn, output offset, games in the log, size of the log
+FIELD_SIZE = struct.Struct("<H")  # bytes of one CompactGame field
+CHECKSUM = struct.Struct("<I")  # crc32 of everything before it
+CHECKPOINT_SECONDS = 10.0  # time between checkpoints, a synced save takes a few ms so this keeps them well under 1%
+CLOCK_TURNS = 4096  # turns between looks at the clock
+
+# One checkpoint. game and turn are where the replay picks up, output_offset is the size of the output file with every
+# game before it written, state is the CompactGame of the game being played (all 0 when turn is 0), and log_games and
+# log_size tell if the checkpoint belongs to the same input.
+Checkpoint = collections.namedtuple("Checkpoint", ["game", "turn", "output_offset", "state", "log_games", "log_size"])
+
+
+def pack_checkpoint(checkpoint):
+    """
+    Packs a Checkpoint into bytes: a header, the cursor, the CompactGame fields as little-endian ints of just the bytes
+    they need, and a checksum.
+
+    :param checkpoint: Checkpoint
+    :return: bytes
+    """
+    fields = checkpoint.state.get_fields()
+    parts = [HEADER.pack(MAGIC, VERSION, len(fields)),
+             CURSOR.pack(checkpoint.game, checkpoint.turn, checkpoint.output_offset, checkpoint.log_games,
+                         checkpoint.log_size)]
+    for field in fields:
+        field_bytes = field.to_bytes((field.bit_length() + 7) // 8, "little")
+        parts.append(FIELD_SIZE.pack(len(field_bytes)))
+        parts.append(field_bytes)
+    data = b"".join(parts)
+    return data + CHECKSUM.pack(zlib.crc32(data))
+
+
+def unpack_checkpoint(data, rules=None):
+    """
+    Unpacks the bytes from pack_checkpoint(). Raises ValueError if they aren't a whole checkpoint of this version.
+
+    :param data: bytes
+    :param rules: RuleSet or None. The RuleSet of the game the checkpoint was made from, CLASSIC_RULES if None.
+    :return: Checkpoint
+    """
+    if len(data) < HEADER.size + CURSOR.size + CHECKSUM.size:
+        raise ValueError("checkpoint is too short")
+    if CHECKSUM.unpack_from(data, len(data) - CHECKSUM.size)[0] != zlib.crc32(data[:-CHECKSUM.size]):
+        raise ValueError("checkpoint checksum doesn't match")
+    magic, version, field_count = HEADER.unpack_from(data, 0)
+    if (magic, version) != (MAGIC, VERSION):
+        raise ValueError("not a checkpoint of version {}".format(VERSION))
+    cursor = CURSOR.unpack_from(data, HEADER.size)
+    offset = HEADER.size + CURSOR.size
+    fields = []
+    for _ in range(field_count):
+        size = FIELD_SIZE.unpack_from(data, offset)[0]
+        offset += FIELD_SIZE.size
+        fields.append(int.from_bytes(data[offset:offset + size], "little"))
+        offset += size
+    if offset != len(data) - CHECKSUM.size:
+        raise ValueError("checkpoint has {} extra bytes".format(len(data) - CHECKSUM.size - offset))
+    game, turn, output_offset, log_games, log_size = cursor
+    return Checkpoint(game, turn, output_offset, CompactGame(*fields, rules), log_games, log_size)
+
+
+def write_checkpoint(path, checkpoint, sync=True):
+    """
+    Writes a checkpoint atomically: to path + ".tmp" first, synced to disk, then renamed over path, so a crash leaves
+    either the old checkpoint or the new one and never part of one.
+
+    :param path: str
+    :param checkpoint: Checkpoint
+    :param sync: True/False. Whether to wait for the disk, which is what makes the checkpoint survive a power loss.
+    :return: None
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as checkpoint_file:
+        checkpoint_file.write(pack_checkpoint(checkpoint))
+        if sync:
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+    os.replace(temp_path, path)
+    if sync and hasattr(os, "O_DIRECTORY"):  # the rename itself is only durable once the directory is synced
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def read_checkpoint(path, rules=None):
+    """
+    Reads a checkpoint, or returns None if there isn't one. Raises ValueError if the file isn't a whole checkpoint.
+
+    :param path: str
+    :param rules: RuleSet or None. The RuleSet of the game the checkpoint was made from, CLASSIC_RULES if None.
+    :return: Checkpoint or None
+    """
+    try:
+        with open(path, "rb") as checkpoint_file:
+            data = checkpoint_file.read()
+    except FileNotFoundError:
+        return None
+    return unpack_checkpoint(data, rules)
+
+
+class ReplayJob:
+    """
+    Replays every game of a GameLog file into a JSONL file of {"game": number, "positions": [...]} lines, saving a
+    checkpoint every checkpoint_seconds seconds (the clock is read every CLOCK_TURNS turns) and after the last game.
+    run() resumes from the checkpoint if there is one: the output file is cut back to what the checkpoint covers and the
+    game in progress is loaded from its CompactGame, so the output is the same as a run that never stopped. A checkpoint
+    made for a different log raises ValueError. The games are played with rules, CLASSIC_RULES if None; the checkpoint
+    doesn't hold the RuleSet, so a run has to be resumed with the rules it started with.
+    """
+    def __init__(self, log_path, output_path, checkpoint_path, checkpoint_seconds=CHECKPOINT_SECONDS, sync=True,
+                 rules=None):
+        self._log_path = log_path
+        self._output_path = output_path
+        self._checkpoint_path = checkpoint_path
+        self._interval = checkpoint_seconds
+        self._sync = sync
+        self._game = LudoGame(rules=rules)
+        self._checkpoints = 0
+        self._checkpoint_seconds = 0.0
+        self._turns = 0
+
+    def get_checkpoint_count(self):
+        """
+        Returns how many checkpoints run() has saved.
+
+        :return: int
+        """
+        return self._checkpoints
+
+    def get_checkpoint_seconds(self):
+        """
+        Returns the time run() spent saving checkpoints, output syncs included.
+
+        :return: float
+        """
+        return self._checkpoint_seconds
+
+    def get_turn_count(self):
+        """
+        Returns how many turns run() has replayed, not counting the ones done before a resume.
+
+        :return: int
+        """
+        return self._turns
+
+    def save(self, output_file, checkpoint):
+        """
+        Makes sure the output file has everything the checkpoint says it has, then writes the checkpoint.
+
+        :param output_file: file object. The open output file.
+        :param checkpoint: Checkpoint
+        :return: None
+        """
+        start = time.perf_counter()
+        output_file.flush()
+        if self._sync:
+            os.fsync(output_file.fileno())
+        write_checkpoint(self._checkpoint_path, checkpoint, self._sync)
+        self._checkpoints += 1
+        self._checkpoint_seconds += time.perf_counter() - start
+
+    def run(self, max_turns=None):
+        """
+        Replays from the last checkpoint, or from the start, to the end of the log.
+
+        :param max_turns: int or None. Stops at a checkpoint after about this many turns instead of at the end.
+        :return: True/False. True if every game of the log is done.
+        """
+        log = GameLog(self._log_path)
+        log_games = len(log)
+        log_size = os.path.getsize(self._log_path)
+        checkpoint = read_checkpoint(self._checkpoint_path, self._game.get_rules())
+        if checkpoint is None:
+            checkpoint = Checkpoint(0, 0, 0, CompactGame(), log_games, log_size)
+        elif (checkpoint.log_games, checkpoint.log_size) != (log_games, log_size):
+            log.close()
+            raise ValueError("checkpoint {} is for another log".format(self._checkpoint_path))
+        output_file = open(self._output_path, "r+b" if os.path.exists(self._output_path) else "wb")
+        try:
+            output_file.truncate(checkpoint.output_offset)  # drops games written after the checkpoint
+            output_file.seek(checkpoint.output_offset)
+            return self.replay(log, output_file, checkpoint, max_turns)
+        finally:
+            output_file.close()
+            log.close()
+
+    def replay(self, log, output_file, checkpoint, max_turns):
+        """
+        The loop of run(): plays the turns of every game from the checkpoint on, the same way LudoGame.play_game() does,
+        writing each game's positions when it's done and saving checkpoints along the way.
+
+        :param log: GameLog
+        :param output_file: file object. Output file, positioned at the checkpoint's offset.
+        :param checkpoint: Checkpoint. Where to pick up.
+        :param max_turns: int or None. Stops at a checkpoint after about this many turns.
+        :return: True/False. True if every game of the log is done.
+        """
+        game = self._game
+        winners = game.get_winners()
+        play_turn = game.play_turn
+        since_checkpoint = 0  # turns played since the last checkpoint
+        countdown = CLOCK_TURNS
+        due = time.perf_counter() + self._interval
+        turns_left = max_turns if max_turns is not None else float("inf")
+        turn = checkpoint.turn
+        for number in range(checkpoint.game, len(log)):
+            players_list = log.get_players(number)
+            if turn:
+                checkpoint.state.to_game(game)
+            else:
+                game.reset_game(players_list)
+            last_winner = len(players_list) - 1
+            turns_view = log.get_turns(number)
+            try:
+                for turn_byte in turns_view[turn:]:
+                    if len(winners) == last_winner:  # every Player but 1 finishes
+                        break
+                    play_turn(*TURNS[turn_byte])
+                    turn += 1
+                    countdown -= 1
+                    if countdown:
+                        continue
+                    countdown = CLOCK_TURNS
+                    since_checkpoint += CLOCK_TURNS
+                    if since_checkpoint >= turns_left or time.perf_counter() >= due:
+                        self.save(output_file, Checkpoint(number, turn, output_file.tell(),
+                                                          CompactGame.from_game(game), len(log), checkpoint.log_size))
+                        self._turns += since_checkpoint
+                        turns_left -= since_checkpoint
+                        if turns_left <= 0:
+                            return False
+                        since_checkpoint = 0
+                        due = time.perf_counter() + self._interval
+            finally:
+                turns_view.release()
+            line = json.dumps({"game": number, "positions": game.get_positions(players_list)}) + "\n"
+            output_file.write(line.encode())
+            turn = 0
+        self._turns += since_checkpoint + CLOCK_TURNS - countdown
+        self.save(output_file, Checkpoint(len(log), 0, output_file.tell(), CompactGame(), len(log),
+                                          checkpoint.log_size))
+        return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a game log with checkpoints, resuming if one exists.")
+    parser.add_argument("log", help="game log file (see LudoLog.py) to replay")
+    parser.add_argument("--output", required=True, help="JSONL file for the positions of every game")
+    parser.add_argument("--checkpoint", help="checkpoint file, OUTPUT.ckpt by default")
+    parser.add_argument("--every", type=float, default=CHECKPOINT_SECONDS, help="seconds between checkpoints")
+    parser.add_argument("--max-turns", type=int, help="stop at a checkpoint after about this many turns")
+    parser.add_argument("--no-sync", action="store_true", help="don't wait for the disk when saving")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS),
+                        help="house rules the games were played with, the same on every resume")
+    args = parser.parse_args(argv)
+
+    job = ReplayJob(args.log, args.output, args.checkpoint or args.output + ".ckpt", args.every, not args.no_sync,
+                    RULE_SETS[args.rules])
+    start = time.perf_counter()
+    done = job.run(args.max_turns)
+    elapsed = time.perf_counter() - start
+    print("{}: {:,} turns in {:.2f} s, {:,} checkpoints took {:.3f} s ({:.2%} of the run)".format(
+        "done" if done else "stopped", job.get_turn_count(), elapsed, job.get_checkpoint_count(),
+        job.get_checkpoint_seconds(), job.get_checkpoint_seconds() / elapsed if elapsed else 0.0))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: An endgame tablebase for 2 Player races. Once every token left of both Players is in its own home row
+# ("A1" - "A6", etc.) no token can be kicked any more, so the game is a race that can be solved exactly. The generator
+# finds every move with LudoGame itself (bounces past 57 included), solves the win probability of the Player to move by
+# retrograde value iteration, since bounces make the race loop back on itself, and writes the probabilities and best
+# tokens to a binary file. EndgameTable reads that file through mmap, one entry per lookup.
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+
+from LudoGame import LudoGame, PriorityPolicy
+
+FIRST_STEP = 51  # step count of the first home row space
+END_STEP = 57  # step count of "E"
+STEP_COUNT = END_STEP - FIRST_STEP + 1  # step counts a token can have in the endgame
+SEAT_STATES = STEP_COUNT * STEP_COUNT * 2  # (p, q, doubled) of one Player
+ENTRY_COUNT = SEAT_STATES * SEAT_STATES * 2  # (Player to move, opponent, bonus roll)
+MAGIC = b"LUDE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")  # magic, version, seat states, entries
+ENTRY = struct.Struct("<HH")  # win probability * PROBABILITY_SCALE, best token bits for rolls 1 - 6
+PROBABILITY_SCALE = 65535
+NO_CHOICE = 0  # best token bits: nothing to choose for this roll
+CHOOSE_P = 1
+CHOOSE_Q = 2
+TOLERANCE = 1e-12  # value iteration stops when no probability changes by more than this
+DEFAULT_PATH = "ludo_endgame.bin"
+
+
+def seat_state(p_steps, q_steps, doubled):
+    """
+    Returns the index of one Player's endgame state, or None if a token is outside the home row and the end.
+
+    :param p_steps: int. Step count of token p.
+    :param q_steps: int. Step count of token q.
+    :param doubled: True/False
+    :return: int or None
+    """
+    if not (FIRST_STEP <= p_steps <= END_STEP and FIRST_STEP <= q_steps <= END_STEP):
+        return None
+    return ((p_steps - FIRST_STEP) * STEP_COUNT + q_steps - FIRST_STEP) * 2 + (1 if doubled else 0)
+
+
+def seat_state_steps(state):
+    """
+    Returns the (p steps, q steps, doubled) of a seat_state() index.
+
+    :param state: int
+    :return: tuple of (int, int, True/False)
+    """
+    tokens, doubled = divmod(state, 2)
+    p_index, q_index = divmod(tokens, STEP_COUNT)
+    return p_index + FIRST_STEP, q_index + FIRST_STEP, doubled == 1
+
+
+def is_done(state):
+    """
+    Returns True if both tokens of the seat state are finished.
+
+    :param state: int
+    :return: True/False
+    """
+    p_steps, q_steps, _ = seat_state_steps(state)
+    return p_steps == END_STEP and q_steps == END_STEP
+
+
+def entry_index(state, other_state, bonus):
+    """
+    Returns the index of a table entry.
+
+    :param state: int. Seat state of the Player to move.
+    :param other_state: int. Seat state of the opponent.
+    :param bonus: True/False. True if the Player to move is taking the extra roll after a 6.
+    :return: int
+    """
+    return (state * SEAT_STATES + other_state) * 2 + (1 if bonus else 0)
+
+
+def place_seat(game, player, p_steps, q_steps, doubled):
+    """
+    Puts a Player's tokens on the given step counts of a game that was just reset with the Player in play.
+
+    :param game: LudoGame
+    :param player: Player
+    :param p_steps: int
+    :param q_steps: int
+    :param doubled: True/False
+    :return: None
+    """
+    board = game.get_board()
+    char = player.get_player_pos()
+    for token, steps, set_steps, set_status in (("p", p_steps, player.set_token_p_step_count, player.set_p_status),
+                                                ("q", q_steps, player.set_token_q_step_count, player.set_q_status)):
+        set_steps(steps)
+        if steps == END_STEP:
+            set_status("FINISHED")
+            board.set_finish_tokens(char.lower() + "_" + token)
+        else:
+            set_status("ON BOARD")
+            board.add_token(player.get_space_name(steps), char.lower() + "_" + token)
+    if doubled:
+        player.set_doubled()
+
+
+def seat_moves(game=None):
+    """
+    Finds every move of one Player's endgame by playing it on a LudoGame: for every seat state and roll, the list of
+    (token, next seat state) the Player can choose from. token is None for a doubled Player, who has no choice. Every
+    seat state can happen, since a token that bounces back onto its own space doubles the Player in the turns
+    LudoGame.doubles_up() allows, like play_turn() does, and a doubled Player's tokens then move together from different
+    spaces.
+
+    :param game: LudoGame or None. Reset and used to play the moves.
+    :return: dict with (int, int) as keys and list of tuples as values
+    """
+    game = game if game is not None else LudoGame()
+    moves = {}
+    for state in range(SEAT_STATES):
+        if is_done(state):
+            continue
+        for roll in range(1, 7):
+            options = []
+            game.reset_game(["A"])
+            player = game.get_player_by_position("A")
+            place_seat(game, player, *seat_state_steps(state))
+            if player.get_doubled():
+                tokens = [None]
+                double = False
+            else:
+                legal = game.legal_moves(player, roll)
+                tokens = [move.token for move in legal]
+                double = game.doubles_up(player, roll, legal)
+            game.start_undo_log()
+            for token in tokens:
+                if token is None:
+                    game.play_turn("A", roll)
+                else:
+                    move = game.get_token_move(player, token, roll)
+                    if game.apply_move(player, move) == "DOUBLE" and double:
+                        game.stack_up(player, move)
+                options.append((token, seat_state(player.get_token_p_step_count(), player.get_token_q_step_count(),
+                                                  player.get_doubled())))
+                game.undo()
+            game.stop_undo_log()
+            moves[state, roll] = options
+    return moves
+
+
+def solve(moves=None, tolerance=TOLERANCE):
+    """
+    Works out the win probability of the Player to move in every endgame, and its best token for every roll, by value
+    iteration: sweeps over every entry until no probability changes by more than tolerance. A 6 that isn't a bonus roll
+    earns the Player a bonus roll, and whoever finishes both tokens first wins.
+
+    :param moves: dict or None. From seat_moves(), found again if None.
+    :param tolerance: float
+    :return: tuple of (list of float, list of int, int). Probabilities and best token bits by entry_index(), and the
+        number of sweeps.
+    """
+    moves = moves if moves is not None else seat_moves()
+    values = [0.0] * ENTRY_COUNT
+    choices = [0] * ENTRY_COUNT
+    states = [state for state in range(SEAT_STATES) if not is_done(state)]
+    for state in range(SEAT_STATES):  # a finished Player has already won
+        if is_done(state):
+            for other_state in range(SEAT_STATES):
+                values[entry_index(state, other_state, False)] = 1.0
+                values[entry_index(state, other_state, True)] = 1.0
+    # states closest to the end first, so each sweep starts from the values most likely to be final
+    states.sort(key=lambda state: -sum(seat_state_steps(state)[:2]))
+    sweeps = 0
+    while True:
+        sweeps += 1
+        largest_change = 0.0
+        for state in states:
+            for other_state in states:
+                for bonus in (False, True):
+                    total = 0.0
+                    bits = 0
+                    for roll in range(1, 7):
+                        best_value = -1.0
+                        best_token = None
+                        for token, next_state in moves[state, roll]:
+                            if is_done(next_state):
+                                value = 1.0
+                            elif roll == 6 and not bonus:
+                                value = values[entry_index(next_state, other_state, True)]
+                            else:
+                                value = 1.0 - values[entry_index(other_state, next_state, False)]
+                            if value > best_value:
+                                best_value, best_token = value, token
+                        total += best_value
+                        if len(moves[state, roll]) > 1:
+                            bits |= (CHOOSE_P if best_token == "p" else CHOOSE_Q) << (2 * (roll - 1))
+                    index = entry_index(state, other_state, bonus)
+                    value = total / 6
+                    largest_change = max(largest_change, abs(value - values[index]))
+                    values[index] = value
+                    choices[index] = bits
+        if largest_change <= tolerance:
+            return values, choices, sweeps
+
+
+def write_table(path, values, choices):
+    """
+    Writes the solved table to a binary file: a header followed by one ENTRY per entry_index().
+
+    :param path: str
+    :param values: list of float
+    :param choices: list of int
+    :return: int. Bytes written.
+    """
+    data = bytearray(HEADER.size + ENTRY.size * ENTRY_COUNT)
+    HEADER.pack_into(data, 0, MAGIC, VERSION, SEAT_STATES, ENTRY_COUNT)
+    for index in range(ENTRY_COUNT):
+        ENTRY.pack_into(data, HEADER.size + index * ENTRY.size, round(values[index] * PROBABILITY_SCALE),
+                        choices[index])
+    with open(path, "wb") as table_file:
+        table_file.write(data)
+    return len(data)
+
+
+def build_table(path=DEFAULT_PATH):
+    """
+    Finds the moves, solves the table, and writes it to path.
+
+    :param path: str
+    :return: dict. Bytes written, sweeps taken, and seconds spent.
+    """
+    start = time.perf_counter()
+    values, choices, sweeps = solve(seat_moves())
+    size = write_table(path, values, choices)
+    return {"bytes": size, "sweeps": sweeps, "seconds": time.perf_counter() - start}
+
+
+class EndgameTable:
+    """
+    A table file written by build_table(), read through mmap so only the pages that are looked up are loaded. Raises
+    ValueError if the file isn't an endgame table of this version.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as table_file:
+            self._map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError("not an endgame table: {}".format(path))
+        magic, version, seat_states, entry_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or seat_states != SEAT_STATES or entry_count != ENTRY_COUNT or \
+                len(self._map) != HEADER.size + ENTRY.size * entry_count:
+            self._map.close()
+            raise ValueError("not an endgame table of version {}: {}".format(VERSION, path))
+
+    def close(self):
+        """
+        Unmaps the file.
+
+        :return: None
+        """
+        self._map.close()
+
+    def lookup(self, state, other_state, bonus=False):
+        """
+        Returns the win probability of the Player to move and its best token bits for every roll.
+
+        :param state: int. Seat state of the Player to move.
+        :param other_state: int. Seat state of the opponent.
+        :param bonus: True/False. True if the Player to move is taking the extra roll after a 6.
+        :return: tuple of (float, int)
+        """
+        offset = HEADER.size + entry_index(state, other_state, bonus) * ENTRY.size
+        probability, bits = ENTRY.unpack_from(self._map, offset)
+        return probability / PROBABILITY_SCALE, bits
+
+    def get_states(self, game, player_char):
+        """
+        Returns the seat states of the Player and its opponent if the game is a 2 Player endgame the table covers.
+
+        :param game: LudoGame
+        :param player_char: str. "A", "B", "C", or "D".
+        :return: tuple of (int, int) or None
+        """
+        players = [player for player in game.get_players().values() if player.get_in_play()]
+        if len(players) != 2:
+            return None
+        states = {}
+        for player in players:
+            state = seat_state(player.get_token_p_step_count(), player.get_token_q_step_count(), player.get_doubled())
+            if state is None:
+                return None
+            states[player.get_player_pos()] = state
+        player_char = player_char.upper()
+        if player_char not in states:
+            return None
+        other_char = [char for char in states if char != player_char][0]
+        return states[player_char], states[other_char]
+
+    def get_win_probability(self, game, player_char, bonus=False):
+        """
+        Returns the probability that the Player wins if it is about to roll, or None if the table doesn't cover the
+        game.
+
+        :param game: LudoGame
+        :param player_char: str. "A", "B", "C", or "D".
+        :param bonus: True/False. True if the Player is about to take the extra roll after a 6.
+        :return: float or None
+        """
+        states = self.get_states(game, player_char)
+        if states is None:
+            return None
+        return self.lookup(states[0], states[1], bonus)[0]
+
+    def best_token(self, game, player_char, roll, bonus=False):
+        """
+        Returns the token the Player should move with this roll: "p", "q", or None if the table doesn't cover the game
+        or there is nothing to choose.
+
+        :param game: LudoGame
+        :param player_char: str. "A", "B", "C", or "D".
+        :param roll: int
+        :param bonus: True/False. True if roll is the extra roll after a 6.
+        :return: str or None
+        """
+        states = self.get_states(game, player_char)
+        if states is None:
+            return None
+        choice = (self.lookup(states[0], states[1], bonus)[1] >> (2 * (roll - 1))) & 3
+        if choice == CHOOSE_P:
+            return "p"
+        if choice == CHOOSE_Q:
+            return "q"
+        return None
+
+
+class EndgamePolicy:
+    """
+    A policy for LudoGame.set_policy() that plays the table's best token in a 2 Player endgame and leaves every other
+    position to a fallback policy. Every roll is looked up as a normal roll, like SearchPolicy does.
+    """
+    def __init__(self, table, fallback=None):
+        self._table = table
+        self._fallback = fallback if fallback is not None else PriorityPolicy()
+
+    def choose_move(self, game, player, steps, moves):
+        """
+        Picks one of the moves the Player can make with this roll, see PriorityPolicy.choose_move().
+
+        :param game: LudoGame
+        :param player: Player
+        :param steps: int
+        :param moves: list of TokenMove
+        :return: TokenMove or None
+        """
+        if len(moves) > 1:
+            token = self._table.best_token(game, player.get_player_pos(), steps)
+            for move in moves:
+                if move.token == token:
+                    return move
+        return self._fallback.choose_move(game, player, steps, moves)
+
+
+def compare_priority(table, moves=None):
+    """
+    Counts the endgame decisions where PriorityPolicy picks a different token than the table, and the win probability
+    it gives up on average in those decisions.
+
+    :param table: EndgameTable
+    :param moves: dict or None. From seat_moves(), found again if None.
+    :return: dict
+    """
+    moves = moves if moves is not None else seat_moves()
+    game = LudoGame()
+    policy = PriorityPolicy()
+    decisions = 0
+    different = 0
+    lost = 0.0
+    for (state, roll), options in moves.items():
+        if len(options) < 2:
+            continue
+        game.reset_game(["A", "C"])
+        player = game.get_player_by_position("A")
+        place_seat(game, player, *seat_state_steps(state))
+        place_seat(game, game.get_player_by_position("C"), END_STEP - 1, END_STEP - 1, True)
+        picked = policy.choose_move(game, player, roll, game.legal_moves(player, roll)).token
+        for other_state in range(SEAT_STATES):
+            if is_done(other_state):
+                continue
+            decisions += 1
+            best = (table.lookup(state, other_state)[1] >> (2 * (roll - 1))) & 3
+            if (best == CHOOSE_P) != (picked == "p"):
+                different += 1
+                values = {}
+                for token, next_state in options:
+                    if is_done(next_state):
+                        values[token] = 1.0
+                    elif roll == 6:
+                        values[token] = table.lookup(next_state, other_state, True)[0]
+                    else:
+                        values[token] = 1.0 - table.lookup(other_state, next_state)[0]
+                lost += max(values.values()) - values[picked]
+    return {"decisions": decisions, "different": different, "mean_lost": lost / different if different else 0.0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and check the 2 Player endgame tablebase.")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="table file")
+    parser.add_argument("--build", action="store_true", help="solve the table and write it to the file")
+    args = parser.parse_args(argv)
+
+    if args.build:
+        stats = build_table(args.path)
+        print("wrote {:,} bytes in {:.1f} s ({} sweeps)".format(stats["bytes"], stats["seconds"], stats["sweeps"]))
+    table = EndgameTable(args.path)
+    count = 100000
+    start = time.perf_counter()
+    for index in range(count):
+        table.lookup(index % SEAT_STATES, (index * 7) % SEAT_STATES, index % 2 == 0)
+    print("lookups/second: {:,.0f}".format(count / (time.perf_counter() - start)))
+    comparison = compare_priority(table)
+    print("PriorityPolicy differs in {:,} of {:,} endgame decisions, giving up {:.2%} win probability each".format(
+        comparison["different"], comparison["decisions"], comparison["mean_lost"]))
+    table.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
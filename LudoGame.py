@@ -4,7 +4,13 @@
 # Description: A fully coded LudoGame file with multiple Exception classes to help with exception handling. There's a
 # Board class that is a data structure representation of the board state and locations of each Player's tokens. There's
 # a Player class to contain the token information and methods to access that information. There's a LudoGame class that
-# controls which Players are playing, which Board object is used, and how to execute turns from the turns list.
+# controls which Players are playing, which Board object is used, and how to execute turns from the turns list. A
+# BoardLayout sets the seats, the number of tokens per Player, and the size of the board, the README's board by default,
+# and a RuleSet sets the house rules, the README's rules by default.
+
+import collections
+import itertools
+
 
 class InvalidPositionError(Exception):
     """
@@ -22,31 +28,434 @@ class InvalidTokenError(Exception):
     pass
 
 
+# Size of the classic board of the README: 56 shared track spaces and a home row of 6 spaces for each Player.
+TRACK_LENGTH = 56
+HOME_LENGTH = 6
+MAX_ROLL = 6
+TOKEN_LETTERS = "pqrstuvwxyz"  # names of a Player's tokens in order, "p" and "q" for the 2 tokens of the README
+TOKEN_INDEX = {letter: index for index, letter in enumerate(TOKEN_LETTERS)}  # place of each token in a Player's lists
+MIN_STEPS = -1  # step count of a token in Home, the lowest the lookup tables cover
+
+
+def compute_space_name(player_pos, start, total_steps, track_length=TRACK_LENGTH, home_length=HOME_LENGTH):
+    """
+    Calculates the space name for a step count of a player the long way. Player.get_space_name() uses the lookup
+    tables built from this function and only calls it for step counts outside of the tables. A token goes
+    track_length - home_length steps on the shared track from its start space, then home_length steps up its home row,
+    and finishes on step track_length + 1.
+
+    :param player_pos: str. The seat of the player, like "A".
+    :param start: int. Starting position of the player.
+    :param total_steps: int
+    :param track_length: int. Number of shared track spaces.
+    :param home_length: int. Number of spaces in each home row.
+    :return: str or int. Negative int for the steps to go back on when total_steps is past the finish.
+    """
+    finish_steps = track_length + 1
+    if total_steps == -1:  # when the piece is still in Home
+        return "H"
+    if total_steps == 0:  # when the piece is on the ready space
+        return "R"
+    if total_steps == finish_steps:  # when the piece hits the finish line
+        return "E"
+    if total_steps > finish_steps:  # when the piece goes past the finish line
+        return finish_steps - total_steps
+    if total_steps > track_length - home_length:  # if the piece is on the home row
+        return player_pos + str(total_steps - track_length + home_length)
+    return str((start + total_steps - 2) % track_length + 1)  # if the piece is on the shared board spaces
+
+
+class BoardLayout:
+    """
+    The shape of the board: the seats at the table, how many tokens each Player has, how many spaces the shared track
+    has, and how long each home row is. Seats get equal stretches of the track, the first one starting on space "1", and
+    a seat's home row is named after it ("A1" - "A6" for "A"). Everything Board and Player look up, like the space
+    indexes and the space name tables of every seat, is built once here and shared by all the games using the layout.
+    CLASSIC_LAYOUT is the 4 seat, 2 token board of the README and the default everywhere.
+    """
+    def __init__(self, seats="ABCD", token_count=2, track_length=TRACK_LENGTH, home_length=HOME_LENGTH):
+        if not seats or len(set(seats)) != len(seats) or not all("A" <= char <= "Z" for char in seats):
+            raise ValueError("seats must be different letters from A to Z: {!r}".format(seats))
+        if not 2 <= token_count <= len(TOKEN_LETTERS):
+            raise ValueError("token_count must be from 2 to {}: {!r}".format(len(TOKEN_LETTERS), token_count))
+        if track_length % len(seats) != 0 or not 0 < home_length < track_length:
+            raise ValueError("track_length must split evenly between the seats and be longer than home_length")
+        self._seats = seats
+        self._token_count = token_count
+        self._track_length = track_length
+        self._home_length = home_length
+        self._token_letters = tuple(TOKEN_LETTERS[:token_count])
+        self._finish_steps = track_length + 1
+        self._max_steps = self._finish_steps + MAX_ROLL  # a finished token rolling the highest roll
+        self._board_spaces = tuple([str(space) for space in range(1, track_length + 1)] +
+                                   [char + str(num) for char in seats for num in range(1, home_length + 1)])
+        self._space_index = {space: index for index, space in enumerate(self._board_spaces)}
+        self._space_names = self._board_spaces + ("H", "R", "E")  # Home, ready, and finished come after the board
+        self._start_spaces = {}
+        self._end_spaces = {}
+        self._space_tables = {}
+        self._token_names = {}
+        for seat_index, char in enumerate(seats):
+            start = 1 + seat_index * (track_length // len(seats))
+            self._start_spaces[char] = start
+            self._end_spaces[char] = (start + track_length - home_length - 2) % track_length + 1
+            self._space_tables[char] = self.build_space_tables(char)
+            self._token_names[char] = tuple(char.lower() + "_" + letter for letter in self._token_letters)
+
+    def __eq__(self, other):
+        return isinstance(other, BoardLayout) and self.get_shape() == other.get_shape()
+
+    def __hash__(self):
+        return hash(self.get_shape())
+
+    def __reduce__(self):  # pickled as its shape, the tables are rebuilt on the other side
+        return BoardLayout, self.get_shape()
+
+    def __repr__(self):
+        return "BoardLayout{!r}".format(self.get_shape())
+
+    def build_space_tables(self, player_pos):
+        """
+        Builds the lookup tables of one seat for every step count from MIN_STEPS to get_max_steps(). Space names are
+        the same str objects as in get_space_names() so they are shared and compare fast. Space indexes for step counts
+        past the finish are the index of the space the token bounces back to.
+
+        :param player_pos: str. One of get_seats().
+        :return: tuple of (tuple of str or int, tuple of int). Both are indexed by step count - MIN_STEPS.
+        """
+        start = self._start_spaces[player_pos]
+        names = []
+        indexes = []
+        for total_steps in range(MIN_STEPS, self._max_steps + 1):
+            name = compute_space_name(player_pos, start, total_steps, self._track_length, self._home_length)
+            if isinstance(name, int):  # bounce back, look up where the token lands
+                landing = compute_space_name(player_pos, start, self._finish_steps + name, self._track_length,
+                                             self._home_length)
+                names.append(name)
+                indexes.append(self._space_names.index(landing))
+            else:
+                names.append(self._space_names[self._space_names.index(name)])
+                indexes.append(self._space_names.index(name))
+        return tuple(names), tuple(indexes)
+
+    def get_shape(self):
+        """
+        Returns the 4 values the layout was made from, in the order BoardLayout() takes them.
+
+        :return: tuple of (str, int, int, int)
+        """
+        return self._seats, self._token_count, self._track_length, self._home_length
+
+    def get_seats(self):
+        """
+        Returns the seats at the table in order, like "ABCD".
+
+        :return: str
+        """
+        return self._seats
+
+    def get_token_count(self):
+        """
+        Returns how many tokens each Player has.
+
+        :return: int
+        """
+        return self._token_count
+
+    def get_token_letters(self):
+        """
+        Returns the names of a Player's tokens in order, ("p", "q") for 2 tokens.
+
+        :return: tuple of str
+        """
+        return self._token_letters
+
+    def get_track_length(self):
+        """
+        Returns the number of shared track spaces.
+
+        :return: int
+        """
+        return self._track_length
+
+    def get_home_length(self):
+        """
+        Returns the number of spaces in each home row.
+
+        :return: int
+        """
+        return self._home_length
+
+    def get_finish_steps(self):
+        """
+        Returns the step count of a finished token, track_length + 1.
+
+        :return: int
+        """
+        return self._finish_steps
+
+    def get_max_steps(self):
+        """
+        Returns the highest step count the space name tables cover.
+
+        :return: int
+        """
+        return self._max_steps
+
+    def get_board_spaces(self):
+        """
+        Returns every space a token can stand on: the track spaces from "1", then the home rows seat by seat.
+
+        :return: tuple of str
+        """
+        return self._board_spaces
+
+    def get_space_index(self):
+        """
+        Returns the dictionary of the index of every board space in get_board_spaces().
+
+        :return: dict with str as keys and int as values
+        """
+        return self._space_index
+
+    def get_space_names(self):
+        """
+        Returns get_board_spaces() followed by "H", "R", and "E", the names Player.space_index() indexes into.
+
+        :return: tuple of str
+        """
+        return self._space_names
+
+    def get_start(self, player_pos):
+        """
+        Returns the track space a seat's tokens start on, as an int.
+
+        :param player_pos: str. One of get_seats().
+        :return: int
+        """
+        return self._start_spaces[player_pos]
+
+    def get_end(self, player_pos):
+        """
+        Returns the last track space a seat's tokens go on before turning into the home row, as an int.
+
+        :param player_pos: str. One of get_seats().
+        :return: int
+        """
+        return self._end_spaces[player_pos]
+
+    def get_space_tables(self, player_pos):
+        """
+        Returns the tables build_space_tables() made for a seat.
+
+        :param player_pos: str. One of get_seats().
+        :return: tuple of (tuple of str or int, tuple of int)
+        """
+        return self._space_tables[player_pos]
+
+    def get_token_names(self, player_pos):
+        """
+        Returns the board names of a seat's tokens in order, ("a_p", "a_q") for seat "A" with 2 tokens.
+
+        :param player_pos: str. One of get_seats().
+        :return: tuple of str
+        """
+        return self._token_names[player_pos]
+
+
+CLASSIC_LAYOUT = BoardLayout()
+LAYOUTS = {
+    "classic": CLASSIC_LAYOUT,
+    "four-token": BoardLayout("ABCD", 4),
+    "six-seat": BoardLayout("ABCDEF", 2, 84),
+}
+
+# The classic layout's tables under their own names, for code written for the 4 seat, 2 token board. Track spaces
+# "1" - "56" come first in BOARD_SPACES, then the home rows "A1" - "A6", "B1" - "B6", "C1" - "C6", "D1" - "D6".
+BOARD_SPACES = CLASSIC_LAYOUT.get_board_spaces()
+SPACE_INDEX = CLASSIC_LAYOUT.get_space_index()
+
+# Special space indexes for the spots that aren't board spaces, numbered right after the 80 board spaces.
+HOME_SPACE = len(BOARD_SPACES)
+READY_SPACE = HOME_SPACE + 1
+END_SPACE = HOME_SPACE + 2
+SPACE_NAMES = CLASSIC_LAYOUT.get_space_names()
+
+# Starting and ending spaces of each player position, as ints for step count calculations.
+START_SPACES = {char: CLASSIC_LAYOUT.get_start(char) for char in "ABCD"}
+END_SPACES = {char: CLASSIC_LAYOUT.get_end(char) for char in "ABCD"}
+
+# Step counts covered by the lookup tables: -1 for Home up to a finished token (57) rolling a 6.
+MAX_STEPS = CLASSIC_LAYOUT.get_max_steps()
+
+SPACE_TABLES = {char: CLASSIC_LAYOUT.get_space_tables(char) for char in "ABCD"}
+TOKEN_NAMES = {char: CLASSIC_LAYOUT.get_token_names(char) for char in "ABCD"}  # board names of "P" and "Q"
+
+# A move one token can make with a roll, found by LudoGame.legal_moves() without changing the board. token is "p",
+# "q", or a later letter of TOKEN_LETTERS, start_space and end_space are space names, kicked is the tuple of opponent
+# token names the move sends back to Home, stacked is True if the token lands on a friendly token, bounced is True if it
+# went past "E" and bounced back, and finished is True if it lands on "E".
+TokenMove = collections.namedtuple("TokenMove", ["token", "start_steps", "end_steps", "start_space", "end_space",
+                                                 "kicked", "stacked", "bounced", "finished"])
+
+
+class RuleSet:
+    """
+    The house rules a game is played with. bounce is whether a token that rolls past "E" bounces back (otherwise it
+    can't move), stacking is whether a token landing on a friendly token doubles the Player up (otherwise the two just
+    share the space), safe_steps are the step counts from a seat's ready position of the track spaces where a token
+    can't be kicked, so a move that would land on an opponent there can't be made (1 is every seat's start space), and
+    three_sixes is whether a Player's third 6 in a row is forfeited. LudoGame turns a RuleSet into its own tables and
+    turn function once when it is made, so no turn checks a rule that isn't in play. CLASSIC_RULES are the README rules
+    and the default everywhere.
+    """
+    def __init__(self, bounce=True, stacking=True, safe_steps=(), three_sixes=False):
+        if not all(isinstance(steps, int) and steps > 0 for steps in safe_steps):
+            raise ValueError("safe_steps must be step counts of track spaces: {!r}".format(safe_steps))
+        self._bounce = bool(bounce)
+        self._stacking = bool(stacking)
+        self._safe_steps = tuple(sorted(set(safe_steps)))
+        self._three_sixes = bool(three_sixes)
+
+    def __eq__(self, other):
+        return isinstance(other, RuleSet) and self.get_options() == other.get_options()
+
+    def __hash__(self):
+        return hash(self.get_options())
+
+    def __repr__(self):
+        return "RuleSet{!r}".format(self.get_options())
+
+    def get_options(self):
+        """
+        Returns the arguments the RuleSet was made with: (bounce, stacking, safe_steps, three_sixes).
+
+        :return: tuple
+        """
+        return self._bounce, self._stacking, self._safe_steps, self._three_sixes
+
+    def get_bounce(self):
+        """
+        Returns True if a token that rolls past "E" bounces back, False if it can't move.
+
+        :return: True/False
+        """
+        return self._bounce
+
+    def get_stacking(self):
+        """
+        Returns True if a token landing on a friendly token doubles the Player up.
+
+        :return: True/False
+        """
+        return self._stacking
+
+    def get_safe_steps(self):
+        """
+        Returns the step counts from a seat's ready position of the safe track spaces, in order.
+
+        :return: tuple of int
+        """
+        return self._safe_steps
+
+    def get_three_sixes(self):
+        """
+        Returns True if a Player's third 6 in a row is forfeited.
+
+        :return: True/False
+        """
+        return self._three_sixes
+
+
+CLASSIC_RULES = RuleSet()
+RULE_SETS = {
+    "classic": CLASSIC_RULES,
+    "no-bounce": RuleSet(bounce=False),
+    "safe-squares": RuleSet(safe_steps=(1, 9)),  # every start space and the space 8 after it
+    "no-stacking": RuleSet(stacking=False),
+    "three-sixes": RuleSet(three_sixes=True),
+}
+
+
 class Board:
     """
     This class controls the board state and stores each piece in a dictionary with the pace names as the keys and the
     tokens occupying those spaces as the values. Values are a list because more than one token can be on one space.
-    Also knows which pieces are in the finish and which positions on the board are occupied. LudoGame will create one
-    and recreate it for each new game. Will call move_piece() to update the Board each turn.
+    Also knows which pieces are in the finish and keeps a count and owner of the tokens on every space so checking if a
+    space is occupied, and by whom, doesn't need a search. The spaces come from a BoardLayout, CLASSIC_LAYOUT if none is
+    given. LudoGame will create one and recreate it for each new game. Will call move_piece() to update the Board each
+    turn.
     """
-    def __init__(self):
+    def __init__(self, layout=None):
+        self._layout = layout if layout is not None else CLASSIC_LAYOUT
+        self._board_spaces = self._layout.get_board_spaces()
+        self._space_index = self._layout.get_space_index()
         self._board = {}
-        for spaces in range(56):  # creation of the dictionary board
-            self._board[str(spaces + 1)] = []
-        for char in ["A", "B", "C", "D"]:  # adding in the home rows
-            for num in range(1, 7):
-                self._board[char + str(num)] = []
+        for space in self._board_spaces:  # creation of the dictionary board, home rows included
+            self._board[space] = []
         self._finish = []  # to remember which pieces are done
-        self._occupied_spaces = []  # to remember which spaces are occupied for faster search
+        self._empty_counts = (0,) * len(self._board_spaces)  # what reset_board() copies into the counts and owners
+        self._empty_owners = (None,) * len(self._board_spaces)
+        self._counts = list(self._empty_counts)  # number of tokens on each space, indexed by the layout's space index
+        self._owners = list(self._empty_owners)  # lowercase player char of the tokens on each space
+        self._occupied_spaces = None  # cached list for get_occupied_spaces(), rebuilt after the board changes
+        self._journal = None  # undo log shared with LudoGame, None when not recording
+
+    def set_journal(self, journal):
+        """
+        Sets the undo log list the Board records its changes to, or None to stop recording. Each entry is a tuple of a
+        function and its arguments that undoes one change.
+
+        :param journal: list or None.
+        :return: None
+        """
+        self._journal = journal
+
+    def get_layout(self):
+        """
+        Returns the BoardLayout the spaces of this Board come from.
+
+        :return: BoardLayout
+        """
+        return self._layout
 
     def get_occupied_spaces(self):
         """
-        Returns the spaces on the board that have at least one token on it.
+        Returns the spaces on the board that have at least one token on it. A space is listed once for every token on
+        it. The list is only built when asked for, so use is_occupied() or get_occupant() for single spaces.
 
         :return: list of strings
         """
+        if self._occupied_spaces is None:
+            counts = self._counts
+            board_spaces = self._board_spaces
+            self._occupied_spaces = [board_spaces[index] for index in range(len(counts)) for _ in range(counts[index])]
         return self._occupied_spaces
 
+    def is_occupied(self, pos):
+        """
+        Returns True if at least one token is on the space. Anything that isn't a board space ("H", "R", "E", or the
+        negative int from a bounce back) is never occupied.
+
+        :param pos: str. The space name.
+        :return: True/False
+        """
+        index = self._space_index.get(pos)
+        return index is not None and self._counts[index] > 0
+
+    def get_occupant(self, pos):
+        """
+        Returns the lowercase player char ("a", "b", "c", "d", ...) whose tokens are on the space, or None if the space
+        is empty or isn't a board space.
+
+        :param pos: str. The space name.
+        :return: str or None
+        """
+        index = self._space_index.get(pos)
+        if index is None or self._counts[index] == 0:
+            return None
+        return self._owners[index]
+
     def get_finish(self):
         """
         Returns the tokens that have reached the finish space.
@@ -72,77 +481,136 @@ class Board:
         :param token: str. The token name to remove
         :return: None
         """
-        self._board[pos].remove(token)
+        space_tokens = self._board[pos]
+        if self._journal is not None:
+            self._journal.append((self.undo_remove, pos, space_tokens.index(token), token))
+        space_tokens.remove(token)
+        self._counts[self._space_index[pos]] -= 1
+        self._occupied_spaces = None
+
+    def undo_remove(self, pos, place, token):
+        """
+        Puts a token removed by remove_token() back where it was in the space's list.
+
+        :param pos: str. The space name.
+        :param place: int. Where the token was in the list.
+        :param token: str. The token name.
+        :return: None
+        """
+        index = self._space_index[pos]
+        self._board[pos].insert(place, token)
+        self._counts[index] += 1
+        self._owners[index] = token[0]
+        self._occupied_spaces = None
+
+    def add_token(self, pos, token):
+        """
+        To add a token to a specified board space name.
+
+        :param pos: str. The space name.
+        :param token: str. The token name to add.
+        :return: None
+        """
+        index = self._space_index[pos]
+        if self._journal is not None:
+            self._journal.append((self.undo_add, pos, self._owners[index]))
+        self._board[pos].append(token)
+        self._counts[index] += 1
+        self._owners[index] = token[0]
+        self._occupied_spaces = None
+
+    def undo_add(self, pos, owner):
+        """
+        Takes back the last token add_token() put on a space.
+
+        :param pos: str. The space name.
+        :param owner: str or None. Owner of the space before the token was added.
+        :return: None
+        """
+        index = self._space_index[pos]
+        self._board[pos].pop()
+        self._counts[index] -= 1
+        self._owners[index] = owner
+        self._occupied_spaces = None
+
+    def undo_kick(self, pos, removed_tokens):
+        """
+        Puts back the tokens move_piece() kicked off a space.
+
+        :param pos: str. The space name.
+        :param removed_tokens: list of str. The tokens that were on the space.
+        :return: None
+        """
+        index = self._space_index[pos]
+        self._board[pos] = removed_tokens
+        self._counts[index] = len(removed_tokens)
+        self._owners[index] = removed_tokens[0][0]
+        self._occupied_spaces = None
+
+    def undo_finish(self):
+        """
+        Takes back the last token that reached the finish.
+
+        :return: None
+        """
+        self._finish.pop()
 
     def move_piece(self, token, start_pos, end_pos):
         """
-        Does everything to move a piece to a new space. Kicks out pieces that are already occupying the space. Removes
-        the previous occupying space from occupied spaces list. Adds pieces to the finish zone when it reaches it. Will
-        move doubled pieces. When more than one token is occupying a space, occupied space only has the space name once
-        in the list.
+        Does everything to move a piece to a new space. Kicks out pieces that are already occupying the space. Updates
+        the token counts for the starting and ending spaces. Adds pieces to the finish zone when it reaches it. Will
+        move doubled pieces.
 
         :param token: str. Desired token to move.
         :param start_pos: str. Space name for the starting position of the token.
         :param end_pos: str. Space name for the ending position of the token.
         :return: None, list of str, str. Depends on if we need to reset a token or to make a doubled status.
         """
-        if end_pos in self._occupied_spaces:  # going to an occupied space
-            if token[0] in self._board[end_pos][0]:
-                if start_pos == "R":  # when the token is brought out of ready
-                    self._board[end_pos].append(token)
-                    self._occupied_spaces.append(end_pos)
-                else:  # when the token is moved to a space with friendly token
-                    self._board[end_pos].append(token)
-                    self._board[start_pos].remove(token)
-                    self._occupied_spaces.remove(start_pos)
-                    self._occupied_spaces.append(end_pos)
+        end_index = self._space_index.get(end_pos)
+        if end_index is not None and self._counts[end_index] > 0:  # going to an occupied space
+            if self._owners[end_index] == token[0]:  # when the token is moved to a space with friendly token
+                if start_pos != "R":  # a token on the ready position isn't on a board space yet
+                    self.remove_token(start_pos, token)
+                self.add_token(end_pos, token)
                 return "DOUBLE"
             else:  # when a token is moved to a space with hostile token(s)
-                if start_pos == "R":  # when the token is brought out of ready
-                    removed_tokens = self._board[end_pos]
-                    for _ in removed_tokens:
-                        self._occupied_spaces.remove(end_pos)
-                    self._board[end_pos] = []  # need to remove all tokens that were occupying that space
-                    self._board[end_pos].append(token)
-                    self._occupied_spaces.append(end_pos)
-                    return removed_tokens  # returns the list of tokens that need to be reset
-                else:
-                    removed_tokens = self._board[end_pos]
-                    for _ in removed_tokens:
-                        self._occupied_spaces.remove(end_pos)
-                    self._board[end_pos] = []  # need to remove all tokens that were occupying that space
-                    self._board[end_pos].append(token)
-                    self._board[start_pos].remove(token)
-                    self._occupied_spaces.remove(start_pos)
-                    self._occupied_spaces.append(end_pos)
-                    return removed_tokens  # returns the list of tokens that need to be reset
+                removed_tokens = self._board[end_pos]
+                if self._journal is not None:
+                    self._journal.append((self.undo_kick, end_pos, removed_tokens))
+                self._board[end_pos] = []  # need to remove all tokens that were occupying that space
+                self._counts[end_index] = 0
+                if start_pos != "R":
+                    self.remove_token(start_pos, token)
+                self.add_token(end_pos, token)
+                return removed_tokens  # returns the list of tokens that need to be reset
         else:  # going to an empty space
             if end_pos == "E":  # when the token makes it to the end
+                if self._journal is not None:
+                    self._journal.append((self.undo_finish,))
                 self._finish.append(token)
-                self._board[start_pos].remove(token)
-                self._occupied_spaces.remove(start_pos)
+                self.remove_token(start_pos, token)
             elif end_pos == "H":  # when the token is sent back to home
-                self._board[start_pos].remove(token)
-                self._occupied_spaces.remove(start_pos)
+                self.remove_token(start_pos, token)
             elif start_pos == "R":
-                self._board[end_pos].append(token)  # when the token is brought out of home
-                self._occupied_spaces.append(end_pos)
+                self.add_token(end_pos, token)  # when the token is brought out of home
             else:  # when the token is moved to a new space on the board
-                self._board[end_pos].append(token)
-                self._board[start_pos].remove(token)
-                self._occupied_spaces.remove(start_pos)
-                self._occupied_spaces.append(end_pos)
+                self.remove_token(start_pos, token)
+                self.add_token(end_pos, token)
 
     def reset_board(self):
         """
-        Resets all data members to its default state for a new game.
+        Resets all data members to its default state for a new game. Empties the existing lists in place instead of
+        making new ones, so resetting a Board allocates nothing.
 
         :return: None
         """
-        for space in self._board:
-            self._board[space] = []
-        self._finish = []
-        self._occupied_spaces = []
+        for space_tokens in self._board.values():
+            if space_tokens:
+                space_tokens.clear()
+        self._finish.clear()
+        self._counts[:] = self._empty_counts
+        self._owners[:] = self._empty_owners
+        self._occupied_spaces = None
 
     def get_board(self):
         """
@@ -155,35 +623,35 @@ class Board:
 
 class Player:
     """
-    Contains the status of token "P" and token "Q" and where the starting and ending position for this player is. Also
-    contains the status of the player for finished or not finished. Also tracks if player's pieces are doubled up.
-    Will be created for each new game by LudoGame.
+    Contains the status and step count of every token of a seat, in lists indexed by the token's place in
+    TOKEN_LETTERS ("P" is 0 and "Q" is 1), and where the starting and ending position for this player is. The number of
+    tokens and the board come from a BoardLayout, CLASSIC_LAYOUT if none is given. Also contains the status of the
+    player for finished or not finished. Also tracks which pieces are stacked: tokens with the same stack number move
+    together, and a Player whose tokens are all in one stack is doubled up. Will be created for each new game by
+    LudoGame.
     """
-    def __init__(self, position):
+    def __init__(self, position, layout=None):
         try:
             self._player_pos = position.upper()
         except AttributeError:
             raise InvalidPositionError
-        self._p_status = "HOME"  # "HOME", "READY", "ON BOARD", "FINISHED"
-        self._q_status = "HOME"  # "HOME", "READY", "ON BOARD", "FINISHED"
-        self._p_steps = -1
-        self._q_steps = -1
-        if self._player_pos == "A":
-            self._start = 1
-            self._end = 50
-        elif self._player_pos == "B":
-            self._start = 15
-            self._end = 8
-        elif self._player_pos == "C":
-            self._start = 29
-            self._end = 22
-        elif self._player_pos == "D":
-            self._start = 43
-            self._end = 36
-        else:
+        layout = layout if layout is not None else CLASSIC_LAYOUT
+        if self._player_pos not in layout.get_seats() or len(self._player_pos) != 1:
             raise InvalidPositionError
+        self._layout = layout
+        self._token_count = layout.get_token_count()
+        self._home_steps = (-1,) * self._token_count  # what reset_player() copies into the lists
+        self._home_statuses = ("HOME",) * self._token_count
+        self._statuses = list(self._home_statuses)  # "HOME", "READY", "ON BOARD", "FINISHED"
+        self._steps = list(self._home_steps)
+        self._no_stacks = (0,) * self._token_count
+        self._stacks = list(self._no_stacks)  # stack number of each token, its first token's index + 1, 0 if alone
+        self._start = layout.get_start(self._player_pos)
+        self._end = layout.get_end(self._player_pos)
+        self._max_steps = layout.get_max_steps()
+        self._token_names = layout.get_token_names(self._player_pos)
+        self._space_names, self._space_indexes = layout.get_space_tables(self._player_pos)
         self._finished = False
-        self._doubled = False  # if the pieces are on the same space and will move together
         self._in_play = False
 
     def start(self):
@@ -204,19 +672,68 @@ class Player:
 
     def get_doubled(self):
         """
-        Returns True/False if the Player's pieces are doubled.
+        Returns True/False if the Player's pieces are doubled: all its tokens are in one stack, so they move together
+        and the Player has no choice of token. With the classic 2 tokens, that is any stack.
 
         :return: True/False
         """
-        return self._doubled
+        first = self._stacks[0]
+        return first != 0 and self._stacks.count(first) == self._token_count
 
     def set_doubled(self):
         """
-        Will set self._doubled to be True so that pieces will be moved together rather than individually.
+        Puts all the Player's tokens in one stack so that pieces will be moved together rather than individually.
 
         :return: None
         """
-        self._doubled = True
+        self._stacks[:] = (1,) * self._token_count
+
+    def get_stacks(self):
+        """
+        Returns the stack number of every token, in token order. Tokens with the same number move together, and 0 is a
+        token on its own.
+
+        :return: list of int
+        """
+        return self._stacks
+
+    def get_stack(self, index):
+        """
+        Returns the indexes of the tokens that move with a token, the token included, in token order.
+
+        :param index: int. Index of the token in TOKEN_LETTERS.
+        :return: tuple of int
+        """
+        number = self._stacks[index]
+        if number == 0:
+            return index,
+        return tuple(other for other in range(self._token_count) if self._stacks[other] == number)
+
+    def get_stacked_count(self):
+        """
+        Returns how many of the Player's tokens are in a stack.
+
+        :return: int
+        """
+        return self._token_count - self._stacks.count(0)
+
+    def stack_tokens(self, indexes):
+        """
+        Puts the tokens in one stack along with every token already stacked with any of them. Does nothing for a single
+        token on its own.
+
+        :param indexes: iterable of int. Indexes of the tokens in TOKEN_LETTERS.
+        :return: None
+        """
+        stacks = self._stacks
+        members = set(indexes)
+        numbers = {stacks[index] for index in members} - {0}
+        members.update(other for other in range(self._token_count) if stacks[other] in numbers)
+        if len(members) < 2:
+            return
+        number = min(members) + 1
+        for index in members:
+            stacks[index] = number
 
     def get_completed(self):
         """
@@ -224,10 +741,15 @@ class Player:
 
         :return: True/False
         """
-        complete = False
-        if self._finished or (self._p_status == "FINISHED" and self._q_status == "FINISHED"):
-            complete = True
-        return complete
+        return self._finished or self._statuses.count("FINISHED") == self._token_count
+
+    def get_finished(self):
+        """
+        Returns the finished flag of this Player. Use get_completed() to also count every token being finished.
+
+        :return: True/False
+        """
+        return self._finished
 
     def set_finished(self):
         """
@@ -243,41 +765,122 @@ class Player:
 
         :return: None
         """
-        self.reset_status_and_steps("p")
-        self.reset_status_and_steps("q")
+        self._steps[:] = self._home_steps
+        self._statuses[:] = self._home_statuses
+        self._stacks[:] = self._no_stacks
         self._in_play = False
         self._finished = False
 
     def reset_status_and_steps(self, token):
         """
-        When a token is sent back to home, it resets the token's step count and status to "HOME". Will reset both tokens
-        for the player if the player is doubled.
+        When a token is sent back to home, it resets the token's step count and status to "HOME". Will reset every token
+        stacked with it too, and they are no longer stacked.
 
-        :param token: str. The token that is being reset.
+        :param token: str. The token that is being reset, "p", "q", ...
         :return: None
         """
-        if self._doubled is True:
-            self._p_steps = -1
-            self._p_status = "HOME"
-            self._q_steps = -1
-            self._q_status = "HOME"
-            self._doubled = False
-        else:
-            if token.upper() == "P":
-                self._p_steps = -1
-                self._p_status = "HOME"
-            else:
-                self._q_steps = -1
-                self._q_status = "HOME"
+        for index in self.get_stack(TOKEN_INDEX[token.lower()]):
+            self._steps[index] = -1
+            self._statuses[index] = "HOME"
+            self._stacks[index] = 0
+
+    def save_state(self):
+        """
+        Returns the token step counts, token statuses, stack numbers, and flags of this Player as a tuple for
+        load_state().
+
+        :return: tuple
+        """
+        return tuple(self._steps), tuple(self._statuses), tuple(self._stacks), self._finished, self._in_play
+
+    def load_state(self, state):
+        """
+        Sets the token step counts, token statuses, stack numbers, and flags of this Player from a tuple made by
+        save_state().
+
+        :param state: tuple
+        :return: None
+        """
+        self._steps[:], self._statuses[:], self._stacks[:], self._finished, self._in_play = state
 
     def get_player_pos(self):
         """
-        Returns the position the player occupies at the table. "A", "B", "C", or "D".
+        Returns the position the player occupies at the table, one of the layout's seats like "A".
 
         :return: str. 1 char long.
         """
         return self._player_pos
 
+    def get_layout(self):
+        """
+        Returns the BoardLayout this Player was made for.
+
+        :return: BoardLayout
+        """
+        return self._layout
+
+    def get_token_count(self):
+        """
+        Returns how many tokens this Player has.
+
+        :return: int
+        """
+        return self._token_count
+
+    def get_token_names(self):
+        """
+        Returns the board names of this Player's tokens in order, like ("a_p", "a_q").
+
+        :return: tuple of str
+        """
+        return self._token_names
+
+    def get_step_counts(self):
+        """
+        Returns the list of step counts of every token in order. The list is the Player's own, so don't change it.
+
+        :return: list of int
+        """
+        return self._steps
+
+    def get_step_count(self, index):
+        """
+        Returns the step count of a token by its index, 0 for token p.
+
+        :param index: int
+        :return: int
+        """
+        return self._steps[index]
+
+    def set_step_count(self, index, new_steps):
+        """
+        Sets the step count of a token by its index, 0 for token p.
+
+        :param index: int
+        :param new_steps: int
+        :return: None
+        """
+        self._steps[index] = new_steps
+
+    def get_status(self, index):
+        """
+        Returns the status of a token by its index. Either "HOME", "READY", "ON BOARD", or "FINISHED".
+
+        :param index: int
+        :return: str
+        """
+        return self._statuses[index]
+
+    def set_status(self, index, new_status):
+        """
+        Sets the status of a token by its index. Either "HOME", "READY", "ON BOARD", or "FINISHED".
+
+        :param index: int
+        :param new_status: str. Must be either "HOME", "READY", "ON BOARD", or "FINISHED".
+        :return: None
+        """
+        self._statuses[index] = new_status
+
     def get_token_p_step_count(self):
         """
         Returns the step count of token p for this player. Allows for checking of its current position and next position
@@ -285,7 +888,7 @@ class Player:
 
         :return: int
         """
-        return self._p_steps
+        return self._steps[0]
 
     def set_token_p_step_count(self, new_steps):
         """
@@ -294,7 +897,7 @@ class Player:
         :param new_steps: int
         :return: None
         """
-        self._p_steps = new_steps
+        self._steps[0] = new_steps
 
     def get_token_q_step_count(self):
         """
@@ -303,7 +906,7 @@ class Player:
 
         :return: int
         """
-        return self._q_steps
+        return self._steps[1]
 
     def set_token_q_step_count(self, new_steps):
         """
@@ -312,7 +915,7 @@ class Player:
         :param new_steps: int
         :return: None
         """
-        self._q_steps = new_steps
+        self._steps[1] = new_steps
 
     def get_start(self):
         """
@@ -338,7 +941,7 @@ class Player:
 
         :return: str
         """
-        return self._p_status
+        return self._statuses[0]
 
     def set_p_status(self, new_status):
         """
@@ -347,7 +950,7 @@ class Player:
         :param new_status: str. Must be either "HOME", "READY", "ON BOARD", or "FINISHED".
         :return: None
         """
-        self._p_status = new_status
+        self._statuses[0] = new_status
 
     def get_q_status(self):
         """
@@ -355,7 +958,7 @@ class Player:
 
         :return: str
         """
-        return self._q_status
+        return self._statuses[1]
 
     def set_q_status(self, new_status):
         """
@@ -364,62 +967,165 @@ class Player:
         :param new_status: str. Must be either "HOME", "READY", "ON BOARD", or "FINISHED".
         :return: None
         """
-        self._q_status = new_status
+        self._statuses[1] = new_status
 
     def get_space_name(self, total_steps):
         """
-        Uses a step count as a parameter or the step count for a future move. Will calculate the exact space name for
-        either the current position or the future position of a token. If total_steps is more than 57, it will return
-        a negative int for the number of steps a token must go back on.
+        Uses a step count as a parameter or the step count for a future move. Will look up the exact space name for
+        either the current position or the future position of a token. If total_steps is past the finish (57 on the
+        classic board), it will return a negative int for the number of steps a token must go back on.
 
         :param total_steps: int
         :return: str or int.
         """
-        current_position = (self._start + total_steps - 1) % 56
-        if total_steps == -1:  # when the piece is still in Home
-            return "H"
-        if total_steps == 0:  # when the piece is on the ready space
-            return "R"
-        if total_steps == 57:  # when the piece hits the finish line
-            return "E"
-        if total_steps > 57:  # when the piece goes past the finish line
-            return 57 - total_steps
-        if self._player_pos != "A":  # if the player is B - D
-            if current_position == 0:  # since 56 becomes 0 from our % operator
-                return str(56)
-            elif self._start > current_position > self._end:  # if the piece is on the home row
-                return self._player_pos + str(current_position - self._end)
-            else:  # if the piece is on the shared board spaces
-                return str(current_position)
-        else:  # if the player is A
-            if current_position > self._end:  # if the piece is on the home row
-                return self._player_pos + str(current_position - self._end)
-            elif current_position == 0:  # since 56 becomes 0 from our % operator
-                return "A6"
-            else:  # if the piece is on the shared board spaces
-                return str(current_position)
+        if MIN_STEPS <= total_steps <= self._max_steps:
+            return self._space_names[total_steps - MIN_STEPS]
+        layout = self._layout
+        return compute_space_name(self._player_pos, self._start, total_steps, layout.get_track_length(),
+                                  layout.get_home_length())
+
+    def space_index(self, total_steps):
+        """
+        Same as get_space_name() but returns the int index of the space instead, an index into the layout's
+        get_space_names(). Board spaces come first, and Home, ready, and finished are the last 3 (HOME_SPACE,
+        READY_SPACE, and END_SPACE on the classic board). If total_steps is past the finish, returns the index of the
+        space the token bounces back to.
+
+        :param total_steps: int
+        :return: int
+        """
+        if MIN_STEPS <= total_steps <= self._max_steps:
+            return self._space_indexes[total_steps - MIN_STEPS]
+        name = self.get_space_name(total_steps)
+        if isinstance(name, int):
+            name = self.get_space_name(self._layout.get_finish_steps() + name)
+        return self._layout.get_space_names().index(name)
+
+
+class PriorityPolicy:
+    """
+    The default rules for picking which token to move: get a token out of Home on a 6, finish a token on an exact roll,
+    kick out an opponent, and otherwise move the token that is furthest behind. Other policies only need a choose_move()
+    method with the same parameters to be used with LudoGame.set_policy().
+    """
+    def choose_move(self, game, player, steps, moves):
+        """
+        Picks one of the moves the Player can make with this roll.
+
+        :param game: LudoGame. The game the turn is played in, must not be changed.
+        :param player: Player. The Player taking the turn, not doubled.
+        :param steps: int. The steps for a player's turn.
+        :param moves: list of TokenMove. The moves from legal_moves(), in token order.
+        :return: TokenMove or None. One of moves, None only if moves is empty.
+        """
+        if steps == 6:  # checking of there are any tokens in Home, the first one comes out
+            for move in moves:
+                if move.start_steps == -1:
+                    return move
+
+        picked = None
+        picked_kick = False
+        for move in moves:
+            if move.finished:  # if this will move a token to the end
+                return move
+            kick = game.lands_on_opponent(move, player)
+            # a move that kicks an opponent out beats one that doesn't, then the token furthest behind goes first, the
+            # later token when they are tied
+            if picked is None or kick > picked_kick or (kick == picked_kick and move.start_steps <= picked.start_steps):
+                picked = move
+                picked_kick = kick
+        return picked
+
+
+DEFAULT_POLICY = PriorityPolicy()
 
 
 class LudoGame:
     """
     Contains the Player and Board objects for each game session. Has the functions to return the Player object with
-    the position name, to return the Board object, to move a piece for a turn, and a main recursive function to play
-    the game according to the rules and the lists of players and turns for the game. Please look up the game Ludo for
-    a complete set of rules for this game.
+    the position name, to return the Board object, to move a piece for a turn, and a main loop that plays the game
+    according to the rules and the lists of players and turns for the game. Please look up the game Ludo for
+    a complete set of rules for this game. The board and the number of tokens come from a BoardLayout, the classic 4
+    seat, 2 token board of the README if none is given, and the house rules come from a RuleSet, CLASSIC_RULES if none
+    is given. Rules that differ from the README only change branches the README rules rarely take (a bounce, a kick, a
+    stack), and three_sixes puts play_turn_three_sixes() in as this game's play_turn(), so other games never pay for
+    it.
     """
-    def __init__(self):
-        player_a = Player("A")
-        player_b = Player("B")
-        player_c = Player("C")
-        player_d = Player("D")
-        self._players = {
-            "A": player_a,
-            "B": player_b,
-            "C": player_c,
-            "D": player_d
-        }
-        self._board = Board()
+    def __init__(self, layout=None, rules=None):
+        self._layout = layout if layout is not None else CLASSIC_LAYOUT
+        self._rules = rules if rules is not None else CLASSIC_RULES
+        self._players = {char: Player(char, self._layout) for char in self._layout.get_seats()}
+        self._board = Board(self._layout)
+        self._token_letters = self._layout.get_token_letters()
+        self._token_indexes = tuple(range(len(self._token_letters)))
+        self._indexed_letters = tuple(enumerate(self._token_letters))
+        self._finish_steps = self._layout.get_finish_steps()
         self._winners = []
+        self._journal = None  # undo log, None when not recording
+        self._policies = dict.fromkeys(self._players, DEFAULT_POLICY)  # picks the token to move for each Player
+        self._bounce = self._rules.get_bounce()
+        self._stacking = self._rules.get_stacking()
+        self._classic_stacks = self._layout == CLASSIC_LAYOUT  # a stack is both tokens, see stack_up()
+        lap = self._layout.get_track_length() - self._layout.get_home_length()  # steps a token takes on the track
+        if any(steps > lap for steps in self._rules.get_safe_steps()):
+            raise ValueError("safe_steps must be from 1 to {} on this layout: {!r}".format(
+                lap, self._rules.get_safe_steps()))
+        self._safe_spaces = frozenset(player.get_space_name(steps) for player in self._players.values()
+                                      for steps in self._rules.get_safe_steps())
+        self._six_player = None  # Player of the last turn and how many 6s in a row it rolled, for three_sixes
+        self._six_streak = 0
+        if self._rules.get_three_sixes():
+            self.play_turn = self.play_turn_three_sixes
+
+    def start_undo_log(self):
+        """
+        Starts recording every change to the Board, the Players, and the winners so they can be taken back with undo().
+        Recording is stopped by stop_undo_log() or a reset_game().
+
+        :return: None
+        """
+        self._journal = []
+        self._board.set_journal(self._journal)
+
+    def stop_undo_log(self):
+        """
+        Stops recording changes and forgets the ones recorded so far.
+
+        :return: None
+        """
+        self._journal = None
+        self._board.set_journal(None)
+
+    def get_undo_mark(self):
+        """
+        Returns a mark for the current state that undo() can go back to. Raises ValueError if the undo log isn't on.
+
+        :return: int
+        """
+        if self._journal is None:
+            raise ValueError("the undo log is not recording, call start_undo_log() first")
+        return len(self._journal)
+
+    def undo(self, mark=0):
+        """
+        Takes back every change recorded after the mark, newest first, so the game is in the exact state it was in when
+        get_undo_mark() returned the mark.
+
+        :param mark: int. A mark from get_undo_mark(), 0 for when the undo log was started.
+        :return: None
+        """
+        journal = self._journal
+        while len(journal) > mark:
+            entry = journal.pop()
+            entry[0](*entry[1:])
+
+    def undo_winner(self):
+        """
+        Takes back the last winner.
+
+        :return: None
+        """
+        self._winners.pop()
 
     def set_winners(self, winner):
         """
@@ -428,17 +1134,70 @@ class LudoGame:
         :param winner: str. The character of the winner you want to put into self._winners.
         :return: None
         """
+        if self._journal is not None:
+            self._journal.append((self.undo_winner,))
         self._winners.append(winner)
 
+    def clear_winners(self):
+        """
+        Empties the list of winners in place.
+
+        :return: None
+        """
+        self._winners.clear()
+
     def get_winners(self):
         """
-        Returns the list of winners in the order they won. Will not include the last player whose tokens did not both
+        Returns the list of winners in the order they won. Will not include the last player whose tokens did not all
         make it to the end.
 
         :return: list of str.
         """
         return self._winners
 
+    def get_layout(self):
+        """
+        Returns the BoardLayout this game is played on.
+
+        :return: BoardLayout
+        """
+        return self._layout
+
+    def get_rules(self):
+        """
+        Returns the RuleSet this game is played with.
+
+        :return: RuleSet
+        """
+        return self._rules
+
+    def get_six_streak(self):
+        """
+        Returns the Player of the last turn and how many 6s in a row it rolled up to then, for the three_sixes rule.
+
+        :return: tuple of (str or None, int)
+        """
+        return self._six_player, self._six_streak
+
+    def set_six_streak(self, player_char, streak):
+        """
+        Sets the Player of the last turn and its 6s in a row, for a game picking up where another one was.
+
+        :param player_char: str or None.
+        :param streak: int.
+        :return: None
+        """
+        self._six_player = player_char
+        self._six_streak = streak
+
+    def get_players(self):
+        """
+        Returns the dictionary of the Player objects of every seat by position, including the ones that are not in play.
+
+        :return: dict with str as keys and Player as values
+        """
+        return self._players
+
     def get_board(self):
         """
         Returns the Board object that LudoGame uses to remember board states.
@@ -447,6 +1206,26 @@ class LudoGame:
         """
         return self._board
 
+    def get_policy(self, player_position):
+        """
+        Returns the policy that picks which token the Player moves.
+
+        :param player_position: str. "A", "B", "C", or "D".
+        :return: policy object with a choose_move() method
+        """
+        return self._policies[player_position.upper()]
+
+    def set_policy(self, player_position, policy=None):
+        """
+        Sets the policy that picks which token the Player moves. Any object with a choose_move(game, player, steps,
+        moves) method works, see PriorityPolicy. Policies stay set across play_game() and reset_game().
+
+        :param player_position: str. "A", "B", "C", or "D".
+        :param policy: policy object, or None to go back to PriorityPolicy.
+        :return: None
+        """
+        self._policies[player_position.upper()] = policy if policy is not None else DEFAULT_POLICY
+
     def get_player_by_position(self, player_position):
         """
         Returns the Player object by its name "A", "B", "C", or "D". Raises an exception if player_position is anything
@@ -466,232 +1245,511 @@ class LudoGame:
         except AttributeError:
             return "Player not found!"
 
-    def move_token(self, player, token, steps):
+    def legal_moves(self, player, steps):
         """
-        Moves the specific token for a specific player for a specific # of steps. Will raise InvalidTokenError if the
-        wrong token is given. Calls Board.move_piece() in order to properly update the board state. Will update token
-        step counts and token statuses for Player.
+        Returns the moves the Player's tokens can make with this roll, in token order (p first), without changing the
+        board. A token in Home needs a 6 and a finished token can't move at all. A stack is listed once, as the move of
+        its first token, since the rest of the stack moves with it.
 
         :param player: Player. Takes the Player object, not player name.
-        :param token: str. "P" or "Q" token for Player, not token name on board.
         :param steps: int. The steps for a player's turn.
-        :return: str or None. If we double a player's tokens, will return "DOUBLE".
+        :return: list of TokenMove
         """
-        try:
-            if token.upper() == "P":
-                token_name = "{}_p".format(player.get_player_pos().lower())
-                token_steps = player.get_token_p_step_count()
-                set_token_steps = player.set_token_p_step_count  # to set "P" token step count
-                set_status = player.set_p_status  # to set "P" token status
-            elif token.upper() == "Q":
-                token_name = "{}_q".format(player.get_player_pos().lower())
-                token_steps = player.get_token_q_step_count()
-                set_token_steps = player.set_token_q_step_count  # to set "Q" token step count
-                set_status = player.set_q_status  # to set "Q" token status
-            else:
-                raise InvalidTokenError
-        except AttributeError:
-            raise InvalidTokenError
+        moves = []
+        stacks = player.get_stacks()
+        for index, token in self._indexed_letters:
+            if 0 < stacks[index] <= index:  # moves with the first token of its stack
+                continue
+            move = self.get_token_move(player, token, steps)
+            if move is not None:
+                moves.append(move)
+        return moves
+
+    def get_token_move(self, player, token, steps):
+        """
+        Returns the move one token can make with this roll, or None if the token can't move. Doesn't change the board.
+
+        :param player: Player. Takes the Player object, not player name.
+        :param token: str. "p", "q", or a later token letter of the layout, lowercase.
+        :param steps: int. The steps for a player's turn.
+        :return: TokenMove or None
+        """
+        token_steps = player.get_step_count(TOKEN_INDEX[token])
+        if token_steps == -1:  # we need a 6 to move this piece out of Home
+            if steps != 6:
+                return None
+            return TokenMove(token, -1, 0, "H", "R", (), False, False, False)
+        finish_steps = self._finish_steps
+        if token_steps == finish_steps:  # a finished token can't move
+            return None
         start_pos = player.get_space_name(token_steps)
         end_steps = token_steps + steps
-        if start_pos == "H" and steps == 6:  # we need a 6 to move this piece
-            set_token_steps(0)
-            set_status("READY")
-            return
-        if start_pos == "H" or start_pos == "E":  # space that the token cannot move from
-            raise InvalidTokenError
+        bounced = end_steps > finish_steps
+        if bounced:  # goes past the finish and comes back
+            if not self._bounce:  # or can't move at all without the bounce rule
+                return None
+            end_steps = 2 * finish_steps - end_steps
         end_pos = player.get_space_name(end_steps)
-        result = None  # assigns it a base value of None
-        try:
-            if end_pos < 0:
-                result = self._board.move_piece(token_name, start_pos, player.get_space_name(57 + end_pos))
-                set_token_steps(57 + end_pos)
-        except TypeError:
-            if end_pos == "E":  # if the token lands on finish
-                result = self._board.move_piece(token_name, start_pos, end_pos)
-                set_token_steps(57)
-                set_status("FINISHED")
-            elif start_pos == "R":  # if the token was on ready position
-                result = self._board.move_piece(token_name, start_pos, end_pos)
-                set_token_steps(end_steps)
-                set_status("ON BOARD")
-            else:  # if the token was anywhere else
-                result = self._board.move_piece(token_name, start_pos, end_pos)
-                set_token_steps(end_steps)
+        if end_pos == "E":
+            return TokenMove(token, token_steps, end_steps, start_pos, end_pos, (), False, bounced, True)
+        occupant = self._board.get_occupant(end_pos)
+        if occupant is None:
+            return TokenMove(token, token_steps, end_steps, start_pos, end_pos, (), False, bounced, False)
+        if occupant == player.get_player_pos().lower():
+            return TokenMove(token, token_steps, end_steps, start_pos, end_pos, (), True, bounced, False)
+        if end_pos in self._safe_spaces:  # an opponent on a safe space can't be kicked, so the token can't go there
+            return None
+        kicked = tuple(self._board.get_board()[end_pos])
+        return TokenMove(token, token_steps, end_steps, start_pos, end_pos, kicked, False, bounced, False)
+
+    def apply_move(self, player, move):
+        """
+        Makes a move from legal_moves() or get_token_move(). Calls Board.move_piece() to update the board state, updates
+        the token's step count and status, and sends kicked tokens back to Home.
+
+        :param player: Player. The Player the move was found for.
+        :param move: TokenMove.
+        :return: str or None. If we double a player's tokens, will return "DOUBLE".
+        """
+        if self._journal is not None:  # covers stack_up() by play_turn() after this move too
+            self._journal.append((player.load_state, player.save_state()))
+        index = TOKEN_INDEX[move.token]
+        player.set_step_count(index, move.end_steps)
+        if move.start_steps == -1:  # brought out of Home onto the ready position, not on the board yet
+            player.set_status(index, "READY")
+            return
+        result = self._board.move_piece(player.get_token_names()[index], move.start_space, move.end_space)
+        if move.finished:  # if the token lands on finish
+            player.set_status(index, "FINISHED")
+        elif move.start_space == "R":  # if the token was on ready position
+            player.set_status(index, "ON BOARD")
         if result is not None:  # resets the opponent's token(s) if it lands on something or doubles a player
             if result == "DOUBLE":  # if result is set to "DOUBLE", we landed on a friendly token
                 return "DOUBLE"
             else:
                 reset_player = self.get_player_by_position(result[0][0])
+                if self._journal is not None:
+                    self._journal.append((reset_player.load_state, reset_player.save_state()))
                 for token in result:
                     reset_player.reset_status_and_steps(token[2])
 
+    def move_token(self, player, token, steps):
+        """
+        Moves the specific token for a specific player for a specific # of steps. Will raise InvalidTokenError if the
+        wrong token is given or the token can't move. Uses get_token_move() to find the move and apply_move() to make
+        it.
+
+        :param player: Player. Takes the Player object, not player name.
+        :param token: str. "P", "Q", or a later token letter of the layout, not token name on board.
+        :param steps: int. The steps for a player's turn.
+        :return: str or None. If we double a player's tokens, will return "DOUBLE".
+        """
+        try:
+            token = token.lower()
+        except AttributeError:
+            raise InvalidTokenError
+        if token not in self._token_letters:
+            raise InvalidTokenError
+        move = self.get_token_move(player, token, steps)
+        if move is None:  # token that cannot move
+            raise InvalidTokenError
+        return self.apply_move(player, move)
+
     def rec_play_game(self, players_list, turns_list, pos):
         """
-        Recursive function that loops through the turns_list and players_list to alternate turns and skip turns if the
-        move is invalid. Will NOT do this for the assignment but for the future "finished" state of the game for the
-        portfolio. For the assignment, it will go through the turns_list without caring for multiple turns in a row.
+        Kept for backwards compatibility. Plays turns_list from index pos onward by calling iter_play_game(), which
+        loops over the turns instead of recursing once per turn, so long turn lists no longer hit the recursion limit.
 
         :param players_list: list of str. List of "A", "B", "C", or "D" players.
         :param turns_list: list of tuples. Tuple is (player char, step count) for that turn.
         :param pos: int. Position in turns_list.
         :return: None
         """
-        if pos >= len(turns_list):  # base case for stopping the game
-            return
-        if len(self._winners) == len(players_list) - 1:  # base case for every Player but 1 finishes
-            return
-        player_char, steps = turns_list[pos]  # assigning the tuple variables
+        self.iter_play_game(players_list, turns_list, pos)
 
-        try:  # is this turn a valid player turn?
-            player = self.get_player_by_position(player_char)
-        except AttributeError:  # skip this turn if not
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
+    def iter_play_game(self, players_list, turns_list, pos=0):
+        """
+        Loops through the turns_list starting at pos and plays each turn with play_turn(). Stops when the turns run out
+        or when every Player but 1 finishes. Uses constant stack depth no matter how long turns_list is, and turns_list
+        can be any iterable of turns, like a generator, so it is never held in memory all at once.
 
-        if player.get_in_play() is False:  # is this Player in the game?
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
+        :param players_list: list of str. List of "A", "B", "C", or "D" players.
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :param pos: int. Number of turns at the start of turns_list to skip.
+        :return: None
+        """
+        last_winner = len(players_list) - 1
+        winners = self._winners
+        play_turn = self.play_turn
+        for player_char, steps in itertools.islice(turns_list, pos, None):
+            if len(winners) == last_winner:  # every Player but 1 finishes
+                return
+            play_turn(player_char, steps)
 
-        if player.get_completed():  # if this player is all done
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
+    def play_turn(self, player_char, steps):
+        """
+        Plays one turn for a Player. A doubled Player moves all its tokens together, otherwise the Player's policy picks
+        one of the moves from legal_moves(), which is PriorityPolicy unless set_policy() gave the Player another one,
+        and a stacked token takes the rest of its stack along. Skips the turn if the Player is not in the game, is
+        already done, or has no token that can move.
 
-        if player.get_p_status == "FINISHED" or player.get_q_status == "FINISHED":
-            if player.get_p_status == "FINISHED" and player.get_q_status == "FINISHED":
-                player.set_finished()
-                return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
+        :param player_char: str. "A", "B", "C", or "D" for the Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: tuple of TokenMove. The moves that were made, empty if the turn was skipped.
+        """
+        player = self.get_player_by_position(player_char)
+        if not isinstance(player, Player):  # is this turn a valid player turn? skip this turn if not
+            return ()
+        if player.get_completed():  # if this player is all done
+            return ()
+
+        stacks = player.get_stacks()
+        if stacks[0] and player.get_doubled():  # if we just move all tokens together, skipping a finished token
+            return self.move_stack(player, self._token_indexes, steps)
+
+        moves = self.legal_moves(player, steps)
+        move = self._policies[player.get_player_pos()].choose_move(self, player, steps, moves)
+        if move is not None:
+            double = move.stacked and self.doubles_up(player, steps, moves)  # before the move changes the step counts
+            index = TOKEN_INDEX[move.token]
+            if stacks[index]:  # the rest of the token's stack moves with it
+                made = self.move_stack(player, player.get_stack(index), steps)
             else:
-                if player.get_p_status == "FINISHED":  # p is already done
-                    try:
-                        self.move_token(player, "q", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:  # can't move this token
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                else:  # q is already done
-                    try:
-                        self.move_token(player, "p", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:  # can't move this token
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-
-        if player.get_doubled():  # if we just move both tokens together
-            self.move_token(player, "p", steps)
-            self.move_token(player, "q", steps)
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-
-        if steps == 6:  # checking of there are any tokens in Home
-            if player.get_p_status() == "HOME":
-                self.move_token(player, "p", steps)
-                return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-            if player.get_q_status() == "HOME":
-                self.move_token(player, "q", steps)
-                return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-
-        p_steps = player.get_token_p_step_count()
-        q_steps = player.get_token_q_step_count()
-
-        p_future_space = player.get_space_name(p_steps + steps)
-        q_future_space = player.get_space_name(q_steps + steps)
-        if p_future_space == "E":  # if this will move "p" to the end
-            self.move_token(player, "p", steps)
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-        if q_future_space == "E":  # if this will move "q" to the end.
-            self.move_token(player, "q", steps)
-            return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-
-        occupied_spaces = self._board.get_occupied_spaces()
-        if p_future_space in occupied_spaces or q_future_space in occupied_spaces:  # check to kick opponent out
-            p_kick = False
-            q_kick = False
-            if p_steps + steps != q_steps and p_future_space in occupied_spaces:  # will kick opponent not double
-                p_kick = True
-            if q_steps + steps != p_steps and q_future_space in occupied_spaces:  # will kick opponent not double
-                q_kick = True
-            if p_kick and q_kick:  # find the furthest token if both can kick opponents out
-                if p_steps < q_steps:  # p is further back than q
-                    try:
-                        self.move_token(player, "p", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:
-                        pass
-                else:  # q is further back than p
-                    try:
-                        self.move_token(player, "q", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:
-                        pass
-            else:  # only one of them can kick an opponent out
-                if p_kick:  # p will kick opponent out
-                    try:
-                        self.move_token(player, "p", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:
-                        pass
-                if q_kick:  # q will kick opponent out
-                    try:
-                        self.move_token(player, "q", steps)
-                        return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                    except InvalidTokenError:
-                        pass
-
-        if p_steps < q_steps:  # p token is the furthest behind
-            try:
-                results = self.move_token(player, "p", steps)
-                if results == "DOUBLE":  # will double up the player if this makes them doubled
-                    player.set_doubled()
-                return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-            except InvalidTokenError:
-                try:
-                    results = self.move_token(player, "q", steps)
-                    if results == "DOUBLE":  # will double up the player if this makes them doubled
-                        player.set_doubled()
-                    return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                except InvalidTokenError:
-                    pass
-        else:  # q token is the furthest behind
-            try:
-                results = self.move_token(player, "q", steps)
-                if results == "DOUBLE":  # will double up the player if this makes them doubled
-                    player.set_doubled()
-                return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-            except InvalidTokenError:
-                try:
-                    results = self.move_token(player, "p", steps)
-                    if results == "DOUBLE":  # will double up the player if this makes them doubled
-                        player.set_doubled()
-                    return self.rec_play_game(players_list, turns_list, pos + 1)  # done with this turn
-                except InvalidTokenError:
-                    pass
+                self.apply_move(player, move)
+                made = move,
+            if double:  # will stack it with the tokens it landed on
+                self.stack_up(player, move)
+            return made
 
         # Last check to see if Player is done after doing all these moves
         if player.get_completed():
-            self._winners.append(player_char)
+            self.set_winners(player_char)
+        return ()
+
+    def move_stack(self, player, stack, steps):
+        """
+        Moves every token of a stack with this roll, in token order, skipping a token that can't move. Each token's move
+        is found after the ones before it are made, so the later tokens land on the first one.
 
-        return self.rec_play_game(players_list, turns_list, pos + 1)  # if all else can't be done
+        :param player: Player. Takes the Player object, not player name.
+        :param stack: tuple of int. Indexes of the tokens, from Player.get_stack().
+        :param steps: int. The steps for a player's turn.
+        :return: tuple of TokenMove. The moves that were made.
+        """
+        moves = []
+        for index in stack:
+            move = self.get_token_move(player, self._token_letters[index], steps)  # depends on where p just went
+            if move is not None:
+                self.apply_move(player, move)
+                moves.append(move)
+        return tuple(moves)
+
+    def stack_up(self, player, move):
+        """
+        Stacks the token of a move that landed on the Player's own tokens with every token on that space, after the move
+        is made, in a turn doubles_up() allows. On the classic layout the stack is always both tokens, the way the
+        README game doubles a Player up, so a token that bounces back onto its own space there doubles the Player up
+        with the other token wherever it is, and kicking either one sends both back to Home. On other layouts a stack
+        only ever holds tokens that share a space, so the Board and the Players always agree (see check_board()).
+
+        :param player: Player. The Player the move was made for.
+        :param move: TokenMove. The move that was made, with stacked True.
+        :return: None
+        """
+        if self._classic_stacks:
+            player.set_doubled()
+            return
+        step_counts = player.get_step_counts()
+        player.stack_tokens([index for index in range(len(step_counts)) if step_counts[index] == move.end_steps])
+
+    def play_turn_three_sixes(self, player_char, steps):
+        """
+        play_turn() of a game whose RuleSet has three_sixes, put in its place when the game is made. A Player's third 6
+        in a row, counting only back-to-back turns of that Player, is forfeited: nothing moves and the count starts
+        over. Every other roll is played by play_turn().
+
+        :param player_char: str. "A", "B", "C", or "D" for the Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: tuple of TokenMove. The moves that were made, empty if the turn was skipped or forfeited.
+        """
+        if steps != 6:
+            streak = 0
+        elif player_char == self._six_player:
+            streak = self._six_streak + 1
+        else:
+            streak = 1
+        if self._journal is not None:
+            self._journal.append((self.set_six_streak, self._six_player, self._six_streak))
+        self._six_player = player_char
+        if streak == 3:  # the third 6 is forfeited
+            self._six_streak = 0
+            return ()
+        self._six_streak = streak
+        return LudoGame.play_turn(self, player_char, steps)
+
+    def lands_on_opponent(self, move, player):
+        """
+        Returns True if the move is one the kick rule picks: it lands on an occupied board space without bouncing back,
+        and isn't just landing on one of the Player's other tokens.
+
+        :param move: TokenMove or None.
+        :param player: Player. The Player the move was found for.
+        :return: True/False
+        """
+        if move is None or move.bounced or not (move.kicked or move.stacked):
+            return False
+        step_counts = player.get_step_counts()  # the moving token only counts if it would land where it already is
+        return step_counts.count(move.end_steps) == (step_counts[TOKEN_INDEX[move.token]] == move.end_steps)
+
+    def doubles_up(self, player, steps, moves):
+        """
+        Returns True if a token that lands on one of the Player's own tokens this turn doubles the Player up. That only
+        happens in a turn where the priority rules come down to moving the token furthest behind: no token can come out
+        of Home on a 6, finish, or kick out an opponent, and the RuleSet allows stacking. These are the turns
+        play_turn() doubled a Player up in before policies could be set, whichever policy picks the move.
+
+        :param player: Player. The Player taking the turn, before its move is made.
+        :param steps: int. The steps for a player's turn.
+        :param moves: list of TokenMove. The moves from legal_moves().
+        :return: True/False
+        """
+        if not self._stacking:
+            return False
+        for move in moves:
+            if (steps == 6 and move.start_steps == -1) or move.finished or self.lands_on_opponent(move, player):
+                return False
+        return True
 
     def play_game(self, players_list, turns_list):
         """
         Uses a list of players "A", "B", "C", or "D" and a list of tuples for turns (player name, int steps) to move
-        pieces on a Board. Will call rec_play_game() to play through the game. If play_game() is called after a previous
-        game, it will reset the board state and player token statuses to start a new game. Will set a player to doubled
-        if their pieces occupy the same space. Returns a list of str space names for every space a token is occupying.
-        With be either "H" for home space, "R" for the ready position, "E" for a finished position, or a string for the
-        specific space names on the board a token is occupying.
+        pieces on a Board. Will call iter_play_game() to play through the game. If play_game() is called after a
+        previous game, it will reset the board state and player token statuses to start a new game. Will set a player to
+        doubled if their pieces occupy the same space. Returns a list of str space names for every space a token is
+        occupying. With be either "H" for home space, "R" for the ready position, "E" for a finished position, or a
+        string for the specific space names on the board a token is occupying.
 
         :param players_list: list of str. List of "A", "B", "C", or "D" players.
-        :param turns_list: list of tuples. Tuple is (player char, step count) for that turn.
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
         :return: list of str.
         """
+        players_list.sort()  # sorts the players list in the correct order
+        self.reset_game(players_list)
+        self.iter_play_game(players_list, turns_list)  # starts the game
+        return self.get_positions(players_list)
+
+    def reset_game(self, players_list):
+        """
+        Resets the board state and player token statuses, then puts the Players in players_list in play for a new
+        game. Does not sort players_list.
+
+        :param players_list: list of str. List of "A", "B", "C", or "D" players.
+        :return: None
+        """
+        self.stop_undo_log()
         self._board.reset_board()  # resets every list in Board
+        self._six_player = None
+        self._six_streak = 0
         for player in self._players:  # resets every Player object
             self._players[player].reset_player()
-        players_list.sort()  # sorts the players list in the correct order
         for char in players_list:  # activates Players that are in this particular game
             self._players[char.upper()].start()
-        self.rec_play_game(players_list, turns_list, 0)  # starts the game
-        # now we start to compile the board state to return the occupied board spaces.
+
+    def get_positions(self, players_list):
+        """
+        Compiles the board state into the list play_game() returns: the space name of every token (p, then q, and so on)
+        for every Player in players_list, in that order.
+
+        :param players_list: list of str. List of "A", "B", "C", or "D" players.
+        :return: list of str.
+        """
         positions = []
         for char in players_list:
-            p_steps = self._players[char].get_token_p_step_count()
-            q_steps = self._players[char].get_token_q_step_count()
-            positions.append(self._players[char].get_space_name(p_steps))
-            positions.append(self._players[char].get_space_name(q_steps))
+            player = self._players[char]
+            for total_steps in player.get_step_counts():
+                positions.append(player.get_space_name(total_steps))
         return positions
+
+    def check_board(self):
+        """
+        Returns how the Board and the Players' tokens disagree, an empty list if they agree. Every token of a Player in
+        play must be on the board space its step count names, or in the finish once it gets to "E", nothing else may be
+        on the Board, and the tokens of a stack must share a space. Games on the classic layout can disagree once a
+        doubled Player whose tokens were on different spaces is sent back to Home, see stack_up().
+
+        :return: list of str. One line per difference.
+        """
+        problems = []
+        expected = collections.Counter()
+        finished = collections.Counter()
+        for player in self._players.values():
+            if not player.get_in_play():
+                continue
+            names = player.get_token_names()
+            step_counts = player.get_step_counts()
+            for index in range(len(step_counts)):
+                space = player.get_space_name(step_counts[index])
+                if space == "E":
+                    finished[names[index]] += 1
+                elif space not in ("H", "R"):
+                    expected[space, names[index]] += 1
+                if any(step_counts[other] != step_counts[index] for other in player.get_stack(index)):
+                    problems.append("{} is stacked with a token on another space".format(names[index]))
+        on_board = collections.Counter((space, token) for space, space_tokens in self._board.get_board().items()
+                                       for token in space_tokens)
+        for space, token in sorted(on_board - expected):
+            problems.append("{} is on {} on the Board but not for its Player".format(token, space))
+        for space, token in sorted(expected - on_board):
+            problems.append("{} is on {} for its Player but not on the Board".format(token, space))
+        if collections.Counter(self._board.get_finish()) != finished:
+            problems.append("the finish has {} but the finished tokens are {}".format(
+                sorted(self._board.get_finish()), sorted(finished.elements())))
+        return problems
+
+
+# What one turn of a GameSession changed. moves are the TokenMoves that were made (one for every token of a stack that
+# moved, none if the turn was skipped), kicked is the opponent token names sent back to Home, stacked is True if the
+# move stacked the Player's tokens, and finished is the token names that reached "E" this turn.
+TurnDelta = collections.namedtuple("TurnDelta", ["player", "steps", "moves", "kicked", "stacked", "finished"])
+
+
+class GameSession:
+    """
+    Plays one game a turn at a time instead of all at once like play_game(). Turns can come in as they happen with
+    apply_turn(), which returns what the turn changed, and the positions can be checked between any two turns. Uses the
+    same rules and gives the same positions as play_game() for the same turns.
+    """
+    def __init__(self, players_list, game=None):
+        self._game = game if game is not None else LudoGame()
+        self._players_list = sorted(players_list)
+        self._game.reset_game(self._players_list)
+        self._turns = 0
+
+    def get_game(self):
+        """
+        Returns the LudoGame this session plays on.
+
+        :return: LudoGame
+        """
+        return self._game
+
+    def get_players_list(self):
+        """
+        Returns the sorted list of players in this game.
+
+        :return: list of str
+        """
+        return self._players_list
+
+    def get_turn_count(self):
+        """
+        Returns how many turns have been given to this session, including skipped ones.
+
+        :return: int
+        """
+        return self._turns
+
+    def set_turn_count(self, turns):
+        """
+        Sets how many turns have been given to this session, for a session picking up a game that was saved part way.
+
+        :param turns: int
+        :return: None
+        """
+        self._turns = turns
+
+    def is_over(self):
+        """
+        Returns True when every Player but 1 finishes, the point where play_game() stops playing turns.
+
+        :return: True/False
+        """
+        return len(self._game.get_winners()) == len(self._players_list) - 1
+
+    def apply_turn(self, player_char, steps):
+        """
+        Plays one turn and returns what it changed. Turns given after the game is over change nothing.
+
+        :param player_char: str. "A", "B", "C", or "D" for the Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: TurnDelta
+        """
+        self._turns += 1
+        if self.is_over():
+            return TurnDelta(player_char, steps, (), (), False, ())
+        player = self._game.get_player_by_position(player_char)
+        was_stacked = player.get_stacked_count() if isinstance(player, Player) else 0
+        moves = self._game.play_turn(player_char, steps)
+        if not moves:
+            return TurnDelta(player_char, steps, (), (), False, ())
+        kicked = tuple(token for move in moves for token in move.kicked)
+        finished = tuple(player.get_token_names()[TOKEN_INDEX[move.token]] for move in moves if move.finished)
+        return TurnDelta(player_char, steps, moves, kicked, player.get_stacked_count() > was_stacked, finished)
+
+    def apply_turns(self, turns):
+        """
+        Plays every turn from an iterable, like a generator reading a live table, one at a time so memory use stays the
+        same no matter how many turns there are.
+
+        :param turns: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :return: int. The number of turns read.
+        """
+        count = 0
+        for player_char, steps in turns:
+            self.apply_turn(player_char, steps)
+            count += 1
+        return count
+
+    def get_positions(self):
+        """
+        Returns the space names of every token right now, in the same order play_game() returns them.
+
+        :return: list of str.
+        """
+        return self._game.get_positions(self._players_list)
+
+
+class GamePool:
+    """
+    Hands out LudoGame objects that are reused instead of made new for every game. Games are made up front, reset in
+    place when they are handed out, and put back with release(). A game that is handed out when the pool is empty is
+    made new. Every game of a pool is played on the same BoardLayout and RuleSet.
+    """
+    def __init__(self, size=0, layout=None, rules=None):
+        self._layout = layout
+        self._rules = rules
+        self._free = [LudoGame(layout, rules) for _ in range(size)]
+
+    def get_free_count(self):
+        """
+        Returns how many games are waiting in the pool.
+
+        :return: int
+        """
+        return len(self._free)
+
+    def acquire(self, players_list=None):
+        """
+        Returns a game from the pool, reset for players_list if it is given.
+
+        :param players_list: list of str or None. List of "A", "B", "C", or "D" players.
+        :return: LudoGame
+        """
+        game = self._free.pop() if self._free else LudoGame(self._layout, self._rules)
+        if players_list is not None:
+            game.reset_game(players_list)
+        return game
+
+    def release(self, game):
+        """
+        Puts a game back in the pool. Stops its undo log, clears its winners, and gives every seat the default policy
+        again so the next user gets a clean game.
+
+        :param game: LudoGame
+        :return: None
+        """
+        game.stop_undo_log()
+        game.clear_winners()
+        for char in game.get_players():
+            game.set_policy(char)
+        self._free.append(game)
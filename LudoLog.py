@@ -0,0 +1,328 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A packed file format for archives of games. Every turn is one byte, the seat in the high bits and the
+# roll in the low 3 bits, and every game starts with a small header of its players and number of turns. An index of game
+# offsets at the end of the file lets GameLog jump to any game. GameLog reads the file through mmap and hands out
+# memoryview slices of the turns, which play_game() can read through a table of the 256 possible turn tuples, so no
+# tuple is ever made per turn. Also converts list-of-tuples games, CSV files, and JSONL files to the format.
+
+import argparse
+import csv
+import json
+import mmap
+import struct
+import sys
+import time
+
+from LudoGame import LudoGame
+
+SEATS = "ABCD"
+MAGIC = b"LUDL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHH")  # magic, version, unused
+GAME_HEADER = struct.Struct("<BI")  # bit per seat in play, number of turns
+FOOTER = struct.Struct("<QQ4s")  # offset of the index, number of games, magic
+OFFSET = struct.Struct("<Q")  # one per game in the index
+ROLL_BITS = 3
+MAX_ROLL = (1 << ROLL_BITS) - 1  # a roll has to fit in ROLL_BITS
+
+
+def encode_turn(player_char, steps):
+    """
+    Packs one turn into its byte. Raises ValueError if the seat isn't "A" - "D" or the roll doesn't fit in 3 bits.
+
+    :param player_char: str. "A", "B", "C", or "D", lowercase works too.
+    :param steps: int. The roll, from 0 to 7.
+    :return: int
+    """
+    try:
+        return TURN_BYTES[player_char, steps]
+    except (KeyError, TypeError):
+        raise ValueError("turn can't be packed: ({!r}, {!r})".format(player_char, steps))
+
+
+# Byte of every turn that can be packed, and the turn tuple of every byte. Decoding through TURNS hands out the same 256
+# tuples over and over instead of making one per turn.
+TURN_BYTES = {(char, roll): (seat_index << ROLL_BITS) | roll
+              for seat_index, seat in enumerate(SEATS) for char in (seat, seat.lower()) for roll in range(MAX_ROLL + 1)}
+TURNS = tuple((SEATS[byte >> ROLL_BITS], byte & MAX_ROLL) if byte >> ROLL_BITS < len(SEATS) else None
+              for byte in range(256))
+
+
+def players_mask(players_list):
+    """
+    Packs a players list into one bit per seat. Raises ValueError for anything but "A" - "D".
+
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :return: int
+    """
+    mask = 0
+    for char in players_list:
+        if not isinstance(char, str) or char.upper() not in SEATS or len(char) != 1:
+            raise ValueError("player can't be packed: {!r}".format(char))
+        mask |= 1 << SEATS.index(char.upper())
+    return mask
+
+
+def mask_players(mask):
+    """
+    Returns the sorted players list of a players_mask().
+
+    :param mask: int
+    :return: list of str
+    """
+    return [char for seat_index, char in enumerate(SEATS) if mask & (1 << seat_index)]
+
+
+class GameLogWriter:
+    """
+    Writes games to a log file one at a time, so a writer never holds more than one game. The index is written by
+    close(), and a file without it can't be read.
+    """
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0))
+        self._offsets = []
+        self._position = FILE_HEADER.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_game(self, players_list, turns_list):
+        """
+        Writes one game. Raises ValueError if a player or a turn can't be packed.
+
+        :param players_list: list of str. List of "A", "B", "C", or "D" players.
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :return: None
+        """
+        turns = bytes(encode_turn(player_char, steps) for player_char, steps in turns_list)
+        header = GAME_HEADER.pack(players_mask(players_list), len(turns))  # packed first, a bad game writes nothing
+        self._offsets.append(self._position)
+        self._file.write(header)
+        self._file.write(turns)
+        self._position += GAME_HEADER.size + len(turns)
+
+    def get_game_count(self):
+        """
+        Returns how many games were written so far.
+
+        :return: int
+        """
+        return len(self._offsets)
+
+    def close(self):
+        """
+        Writes the index and footer and closes the file. Does nothing if it was already closed.
+
+        :return: None
+        """
+        if self._file.closed:
+            return
+        for offset in self._offsets:
+            self._file.write(OFFSET.pack(offset))
+        self._file.write(FOOTER.pack(self._position, len(self._offsets), MAGIC))
+        self._file.close()
+
+
+class GameLog:
+    """
+    A log file opened through mmap. Games are read straight out of the mapped file: get_turns() returns a memoryview of
+    the turn bytes and iter_turns() decodes them through TURNS. Raises ValueError if the file isn't a complete game log.
+    Memoryviews from get_turns() have to be released before close().
+    """
+    def __init__(self, path):
+        with open(path, "rb") as log_file:
+            self._map = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._map)
+        if size < FILE_HEADER.size + FOOTER.size or FILE_HEADER.unpack_from(self._map, 0)[:2] != (MAGIC, VERSION):
+            self._map.close()
+            raise ValueError("not a game log of version {}: {}".format(VERSION, path))
+        self._index, self._count, magic = FOOTER.unpack_from(self._map, size - FOOTER.size)
+        if magic != MAGIC or self._index + self._count * OFFSET.size != size - FOOTER.size:
+            self._map.close()
+            raise ValueError("game log has no index, was it closed?: {}".format(path))
+        self._view = memoryview(self._map)
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """
+        Unmaps the file.
+
+        :return: None
+        """
+        self._view.release()
+        self._map.close()
+
+    def get_offset(self, number):
+        """
+        Returns where a game's header starts in the file. Raises IndexError for a game that isn't in the log.
+
+        :param number: int. Which game, from 0.
+        :return: int
+        """
+        if not 0 <= number < self._count:
+            raise IndexError("game {} not in a log of {} games".format(number, self._count))
+        return OFFSET.unpack_from(self._map, self._index + number * OFFSET.size)[0]
+
+    def get_players(self, number):
+        """
+        Returns the sorted players list of a game.
+
+        :param number: int. Which game, from 0.
+        :return: list of str
+        """
+        return mask_players(GAME_HEADER.unpack_from(self._map, self.get_offset(number))[0])
+
+    def get_turns(self, number):
+        """
+        Returns the packed turns of a game as a memoryview of the mapped file, without copying them.
+
+        :param number: int. Which game, from 0.
+        :return: memoryview
+        """
+        offset = self.get_offset(number)
+        turn_count = GAME_HEADER.unpack_from(self._map, offset)[1]
+        start = offset + GAME_HEADER.size
+        return self._view[start:start + turn_count]
+
+    def iter_turns(self, number):
+        """
+        Returns an iterator over the (player char, step count) turns of a game. The tuples come from TURNS, so none are
+        made while reading.
+
+        :param number: int. Which game, from 0.
+        :return: iterator of tuples
+        """
+        return map(TURNS.__getitem__, self.get_turns(number))
+
+    def get_game(self, number):
+        """
+        Returns a game as (players_list, turns_list) with a real list of tuples, for code that needs one.
+
+        :param number: int. Which game, from 0.
+        :return: tuple of (list of str, list of tuples)
+        """
+        return self.get_players(number), list(self.iter_turns(number))
+
+    def play_game(self, game, number):
+        """
+        Plays a game of the log with play_game(), feeding it the turns straight from the mapped file.
+
+        :param game: LudoGame
+        :param number: int. Which game, from 0.
+        :return: list of str. The positions play_game() returns.
+        """
+        return game.play_game(self.get_players(number), self.iter_turns(number))
+
+    def play_all(self, game=None):
+        """
+        Plays every game of the log in order on one LudoGame and yields the positions of each.
+
+        :param game: LudoGame or None.
+        :return: generator of list of str
+        """
+        game = game if game is not None else LudoGame()
+        for number in range(self._count):
+            yield self.play_game(game, number)
+
+
+def write_games(path, games):
+    """
+    Writes (players_list, turns_list) games, like the jobs of LudoPool.play_games(), to a log file.
+
+    :param path: str
+    :param games: iterable of tuples. Tuple is (players_list, turns_list) for one game.
+    :return: int. Number of games written.
+    """
+    with GameLogWriter(path) as writer:
+        for players_list, turns_list in games:
+            writer.add_game(players_list, turns_list)
+        return writer.get_game_count()
+
+
+def read_jsonl(path):
+    """
+    Reads games from a JSONL file, one JSON object per line: {"players": ["A", "C"], "turns": [["A", 6], ...]}.
+    Blank lines are skipped.
+
+    :param path: str
+    :return: generator of tuples. Tuple is (players_list, turns_list) for one game.
+    """
+    with open(path) as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                record = json.loads(line)
+                yield record["players"], [(player_char, steps) for player_char, steps in record["turns"]]
+
+
+def read_csv(path):
+    """
+    Reads games from a CSV file with the columns game, players, seat, roll and one row per turn, for example
+    "7,AC,A,6". Rows of the same game have to be next to each other. players is the players of the game written
+    together.
+
+    :param path: str
+    :return: generator of tuples. Tuple is (players_list, turns_list) for one game.
+    """
+    with open(path, newline="") as csv_file:
+        current = None
+        players_list = None
+        turns_list = []
+        for row in csv.DictReader(csv_file):
+            if row["game"] != current:
+                if current is not None:
+                    yield players_list, turns_list
+                current = row["game"]
+                players_list = list(row["players"])
+                turns_list = []
+            turns_list.append((row["seat"], int(row["roll"])))
+        if current is not None:
+            yield players_list, turns_list
+
+
+def convert(source, path):
+    """
+    Converts a .jsonl or .csv file of games to a log file.
+
+    :param source: str. Path ending in .jsonl or .csv.
+    :param path: str. Log file to write.
+    :return: int. Number of games written.
+    """
+    if source.endswith(".jsonl"):
+        return write_games(path, read_jsonl(source))
+    if source.endswith(".csv"):
+        return write_games(path, read_csv(source))
+    raise ValueError("can only convert .jsonl and .csv files: {}".format(source))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert games to the packed log format and play them back.")
+    parser.add_argument("log", help="log file to read, or to write when --convert is given")
+    parser.add_argument("--convert", help=".jsonl or .csv file of games to convert to the log")
+    args = parser.parse_args(argv)
+
+    if args.convert:
+        print("wrote {:,} games".format(convert(args.convert, args.log)))
+    log = GameLog(args.log)
+    turns = 0
+    start = time.perf_counter()
+    game = LudoGame()
+    for number in range(len(log)):
+        turns_view = log.get_turns(number)
+        turns += len(turns_view)
+        turns_view.release()
+        log.play_game(game, number)
+    elapsed = time.perf_counter() - start
+    print("games: {:,}  turns: {:,}  turns/second: {:,.0f}".format(len(log), turns, turns / elapsed if elapsed else 0))
+    log.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
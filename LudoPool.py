@@ -0,0 +1,96 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Plays many independent games across a pool of worker processes. Jobs are (players_list, turns_list)
+# pairs, sent to the workers in chunks so pickling costs are shared by many games, and every worker keeps one LudoGame
+# that it reuses for all of its games. Results come back in input order or as soon as each chunk is done.
+
+import concurrent.futures
+import itertools
+import os
+
+from LudoGame import LudoGame
+
+_worker_game = None  # the LudoGame each worker process reuses
+
+
+def start_worker():
+    """
+    Makes the LudoGame a worker process reuses for every game it plays. Runs once in each worker.
+
+    :return: None
+    """
+    global _worker_game
+    _worker_game = LudoGame()
+
+
+def play_chunk(chunk):
+    """
+    Plays a chunk of jobs with the worker's LudoGame.
+
+    :param chunk: list of tuples. Tuple is (players_list, turns_list) for one game.
+    :return: list of list of str. The positions play_game() returns for each job.
+    """
+    if _worker_game is None:
+        start_worker()
+    return [_worker_game.play_game(list(players_list), turns_list) for players_list, turns_list in chunk]
+
+
+def split_chunks(jobs, chunksize):
+    """
+    Groups an iterable of jobs into lists of at most chunksize jobs without reading ahead more than one chunk.
+
+    :param jobs: iterable of tuples. Tuple is (players_list, turns_list).
+    :param chunksize: int. Jobs in each chunk.
+    :return: generator of list of tuples
+    """
+    jobs = iter(jobs)
+    while True:
+        chunk = list(itertools.islice(jobs, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def play_games(jobs, workers=None, chunksize=64, ordered=True):
+    """
+    Plays every job on a process pool and yields the results. Only a few chunks per worker are in flight or waiting
+    for an earlier chunk at a time, so jobs can be a generator that is much longer than what fits in memory.
+
+    :param jobs: iterable of tuples. Tuple is (players_list, turns_list) for one game.
+    :param workers: int or None. Number of worker processes, all cores if None.
+    :param chunksize: int. Jobs sent to a worker at once.
+    :param ordered: True/False. If True, yields positions in the order of jobs. If False, yields (job number, positions)
+        as soon as their chunk is done.
+    :return: generator
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    chunks = enumerate(split_chunks(jobs, chunksize))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=start_worker) as executor:
+        pending = {}  # future -> chunk number
+        finished = {}  # chunk number -> results, waiting for earlier chunks when ordered
+        next_chunk = 0
+        out_of_jobs = False
+        while True:
+            while not out_of_jobs and len(pending) + len(finished) < max_in_flight:  # a slow chunk holds back the rest
+                try:
+                    number, chunk = next(chunks)
+                except StopIteration:
+                    out_of_jobs = True
+                    break
+                pending[executor.submit(play_chunk, chunk)] = number
+            if not pending:
+                return
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                number = pending.pop(future)
+                results = future.result()
+                if ordered:
+                    finished[number] = results
+                else:
+                    for offset, positions in enumerate(results):
+                        yield number * chunksize + offset, positions
+            while next_chunk in finished:  # only does anything when ordered
+                yield from finished.pop(next_chunk)
+                next_chunk += 1
@@ -0,0 +1,295 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A cache of game states for corpora whose turn lists share openings. PrefixCache keeps a trie for every
+# players list whose edges are chunks of stride turns packed one byte each, and its nodes hold CompactGame snapshots of
+# the game after that prefix. play_game() walks the trie as far as the new game's turns match, loads the deepest
+# snapshot, and only plays the turns after it. Every game adds at most one node, right where it leaves the trie, and a
+# node only gets a snapshot once a second game goes through it, so games that share nothing cost one small node and no
+# snapshot. Nodes are kept under a byte budget by evicting the least recently used.
+
+import argparse
+import collections
+import itertools
+import random
+import sys
+import time
+
+from LudoGame import LudoGame, RULE_SETS
+from LudoLog import TURN_BYTES
+from LudoState import CompactGame
+
+STRIDE = 16  # turns per trie edge, snapshots can only be at multiples of it
+MAX_DEPTH = 512  # turns into a game the trie goes, openings are where corpora share turns
+MIN_VISITS = 2  # games through a node before it gets a snapshot
+MAX_BYTES = 32 * 1024 * 1024
+NODE_BYTES = 400  # measured bytes of a node with its dict entries and LRU entry, not counting the key and snapshot
+SNAPSHOT_BYTES = 200  # measured bytes of a CompactGame of a mid-game position
+
+
+class PrefixNode:
+    """
+    One node of the trie: the state after depth turns. key is the packed chunk of turns on the edge from parent.
+    """
+    __slots__ = ("parent", "key", "depth", "children", "snapshot", "visits", "size")
+
+    def __init__(self, parent, key, depth):
+        self.parent = parent
+        self.key = key
+        self.depth = depth
+        self.children = {}
+        self.snapshot = None
+        self.visits = 0
+        self.size = NODE_BYTES + len(key)
+
+
+def pack_chunk(turns, start, stride):
+    """
+    Packs turns start to start + stride - 1 into bytes, one per turn like LudoLog. Returns None if a turn can't be
+    packed, which ends caching for that game.
+
+    :param turns: list of tuples. Tuple is (player char, step count) for that turn.
+    :param start: int. First turn of the chunk.
+    :param stride: int. Turns in the chunk.
+    :return: bytes or None
+    """
+    try:
+        return bytes([TURN_BYTES[turn] for turn in turns[start:start + stride]])
+    except (KeyError, TypeError):
+        return None
+
+
+class PrefixCache:
+    """
+    Plays games like LudoGame.play_game(), starting each one from the deepest cached state its turns share with earlier
+    games. Gives the same positions as play_game(). All games are played on the cache's own LudoGame, a new one with
+    rules (CLASSIC_RULES if None) unless game is given, and the snapshots only hold the board state and the RuleSet, so
+    the policies of that game must not change while the cache is in use.
+    """
+    def __init__(self, max_bytes=MAX_BYTES, stride=STRIDE, max_depth=MAX_DEPTH, min_visits=MIN_VISITS, game=None,
+                 rules=None):
+        self._max_bytes = max_bytes
+        self._stride = stride
+        self._max_depth = max_depth - max_depth % stride
+        self._min_visits = min_visits
+        self._game = game if game is not None else LudoGame(rules=rules)
+        self._roots = {}  # sorted players as a str -> root node
+        self._lru = collections.OrderedDict()  # node -> None, least recently used first
+        self._bytes = 0
+        self._games = 0
+        self._hits = 0  # games that started from a snapshot
+        self._turns_saved = 0
+        self._turns_played = 0
+        self._snapshots = 0
+        self._evictions = 0
+
+    def get_game(self):
+        """
+        Returns the LudoGame the cache plays on.
+
+        :return: LudoGame
+        """
+        return self._game
+
+    def get_bytes(self):
+        """
+        Returns the estimated bytes the trie takes now.
+
+        :return: int
+        """
+        return self._bytes
+
+    def get_stats(self):
+        """
+        Returns the counters of the cache: games played, hits (games started from a snapshot) and hit rate, turns saved
+        and turns played, snapshots taken, nodes evicted, nodes and estimated bytes in the trie.
+
+        :return: dict
+        """
+        total_turns = self._turns_saved + self._turns_played
+        return {
+            "games": self._games,
+            "hits": self._hits,
+            "hit_rate": self._hits / self._games if self._games else 0.0,
+            "turns_saved": self._turns_saved,
+            "turns_played": self._turns_played,
+            "saved_rate": self._turns_saved / total_turns if total_turns else 0.0,
+            "snapshots": self._snapshots,
+            "evictions": self._evictions,
+            "nodes": len(self._lru),
+            "bytes": self._bytes,
+        }
+
+    def play_game(self, players_list, turns_list):
+        """
+        Plays a game and returns the same positions as LudoGame.play_game(). Doesn't sort the caller's players_list.
+
+        :param players_list: list of str. List of "A", "B", "C", or "D" players.
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :return: list of str.
+        """
+        players_list = sorted(players_list)
+        game = self._game
+        stride = self._stride
+        turns = iter(turns_list)
+        head = list(itertools.islice(turns, self._max_depth))  # the part of the game the trie can cover
+        self._games += 1
+
+        root = self._roots.get("".join(players_list))
+        if root is None:
+            root = self._roots["".join(players_list)] = PrefixNode(None, b"", 0)
+        node = root
+        resume = root
+        while node.depth + stride <= len(head):  # follows the turns down the trie as far as it has them
+            child = node.children.get(pack_chunk(head, node.depth, stride))
+            if child is None:
+                break
+            node = child
+            if node.snapshot is not None:
+                resume = node
+
+        if resume.snapshot is not None:
+            resume.snapshot.to_game(game)
+            self._hits += 1
+            self._turns_saved += resume.depth
+        else:
+            game.reset_game(players_list)
+        winners = game.get_winners()
+        last_winner = len(players_list) - 1
+        play_turn = game.play_turn
+        node = resume
+        caching = True
+        depth = resume.depth
+        for player_char, steps in itertools.chain(head[depth:], turns):
+            if len(winners) == last_winner:  # every Player but 1 finishes
+                break
+            play_turn(player_char, steps)
+            depth += 1
+            self._turns_played += 1
+            if caching and depth % stride == 0:  # reached the next node down the trie
+                child = self.visit(node, head, depth - stride) if depth <= self._max_depth else None
+                caching = child is not None and child.visits > 1  # a game adds at most one new node
+                node = child or node
+        self.touch_path(node)
+        self.evict()
+        return game.get_positions(players_list)
+
+    def visit(self, node, head, start):
+        """
+        Counts a game going from node down the chunk of head starting at start, making the child node if it's new and
+        giving it a snapshot of the game once enough games went through it.
+
+        :param node: PrefixNode. The node at depth start.
+        :param head: list of tuples. The turns the trie covers.
+        :param start: int. First turn of the chunk.
+        :return: PrefixNode or None. The child, or None if the chunk can't be packed.
+        """
+        key = pack_chunk(head, start, self._stride)
+        if key is None:
+            return None
+        child = node.children.get(key)
+        if child is None:
+            child = node.children[key] = PrefixNode(node, key, start + self._stride)
+            self._lru[child] = None
+            self._bytes += child.size
+        child.visits += 1
+        if child.snapshot is None and child.visits >= self._min_visits:
+            child.snapshot = CompactGame.from_game(self._game)
+            child.size += SNAPSHOT_BYTES
+            self._bytes += SNAPSHOT_BYTES
+            self._snapshots += 1
+        return child
+
+    def touch_path(self, node):
+        """
+        Marks node and every node above it as just used, deepest first, so a parent is always used more recently than
+        its children and eviction always takes a leaf.
+
+        :param node: PrefixNode
+        :return: None
+        """
+        while node.parent is not None:
+            self._lru.move_to_end(node)
+            node = node.parent
+
+    def evict(self):
+        """
+        Drops least recently used nodes until the trie fits in max_bytes.
+
+        :return: None
+        """
+        while self._bytes > self._max_bytes and self._lru:
+            self.remove(next(iter(self._lru)))
+
+    def remove(self, node):
+        """
+        Takes a node and everything below it out of the trie.
+
+        :param node: PrefixNode
+        :return: None
+        """
+        for child in list(node.children.values()):
+            self.remove(child)
+        del node.parent.children[node.key]
+        del self._lru[node]
+        self._bytes -= node.size
+        self._evictions += 1
+
+
+def make_corpus(num_games, openings=50, opening_turns=(48, 160), total_turns=400, players_count=4, seed=0):
+    """
+    Makes a corpus of games that share openings: every game starts with one of the scripted openings, picked at random,
+    and goes on with its own rolls.
+
+    :param num_games: int. Games in the corpus.
+    :param openings: int. Number of different openings.
+    :param opening_turns: tuple of (int, int). Shortest and longest opening.
+    :param total_turns: int. Turns in every game.
+    :param players_count: int. Players in every game, the first seats of "ABCD".
+    :param seed: int. Seed for the random number generator.
+    :return: list of tuples. Tuple is (players_list, turns_list) for one game.
+    """
+    rng = random.Random(seed)
+    players_list = list("ABCD"[:players_count])
+
+    def rolls(count):
+        return [(players_list[num % players_count], rng.randint(1, 6)) for num in range(count)]
+    scripts = [rolls(rng.randint(*opening_turns)) for _ in range(openings)]
+    corpus = []
+    for _ in range(num_games):
+        opening = rng.choice(scripts)
+        corpus.append((list(players_list), opening + rolls(total_turns - len(opening))))
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a corpus with shared openings through a PrefixCache.")
+    parser.add_argument("--games", type=int, default=5000, help="games in the corpus")
+    parser.add_argument("--openings", type=int, default=50, help="different openings the games start with")
+    parser.add_argument("--turns", type=int, default=400, help="turns in every game")
+    parser.add_argument("--max-kb", type=int, default=MAX_BYTES // 1024, help="memory budget of the trie in KB")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the corpus")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS), help="house rules to play with")
+    args = parser.parse_args(argv)
+
+    rules = RULE_SETS[args.rules]
+    corpus = make_corpus(args.games, args.openings, total_turns=args.turns, seed=args.seed)
+    game = LudoGame(rules=rules)
+    start = time.perf_counter()
+    expected = [game.play_game(list(players_list), turns_list) for players_list, turns_list in corpus]
+    plain = time.perf_counter() - start
+    cache = PrefixCache(args.max_kb * 1024, rules=rules)
+    start = time.perf_counter()
+    positions = [cache.play_game(players_list, turns_list) for players_list, turns_list in corpus]
+    cached = time.perf_counter() - start
+    stats = cache.get_stats()
+    print("games: {:,}  same positions as play_game(): {}".format(stats["games"], positions == expected))
+    print("hit rate: {:.1%}  turns saved: {:,} of {:,} ({:.1%})".format(
+        stats["hit_rate"], stats["turns_saved"], stats["turns_saved"] + stats["turns_played"], stats["saved_rate"]))
+    print("snapshots: {:,}  evictions: {:,}  nodes: {:,}  trie: {:,} KB".format(
+        stats["snapshots"], stats["evictions"], stats["nodes"], stats["bytes"] // 1024))
+    print("play_game(): {:.3f} s  PrefixCache: {:.3f} s  ({:.2f}x)".format(plain, cached, plain / cached))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Opt-in instrumentation of a LudoGame. GameProfiler wraps the methods of one game's objects while it is
+# enabled and puts them back when it is disabled, so a game that isn't being profiled runs the exact same code as
+# before. While enabled it counts turns, moves, kicks, stacks, bounces, skipped turns, and exceptions, times every phase
+# of a turn, and can record each call as a Chrome trace event (open the file in chrome://tracing or Perfetto).
+# ProfileStats from many games or worker processes merge into one summary.
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+from LudoGame import LudoGame
+
+# Phases timed by GameProfiler, in the order they are reported. Times include the phases called inside them.
+PHASES = ("play_turn", "get_player_by_position", "choose_move", "legal_moves", "get_token_move", "get_space_name",
+          "apply_move", "move_piece", "move_token")
+COUNTERS = ("turns", "skipped_turns", "moves", "kicks", "kicked_tokens", "stacks", "bounces", "finishes",
+            "exceptions")
+MAX_TRACE_EVENTS = 1000000  # events kept by one GameProfiler, the rest are only counted
+
+
+class ProfileStats:
+    """
+    Counters and per-phase call counts and times. Everything adds up, so stats from any number of games or worker
+    processes can be merged in any order.
+    """
+    def __init__(self):
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._calls = dict.fromkeys(PHASES, 0)
+        self._seconds = dict.fromkeys(PHASES, 0.0)
+        self._exception_types = {}  # exception class name -> count
+        self._games = 0
+
+    def count(self, counter, amount=1):
+        """
+        Adds to a counter.
+
+        :param counter: str. One of COUNTERS.
+        :param amount: int
+        :return: None
+        """
+        self._counters[counter] += amount
+
+    def add_call(self, phase, seconds):
+        """
+        Adds one call of a phase and the time it took.
+
+        :param phase: str. One of PHASES.
+        :param seconds: float
+        :return: None
+        """
+        self._calls[phase] += 1
+        self._seconds[phase] += seconds
+
+    def add_exception(self, error):
+        """
+        Counts an exception raised out of a timed phase.
+
+        :param error: Exception
+        :return: None
+        """
+        self._counters["exceptions"] += 1
+        name = type(error).__name__
+        self._exception_types[name] = self._exception_types.get(name, 0) + 1
+
+    def add_game(self):
+        """
+        Counts one profiled game.
+
+        :return: None
+        """
+        self._games += 1
+
+    def merge(self, other):
+        """
+        Adds the totals of another ProfileStats to this one.
+
+        :param other: ProfileStats
+        :return: None
+        """
+        for counter, amount in other._counters.items():
+            self._counters[counter] += amount
+        for phase in PHASES:
+            self._calls[phase] += other._calls[phase]
+            self._seconds[phase] += other._seconds[phase]
+        for name, count in other._exception_types.items():
+            self._exception_types[name] = self._exception_types.get(name, 0) + count
+        self._games += other._games
+
+    def get_summary(self):
+        """
+        Returns the totals as a dictionary: games, counters, exceptions by type, and calls, seconds, and microseconds
+        per call of every phase that was called.
+
+        :return: dict
+        """
+        phases = {}
+        for phase in PHASES:
+            calls = self._calls[phase]
+            if calls:
+                phases[phase] = {"calls": calls, "seconds": self._seconds[phase],
+                                 "us_per_call": self._seconds[phase] / calls * 1e6}
+        return {
+            "games": self._games,
+            "counters": dict(self._counters),
+            "exception_types": dict(self._exception_types),
+            "phases": phases,
+        }
+
+
+class GameProfiler:
+    """
+    Instruments one LudoGame. enable() replaces methods of the game, its Board, and its Players with timed wrappers and
+    wraps the policy of every seat, and disable() removes them again. Policies set with set_policy() while enabled are
+    not timed.
+    """
+    def __init__(self, game, stats=None, trace=False, max_events=MAX_TRACE_EVENTS):
+        self._game = game
+        self._stats = stats if stats is not None else ProfileStats()
+        self._trace = trace
+        self._max_events = max_events
+        self._events = []
+        self._dropped_events = 0
+        self._start = time.perf_counter()
+        self._wrapped = []  # objects that have wrapper attributes, the names of the attributes, and what they hid
+        self._policies = None  # policies before enable(), by seat
+        self._last_error = None  # so an exception is counted once, not once per phase it passes through
+
+    def get_game(self):
+        """
+        Returns the LudoGame this profiler instruments.
+
+        :return: LudoGame
+        """
+        return self._game
+
+    def get_stats(self):
+        """
+        Returns the ProfileStats this profiler adds to.
+
+        :return: ProfileStats
+        """
+        return self._stats
+
+    def get_summary(self):
+        """
+        Returns the summary of the stats, with the number of trace events kept and dropped.
+
+        :return: dict
+        """
+        summary = self._stats.get_summary()
+        summary["trace_events"] = len(self._events)
+        summary["dropped_trace_events"] = self._dropped_events
+        return summary
+
+    def is_enabled(self):
+        """
+        Returns True while the game is instrumented.
+
+        :return: True/False
+        """
+        return self._policies is not None
+
+    def enable(self):
+        """
+        Instruments the game. Does nothing if it already is.
+
+        :return: None
+        """
+        if self.is_enabled():
+            return
+        game = self._game
+        self.wrap(game, "play_turn", self.wrap_turn(game.play_turn))
+        for name in ("get_player_by_position", "legal_moves", "get_token_move", "apply_move", "move_token"):
+            self.wrap(game, name, self.wrap_phase(name, getattr(game, name)))
+        board = game.get_board()
+        self.wrap(board, "move_piece", self.wrap_phase("move_piece", board.move_piece))
+        for player in game.get_players().values():
+            self.wrap(player, "get_space_name", self.wrap_phase("get_space_name", player.get_space_name))
+        self._policies = {char: game.get_policy(char) for char in game.get_players()}
+        for char, policy in self._policies.items():
+            game.set_policy(char, TimedPolicy(policy, self.wrap_phase("choose_move", policy.choose_move)))
+
+    def disable(self):
+        """
+        Puts back the methods and policies the game had before enable(). Does nothing if it isn't enabled.
+
+        :return: None
+        """
+        if not self.is_enabled():
+            return
+        for target, name, hidden in self._wrapped:
+            if hidden is None:
+                delattr(target, name)  # the class method shows through again
+            else:
+                setattr(target, name, hidden)  # like the play_turn() a RuleSet put on the game
+        self._wrapped = []
+        for char, policy in self._policies.items():
+            self._game.set_policy(char, policy)
+        self._policies = None
+
+    def wrap(self, target, name, wrapper):
+        """
+        Puts a wrapper on an object as an attribute, where it hides the class method of the same name, or the attribute
+        the object already had, which disable() puts back.
+
+        :param target: object
+        :param name: str
+        :param wrapper: function
+        :return: None
+        """
+        self._wrapped.append((target, name, vars(target).get(name)))
+        setattr(target, name, wrapper)
+
+    def record(self, phase, start, seconds):
+        """
+        Adds one timed call to the stats and, when tracing, a complete event to the trace.
+
+        :param phase: str
+        :param start: float. perf_counter() when the call started.
+        :param seconds: float
+        :return: None
+        """
+        self._stats.add_call(phase, seconds)
+        if self._trace:
+            if len(self._events) < self._max_events:
+                self._events.append((phase, start, seconds))
+            else:
+                self._dropped_events += 1
+
+    def wrap_phase(self, phase, method):
+        """
+        Returns a wrapper that times every call of a method as a phase and counts the exceptions it raises.
+
+        :param phase: str. One of PHASES.
+        :param method: bound method
+        :return: function
+        """
+        clock = time.perf_counter
+        record = self.record
+
+        def timed(*args):
+            start = clock()
+            try:
+                return method(*args)
+            except Exception as error:
+                if error is not self._last_error:
+                    self._last_error = error
+                    self._stats.add_exception(error)
+                raise
+            finally:
+                record(phase, start, clock() - start)
+        return timed
+
+    def wrap_turn(self, play_turn):
+        """
+        Returns a wrapper for play_turn() that times it and counts what each turn did from the moves it returns.
+
+        :param play_turn: bound method
+        :return: function
+        """
+        timed = self.wrap_phase("play_turn", play_turn)
+        players = self._game.get_players()
+        count = self._stats.count
+
+        def counted(player_char, steps):
+            player = players.get(player_char.upper()) if isinstance(player_char, str) else None
+            was_stacked = player.get_stacked_count() if player is not None else 0
+            moves = timed(player_char, steps)
+            count("turns")
+            if not moves:
+                count("skipped_turns")
+                return moves
+            count("moves", len(moves))
+            for move in moves:
+                if move.kicked:
+                    count("kicks")
+                    count("kicked_tokens", len(move.kicked))
+                if move.bounced:
+                    count("bounces")
+                if move.finished:
+                    count("finishes")
+            if player.get_stacked_count() > was_stacked:
+                count("stacks")
+            return moves
+        return counted
+
+    def get_trace(self):
+        """
+        Returns the recorded calls as Chrome trace-event JSON data, with the counters as a counter event at the end.
+
+        :return: dict
+        """
+        events = [{"name": phase, "cat": "ludo", "ph": "X", "ts": (start - self._start) * 1e6,
+                   "dur": seconds * 1e6, "pid": os.getpid(), "tid": 0} for phase, start, seconds in self._events]
+        events.append({"name": "counters", "ph": "C", "ts": (time.perf_counter() - self._start) * 1e6,
+                       "pid": os.getpid(), "tid": 0, "args": self._stats.get_summary()["counters"]})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path):
+        """
+        Writes get_trace() to a JSON file.
+
+        :param path: str
+        :return: None
+        """
+        with open(path, "w") as trace_file:
+            json.dump(self.get_trace(), trace_file)
+
+
+class TimedPolicy:
+    """
+    Stands in for a seat's policy while a GameProfiler is enabled and times its choose_move().
+    """
+    def __init__(self, policy, timed_choose_move):
+        self._policy = policy
+        self.choose_move = timed_choose_move
+
+    def get_policy(self):
+        """
+        Returns the policy being timed.
+
+        :return: policy object
+        """
+        return self._policy
+
+
+def profile_game(players_list, turns_list, stats=None, game=None):
+    """
+    Plays one game with play_game() under a GameProfiler.
+
+    :param players_list: list of str. List of "A", "B", "C", or "D" players.
+    :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+    :param stats: ProfileStats or None. Stats to add to, new ones if None.
+    :param game: LudoGame or None.
+    :return: ProfileStats
+    """
+    profiler = GameProfiler(game if game is not None else LudoGame(), stats)
+    profiler.enable()
+    try:
+        profiler.get_game().play_game(list(players_list), turns_list)
+    finally:
+        profiler.disable()
+    profiler.get_stats().add_game()
+    return profiler.get_stats()
+
+
+def profile_chunk(chunk):
+    """
+    Profiles a chunk of (players_list, turns_list) jobs on one LudoGame. Runs in a worker process.
+
+    :param chunk: list of tuples
+    :return: ProfileStats
+    """
+    stats = ProfileStats()
+    game = LudoGame()
+    for players_list, turns_list in chunk:
+        profile_game(players_list, turns_list, stats, game)
+    return stats
+
+
+def profile_games(jobs, workers=1, chunksize=64):
+    """
+    Profiles many games, in this process or across worker processes, and merges the stats of every chunk.
+
+    :param jobs: iterable of tuples. Tuple is (players_list, turns_list) for one game.
+    :param workers: int or None. Number of worker processes, all cores if None. 1 plays in this process.
+    :param chunksize: int. Jobs per chunk.
+    :return: ProfileStats
+    """
+    from LudoPool import split_chunks
+
+    stats = ProfileStats()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in split_chunks(jobs, chunksize):
+            stats.merge(profile_chunk(chunk))
+        return stats
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_stats in executor.map(profile_chunk, split_chunks(jobs, chunksize)):
+            stats.merge(chunk_stats)
+    return stats
+
+
+def main(argv=None):
+    from LudoBenchmark import make_turns
+
+    parser = argparse.ArgumentParser(description="Profile where the time of play_game() goes.")
+    parser.add_argument("--games", type=int, default=200, help="number of games")
+    parser.add_argument("--turns", type=int, default=400, help="turns in every game")
+    parser.add_argument("--players", default="ABCD", help="players in the game, for example AC")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--trace", help="also write a Chrome trace of the first game to this file")
+    args = parser.parse_args(argv)
+
+    players_list = list(args.players.upper())
+    jobs = [(players_list, make_turns(players_list, args.turns, seed=num)) for num in range(args.games)]
+    if args.trace:
+        profiler = GameProfiler(LudoGame(), trace=True)
+        profiler.enable()
+        profiler.get_game().play_game(list(players_list), jobs[0][1])
+        profiler.disable()
+        profiler.write_trace(args.trace)
+    summary = profile_games(jobs, args.workers).get_summary()
+    print("games: {:,}".format(summary["games"]))
+    print("  ".join("{}: {:,}".format(counter, amount) for counter, amount in summary["counters"].items()))
+    print("{:<24}{:>12}{:>12}{:>14}".format("phase", "calls", "seconds", "us/call"))
+    for phase, timing in summary["phases"].items():
+        print("{:<24}{:>12,}{:>12.3f}{:>14.2f}".format(phase, timing["calls"], timing["seconds"],
+                                                        timing["us_per_call"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A replay index for random access into long games. ReplayIndex plays a game once and keeps a keyframe of
+# the whole state (a CompactGame) every interval turns, and between keyframes a delta per turn: a byte with a bit for
+# every token whose step count changed, then the new step count + 1 of each of those tokens. positions_at(k) starts at
+# the keyframe at or before turn k and applies at most interval - 1 deltas, so it costs the same at turn 250,000 as at
+# turn 10, and gives the same list play_game() returns for the first k turns. A query a little after the last one goes
+# on from where that one stopped, so stepping forward costs one delta. The index also keeps the turns, one byte each
+# like LudoLog, so game_at(k) can load a keyframe and play the rest of the way to a whole LudoGame. interval trades
+# memory and disk for speed: keyframes take about 30 bytes each and deltas about 2 bytes a turn. An index can be saved
+# to a file and loaded back.
+
+import argparse
+import random
+import struct
+import sys
+import time
+
+from LudoGame import LudoGame, MIN_STEPS, RULE_SETS, SPACE_TABLES
+from LudoLog import GameLog, TURNS, encode_turn, mask_players, players_mask
+from LudoState import CompactGame, SEATS, TOKENS
+
+MAGIC = b"LUDR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQI")  # magic, version, players mask, interval, number of turns, number of keyframes
+KEYFRAME = struct.Struct("<Q")  # offset of the keyframe's first delta, then its CompactGame fields
+FIELD_SIZE = struct.Struct("<H")  # bytes of one CompactGame field
+INTERVAL = 1024  # turns between keyframes
+TOKEN_COUNT = len(SEATS) * len(TOKENS)  # tokens of every seat, numbered like LudoState.token_id()
+FIELD_COUNT = len(CompactGame().get_fields())
+
+
+def pack_state(state):
+    """
+    Packs the fields of a CompactGame as little-endian ints of just the bytes they need, each after its size.
+
+    :param state: CompactGame
+    :return: bytes
+    """
+    parts = []
+    for field in state.get_fields():
+        field_bytes = field.to_bytes((field.bit_length() + 7) // 8, "little")
+        parts.append(FIELD_SIZE.pack(len(field_bytes)))
+        parts.append(field_bytes)
+    return b"".join(parts)
+
+
+def unpack_state(data, offset, rules=None):
+    """
+    Unpacks a CompactGame packed by pack_state().
+
+    :param data: bytes
+    :param offset: int. Where the packed state starts.
+    :param rules: RuleSet or None. The RuleSet of the game the state is from, CLASSIC_RULES if None.
+    :return: tuple of (CompactGame, int). The state and the offset right after it.
+    """
+    fields = []
+    for _ in range(FIELD_COUNT):
+        size = FIELD_SIZE.unpack_from(data, offset)[0]
+        offset += FIELD_SIZE.size
+        fields.append(int.from_bytes(data[offset:offset + size], "little"))
+        offset += size
+    return CompactGame(*fields, rules), offset
+
+
+class ReplayIndex:
+    """
+    Keyframes and per-turn deltas of one game on the classic layout, for the positions at any turn without replaying
+    the game from the start. Turns are added with add_turn() or add_turns(), and are played the way play_game() plays
+    them: once every Player but 1 is done, the rest of the turns are recorded but change nothing. Raises ValueError for
+    a turn LudoLog can't pack. The turns are played on game, or on a new LudoGame with rules (CLASSIC_RULES if None).
+    """
+    def __init__(self, players_list, interval=INTERVAL, game=None, rules=None):
+        if interval < 1:
+            raise ValueError("interval must be at least 1: {!r}".format(interval))
+        self._players_list = sorted(players_list)
+        self._interval = interval
+        self._game = game if game is not None else LudoGame(rules=rules)
+        self._game.reset_game(self._players_list)
+        self._players = [self._game.get_players()[char] for char in SEATS]
+        self._steps = [MIN_STEPS] * TOKEN_COUNT  # step counts after the last turn added
+        self._turns = bytearray()
+        self._deltas = bytearray()
+        self._keyframes = [(0, CompactGame.from_game(self._game))]  # (offset of first delta, state) per keyframe
+        self._cursor = (0, 0, list(self._steps))  # turn, delta offset, and step counts of the last query
+
+    def __len__(self):
+        return len(self._turns)
+
+    def get_players(self):
+        """
+        Returns the sorted players list of the game.
+
+        :return: list of str
+        """
+        return list(self._players_list)
+
+    def get_interval(self):
+        """
+        Returns the number of turns between keyframes.
+
+        :return: int
+        """
+        return self._interval
+
+    def get_sizes(self):
+        """
+        Returns the bytes the index takes in its file: the turns, the deltas, the keyframes, and the total.
+
+        :return: dict
+        """
+        keyframes = sum(KEYFRAME.size + len(pack_state(state)) for _, state in self._keyframes)
+        return {
+            "turns": len(self._turns),
+            "deltas": len(self._deltas),
+            "keyframes": keyframes,
+            "total": HEADER.size + len(self._turns) + len(self._deltas) + keyframes + KEYFRAME.size,
+        }
+
+    def add_turn(self, player_char, steps):
+        """
+        Plays one more turn of the game and records its delta, and a keyframe after every interval turns.
+
+        :param player_char: str. "A", "B", "C", or "D" for the Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: None
+        """
+        turn_byte = encode_turn(player_char, steps)
+        game = self._game
+        if len(game.get_winners()) != len(self._players_list) - 1:  # play_game() stops once every Player but 1 is done
+            game.play_turn(player_char, steps)
+        mask = 0
+        changed = []
+        old_steps = self._steps
+        for seat_index, player in enumerate(self._players):
+            for token_index, new_steps in enumerate(player.get_step_counts()):
+                token = seat_index * len(TOKENS) + token_index
+                if old_steps[token] != new_steps:
+                    old_steps[token] = new_steps
+                    mask |= 1 << token
+                    changed.append(new_steps - MIN_STEPS)
+        self._turns.append(turn_byte)
+        self._deltas.append(mask)
+        self._deltas.extend(changed)
+        if len(self._turns) % self._interval == 0:
+            self._keyframes.append((len(self._deltas), CompactGame.from_game(game)))
+
+    def add_turns(self, turns_list):
+        """
+        Adds every turn of turns_list with add_turn().
+
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :return: None
+        """
+        add_turn = self.add_turn
+        for player_char, steps in turns_list:
+            add_turn(player_char, steps)
+
+    def seek(self, turn):
+        """
+        Returns the delta offset and step counts after the first turn turns. Starts from the last query if that is in
+        the same stretch between keyframes and not after turn, otherwise from the keyframe at or before turn.
+
+        :param turn: int. From 0 to len(self).
+        :return: tuple of (int, list of int)
+        """
+        if not 0 <= turn <= len(self._turns):
+            raise IndexError("turn {} is out of range of a game of {} turns".format(turn, len(self._turns)))
+        keyframe_turn = turn - turn % self._interval
+        cursor_turn, offset, steps = self._cursor
+        if not keyframe_turn <= cursor_turn <= turn:
+            offset, state = self._keyframes[turn // self._interval]
+            cursor_turn = keyframe_turn
+            steps = [state.get_token_steps(token // len(TOKENS), token % len(TOKENS)) for token in range(TOKEN_COUNT)]
+        deltas = self._deltas
+        for _ in range(turn - cursor_turn):
+            mask = deltas[offset]
+            offset += 1
+            token = 0
+            while mask:
+                if mask & 1:
+                    steps[token] = deltas[offset] + MIN_STEPS
+                    offset += 1
+                mask >>= 1
+                token += 1
+        self._cursor = (turn, offset, steps)
+        return offset, steps
+
+    def steps_at(self, turn):
+        """
+        Returns the step count of every token after the first turn turns, p then q of seat "A" first, -1 for the tokens
+        of seats not in play.
+
+        :param turn: int. From 0 to len(self).
+        :return: list of int
+        """
+        return list(self.seek(turn)[1])
+
+    def positions_at(self, turn):
+        """
+        Returns what play_game() returns for the players list and the first turn turns of the game.
+
+        :param turn: int. From 0 to len(self).
+        :return: list of str
+        """
+        steps = self.seek(turn)[1]
+        positions = []
+        for char in self._players_list:
+            names = SPACE_TABLES[char][0]
+            token = SEATS.index(char) * len(TOKENS)
+            for token_index in range(len(TOKENS)):
+                positions.append(names[steps[token + token_index] - MIN_STEPS])
+        return positions
+
+    def game_at(self, turn, game=None):
+        """
+        Returns a LudoGame in the whole state the game was in after the first turn turns: the keyframe at or before
+        turn, with the turns after it played.
+
+        :param turn: int. From 0 to len(self).
+        :param game: LudoGame or None. Loaded with the state if given, otherwise a new LudoGame with the index's
+                     RuleSet is made.
+        :return: LudoGame
+        """
+        if not 0 <= turn <= len(self._turns):
+            raise IndexError("turn {} is out of range of a game of {} turns".format(turn, len(self._turns)))
+        keyframe_turn = turn - turn % self._interval
+        game = self._keyframes[turn // self._interval][1].to_game(game)
+        game.iter_play_game(self._players_list, map(TURNS.__getitem__, self._turns[keyframe_turn:turn]))
+        return game
+
+    def to_bytes(self):
+        """
+        Packs the index: a header, the keyframes, the turns, and the deltas.
+
+        :return: bytes
+        """
+        parts = [HEADER.pack(MAGIC, VERSION, players_mask(self._players_list), self._interval, len(self._turns),
+                             len(self._keyframes))]
+        for offset, state in self._keyframes:
+            parts.append(KEYFRAME.pack(offset))
+            parts.append(pack_state(state))
+        parts.append(bytes(self._turns))
+        parts.append(KEYFRAME.pack(len(self._deltas)))
+        parts.append(bytes(self._deltas))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, game=None, rules=None):
+        """
+        Unpacks an index packed by to_bytes(). Raises ValueError if data isn't a whole index of this version. Turns
+        added after loading go on from the state of the last keyframe and the turns after it. The index doesn't hold
+        the RuleSet, so it has to be loaded with the rules (or a game with the rules) it was made with.
+
+        :param data: bytes
+        :param game: LudoGame or None. The game the index plays more turns on.
+        :param rules: RuleSet or None. The house rules of a new game if game is None, CLASSIC_RULES if None.
+        :return: ReplayIndex
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("replay index is too short")
+        magic, version, mask, interval, turn_count, keyframe_count = HEADER.unpack_from(data, 0)
+        if (magic, version) != (MAGIC, VERSION):
+            raise ValueError("not a replay index of version {}".format(VERSION))
+        try:
+            index = cls(mask_players(mask), interval, game, rules)
+            keyframes = []
+            offset = HEADER.size
+            for _ in range(keyframe_count):
+                delta_offset = KEYFRAME.unpack_from(data, offset)[0]
+                state, offset = unpack_state(data, offset + KEYFRAME.size, index._game.get_rules())
+                keyframes.append((delta_offset, state))
+            turns = data[offset:offset + turn_count]
+            offset += turn_count
+            delta_size = KEYFRAME.unpack_from(data, offset)[0]
+            offset += KEYFRAME.size
+        except struct.error:
+            raise ValueError("replay index is too short")
+        if len(turns) != turn_count or offset + delta_size != len(data):
+            raise ValueError("replay index has {} bytes instead of {}".format(len(data), offset + delta_size))
+        index._keyframes = keyframes
+        index._turns = bytearray(turns)
+        index._deltas = bytearray(data[offset:])
+        index._steps = index.steps_at(turn_count)
+        index.game_at(turn_count, index._game)
+        return index
+
+    def save(self, path):
+        """
+        Writes the index to a file.
+
+        :param path: str
+        :return: None
+        """
+        with open(path, "wb") as index_file:
+            index_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path, game=None, rules=None):
+        """
+        Reads an index written by save().
+
+        :param path: str
+        :param game: LudoGame or None. The game the index plays more turns on.
+        :param rules: RuleSet or None. The house rules of a new game if game is None, CLASSIC_RULES if None.
+        :return: ReplayIndex
+        """
+        with open(path, "rb") as index_file:
+            return cls.from_bytes(index_file.read(), game, rules)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a replay index of a long game and time random access into it.")
+    parser.add_argument("--log", help="game log file (see LudoLog.py) to take the game from, random rolls if not given")
+    parser.add_argument("--game", type=int, default=0, help="which game of the log")
+    parser.add_argument("--players", default="ABCD", help="seats in play for random rolls")
+    parser.add_argument("--turns", type=int, default=300000, help="turns of random rolls")
+    parser.add_argument("--interval", type=int, default=INTERVAL, help="turns between keyframes")
+    parser.add_argument("--queries", type=int, default=2000, help="random turns to look up")
+    parser.add_argument("--save", help="file to write the index to")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random number generator")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS), help="house rules to play with")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    if args.log:
+        log = GameLog(args.log)
+        players_list, turns_list = log.get_game(args.game)
+        log.close()
+    else:
+        players_list = sorted(args.players.upper())
+        turns_list = [(players_list[num % len(players_list)], rng.randint(1, 6)) for num in range(args.turns)]
+    start = time.perf_counter()
+    index = ReplayIndex(players_list, args.interval, rules=RULE_SETS[args.rules])
+    index.add_turns(turns_list)
+    build = time.perf_counter() - start
+    sizes = index.get_sizes()
+    print("{:,} turns indexed in {:.2f} s: {:,} bytes ({:.2f} per turn), {:,} of them keyframes".format(
+        len(index), build, sizes["total"], sizes["total"] / max(len(index), 1), sizes["keyframes"]))
+    if args.save:
+        index.save(args.save)
+
+    queries = [rng.randint(0, len(index)) for _ in range(args.queries)]
+    start = time.perf_counter()
+    for turn in queries:
+        index.positions_at(turn)
+    random_access = (time.perf_counter() - start) / max(len(queries), 1)
+    forward_turns = range(max(0, len(index) - args.queries), len(index) + 1)  # a short game has fewer turns to step
+    start = time.perf_counter()
+    for turn in forward_turns:
+        index.positions_at(turn)
+    forward = (time.perf_counter() - start) / len(forward_turns)
+    game = LudoGame(rules=RULE_SETS[args.rules])
+    checks = queries[:20]
+    start = time.perf_counter()
+    same = all(game.play_game(list(players_list), turns_list[:turn]) == index.positions_at(turn) for turn in checks)
+    replay = (time.perf_counter() - start) / max(len(checks), 1)
+    print("positions_at(): {:.1f} us at a random turn, {:.1f} us stepping forward".format(
+        random_access * 1e6, forward * 1e6))
+    print("play_game() of the first k turns: {:.1f} us at a random turn, same positions: {}".format(
+        replay * 1e6, same))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
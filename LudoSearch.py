@@ -0,0 +1,497 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A search-based bot for choosing which token to move. Uses expectiminimax: the Player to move picks the
+# token that is best for it, the opponents pick what is worst for it, and every die roll in between is a chance node
+# averaged over the 6 rolls, with Star1 pruning at chance nodes. Positions are hashed with Zobrist keys into a
+# fixed-size transposition table that keeps the deeper result of a slot, and the search stops at a node or time budget.
+# The keys, the evaluation, and the moves are those of the classic board and turns, so the search only plays games on
+# CLASSIC_LAYOUT without the three_sixes rule.
+
+import argparse
+import random
+import sys
+import time
+
+from LudoGame import LudoGame, Player, CLASSIC_LAYOUT
+
+SEATS = "ABCD"
+LOWEST = -1.0  # evaluate() always gives a value from LOWEST to HIGHEST
+HIGHEST = 1.0
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+CHECK_EVERY = 256  # nodes between checks of the time budget
+
+
+def make_zobrist_keys(seed=162):
+    """
+    Makes the random 64 bit keys XORed together into a position's key: one for every token at every step count, one
+    for every doubled Player, one for every Player to move, one for every roll, and one for a bonus roll. The keys of
+    the Player a search is for and of every Player in play tell apart results of searches that score differently.
+
+    :param seed: int. Seed for the keys so they are the same every run.
+    :return: dict of str to list of int
+    """
+    rng = random.Random(seed)
+    return {
+        "token": [[rng.getrandbits(64) for _ in range(59)] for _ in range(8)],  # step count + 1 is 0 - 58
+        "doubled": [rng.getrandbits(64) for _ in range(4)],
+        "to_move": [rng.getrandbits(64) for _ in range(4)],
+        "roll": [rng.getrandbits(64) for _ in range(7)],
+        "bonus": rng.getrandbits(64),
+        "root": [rng.getrandbits(64) for _ in range(4)],
+        "in_play": [rng.getrandbits(64) for _ in range(4)],
+    }
+
+
+ZOBRIST = make_zobrist_keys()
+
+
+def position_key(players):
+    """
+    Returns the Zobrist key of the token positions and doubled flags of the Players in play.
+
+    :param players: list of Player. The Players in play.
+    :return: int
+    """
+    token_keys = ZOBRIST["token"]
+    key = 0
+    for player in players:
+        seat_index = SEATS.index(player.get_player_pos())
+        key ^= token_keys[seat_index * 2][player.get_token_p_step_count() + 1]
+        key ^= token_keys[seat_index * 2 + 1][player.get_token_q_step_count() + 1]
+        if player.get_doubled():
+            key ^= ZOBRIST["doubled"][seat_index]
+    return key
+
+
+def search_key(players, root):
+    """
+    Returns the Zobrist key of what a search scores positions by: the root Player and the Players in play.
+
+    :param players: list of Player. The Players in play.
+    :param root: Player. The Player the search is for.
+    :return: int
+    """
+    key = ZOBRIST["root"][SEATS.index(root.get_player_pos())]
+    for player in players:
+        key ^= ZOBRIST["in_play"][SEATS.index(player.get_player_pos())]
+    return key
+
+
+def evaluate(players, root):
+    """
+    Scores the position for the root Player: its share of the way to the finish minus the average share of its
+    opponents. A token in Home counts 0 and a finished token counts 1.
+
+    :param players: list of Player. The Players in play.
+    :param root: Player. The Player the search is for.
+    :return: float from LOWEST to HIGHEST
+    """
+    root_score = 0.0
+    other_score = 0.0
+    for player in players:
+        score = (player.get_token_p_step_count() + player.get_token_q_step_count() + 2) / 116
+        if player is root:
+            root_score = score
+        else:
+            other_score += score
+    if len(players) > 1:
+        other_score /= len(players) - 1
+    return root_score - other_score
+
+
+class SearchBudgetExceeded(Exception):
+    """
+    Raised inside the search when the node or time budget runs out. Handled by SearchEngine.choose_move().
+    """
+    pass
+
+
+class TranspositionTable:
+    """
+    Fixed number of slots indexed by the low bits of a Zobrist key. A slot is replaced when it is empty, holds a result
+    from an older search, or holds a result that is no deeper than the new one.
+    """
+    def __init__(self, bits=16):
+        self._mask = (1 << bits) - 1
+        self._slots = [None] * (1 << bits)
+        self._generation = 0
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+
+    def new_search(self):
+        """
+        Marks the results stored so far as older, so the next search is free to replace them.
+
+        :return: None
+        """
+        self._generation += 1
+
+    def probe(self, key, depth):
+        """
+        Returns the slot stored for key if it was searched at least depth deep, otherwise None.
+
+        :param key: int. Zobrist key of the node.
+        :param depth: int. Depth the node needs.
+        :return: tuple of (key, depth, value, flag, best, generation) or None
+        """
+        self._probes += 1
+        slot = self._slots[key & self._mask]
+        if slot is not None and slot[0] == key and slot[1] >= depth:
+            self._hits += 1
+            return slot
+        return None
+
+    def store(self, key, depth, value, flag, best=None):
+        """
+        Stores a search result unless the slot holds a deeper result of this search.
+
+        :param key: int. Zobrist key of the node.
+        :param depth: int. Depth the node was searched to.
+        :param value: float. Value of the node, or a bound of it.
+        :param flag: int. EXACT, LOWER_BOUND, or UPPER_BOUND.
+        :param best: int or None. Index of the best option of a decision node.
+        :return: None
+        """
+        index = key & self._mask
+        slot = self._slots[index]
+        if slot is None or slot[5] != self._generation or slot[1] <= depth:
+            self._slots[index] = (key, depth, value, flag, best, self._generation)
+            self._stores += 1
+
+    def get_stats(self):
+        """
+        Returns the number of probes, hits, stores, the hit rate, and how full the table is.
+
+        :return: dict
+        """
+        used = sum(1 for slot in self._slots if slot is not None)
+        return {
+            "probes": self._probes,
+            "hits": self._hits,
+            "stores": self._stores,
+            "hit_rate": self._hits / self._probes if self._probes else 0.0,
+            "fill": used / len(self._slots),
+        }
+
+
+class SearchEngine:
+    """
+    Picks a token to move with iterative deepening expectiminimax until the node or time budget runs out, then uses
+    the best move of the deepest search that finished. Keeps its transposition table between calls. choose_move()
+    raises ValueError for a game that isn't played on CLASSIC_LAYOUT or whose RuleSet has three_sixes.
+    """
+    def __init__(self, max_depth=4, max_nodes=None, time_limit=None, table_bits=16):
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self._time_limit = time_limit
+        self._table = TranspositionTable(table_bits)
+        self._nodes = 0
+        self._total_nodes = 0
+        self._total_time = 0.0
+        self._deadline = None
+        self._game = None
+        self._order = None  # Players in play in turn order
+        self._root = None
+        self._search_key = 0  # search_key() of the root and the Players in play
+
+    def get_stats(self):
+        """
+        Returns nodes searched, nodes per second, and the transposition table stats of every search so far.
+
+        :return: dict
+        """
+        stats = {
+            "nodes": self._total_nodes,
+            "seconds": self._total_time,
+            "nodes_per_second": self._total_nodes / self._total_time if self._total_time else 0.0,
+        }
+        stats.update(self._table.get_stats())
+        return stats
+
+    def get_options(self, game, player, roll):
+        """
+        Returns the choices a Player has with this roll: a list of TokenMoves, or [None] if the Player is doubled or has
+        no token that can move, since then there is nothing to choose.
+
+        :param game: LudoGame
+        :param player: Player
+        :param roll: int
+        :return: list of TokenMove or None
+        """
+        if player.get_doubled():
+            return [None]
+        return game.legal_moves(player, roll) or [None]
+
+    def make_option(self, player, roll, option):
+        """
+        Plays a choice from get_options(). A doubled Player moves both tokens like play_turn() does, and a token that
+        lands on its own other token doubles the Player in the turns LudoGame.doubles_up() allows.
+
+        :param player: Player
+        :param roll: int
+        :param option: TokenMove or None
+        :return: None
+        """
+        if option is None:
+            if player.get_doubled():
+                self._game.play_turn(player.get_player_pos(), roll)
+            return
+        game = self._game
+        double = option.stacked and game.doubles_up(player, roll, game.legal_moves(player, roll))
+        if game.apply_move(player, option) == "DOUBLE" and double:
+            game.stack_up(player, option)
+
+    def choose_move(self, game, player_char, roll, bonus=False):
+        """
+        Searches for the best token for the Player to move with this roll.
+
+        :param game: LudoGame. Left in the same state it was given in, with its undo log still recording if it was.
+        :param player_char: str. "A", "B", "C", or "D" for the Player taking this turn.
+        :param roll: int. The roll for this turn.
+        :param bonus: True/False. True if this roll is the extra roll after a 6, so a 6 doesn't earn another.
+        :return: TokenMove or None. None when there is nothing to choose.
+        """
+        if game.get_layout() != CLASSIC_LAYOUT:
+            raise ValueError("only games on the classic layout can be searched: {!r}".format(game.get_layout()))
+        if game.get_rules().get_three_sixes():
+            raise ValueError("games with the three_sixes rule can't be searched")
+        player = game.get_player_by_position(player_char)
+        if not isinstance(player, Player):
+            return None
+        self._game = game
+        self._root = player
+        self._order = [candidate for candidate in game.get_players().values() if candidate.get_in_play()]
+        self._search_key = search_key(self._order, player)
+        self._nodes = 0
+        self._table.new_search()
+        start = time.perf_counter()
+        self._deadline = start + self._time_limit if self._time_limit else None
+        options = self.get_options(game, player, roll)
+        best = options[0]
+        if len(options) > 1:
+            try:  # a caller already recording, like a GameSession or another lookahead, keeps its undo log
+                mark = game.get_undo_mark()
+                started = False
+            except ValueError:
+                game.start_undo_log()
+                mark = 0
+                started = True
+            try:
+                for depth in range(1, self._max_depth + 1):
+                    try:
+                        _, best_index = self.decision(player, roll, bonus, depth, LOWEST, HIGHEST)
+                    except SearchBudgetExceeded:
+                        game.undo(mark)
+                        break
+                    best = options[best_index]
+            finally:
+                if started:
+                    game.stop_undo_log()
+        self._total_nodes += self._nodes
+        self._total_time += time.perf_counter() - start
+        return best
+
+    def count_node(self):
+        """
+        Counts a node and raises SearchBudgetExceeded when the node or time budget is used up.
+
+        :return: None
+        """
+        self._nodes += 1
+        if self._max_nodes is not None and self._nodes > self._max_nodes:
+            raise SearchBudgetExceeded
+        if self._deadline is not None and self._nodes % CHECK_EVERY == 0 and time.perf_counter() > self._deadline:
+            raise SearchBudgetExceeded
+
+    def next_turn(self, player, roll, bonus):
+        """
+        Returns who rolls next and if it is a bonus roll. A 6 that isn't a bonus roll earns the same Player a bonus
+        roll, otherwise the next Player in turn order that isn't done rolls.
+
+        :param player: Player. The Player who just moved.
+        :param roll: int
+        :param bonus: True/False. True if roll was a bonus roll.
+        :return: tuple of (Player or None, True/False). None if every Player is done.
+        """
+        if roll == 6 and not bonus and not player.get_completed():
+            return player, True
+        index = self._order.index(player)
+        for offset in range(1, len(self._order) + 1):
+            candidate = self._order[(index + offset) % len(self._order)]
+            if not candidate.get_completed():
+                return candidate, False
+        return None, False
+
+    def game_over(self):
+        """
+        Returns True when the root Player is done or every Player but 1 is done.
+
+        :return: True/False
+        """
+        if self._root.get_completed():
+            return True
+        return sum(1 for player in self._order if not player.get_completed()) <= 1
+
+    def decision(self, player, roll, bonus, depth, alpha, beta):
+        """
+        Value of the Player choosing a move for a known roll. The root Player maximizes and opponents minimize.
+
+        :param player: Player. The Player to move.
+        :param roll: int
+        :param bonus: True/False. True if roll is a bonus roll.
+        :param depth: int. Decisions left to search.
+        :param alpha: float. Lowest value the root Player is already sure of.
+        :param beta: float. Highest value the opponents will allow.
+        :return: tuple of (float, int). The value and the index of the best option.
+        """
+        self.count_node()
+        seat_index = SEATS.index(player.get_player_pos())
+        key = position_key(self._order) ^ self._search_key ^ ZOBRIST["to_move"][seat_index] ^ ZOBRIST["roll"][roll]
+        if bonus:
+            key ^= ZOBRIST["bonus"]
+        slot = self._table.probe(key, depth)
+        if slot is not None:
+            if slot[3] == EXACT or (slot[3] == LOWER_BOUND and slot[2] >= beta) or \
+                    (slot[3] == UPPER_BOUND and slot[2] <= alpha):
+                return slot[2], slot[4]
+        game = self._game
+        options = self.get_options(game, player, roll)
+        maximizing = player is self._root
+        original_alpha, original_beta = alpha, beta
+        best_value = None
+        best_index = 0
+        for index, option in enumerate(options):
+            mark = game.get_undo_mark()
+            self.make_option(player, roll, option)
+            next_player, next_bonus = self.next_turn(player, roll, bonus)
+            value = self.chance(next_player, next_bonus, depth - 1, alpha, beta)
+            game.undo(mark)
+            if best_value is None or (value > best_value if maximizing else value < best_value):
+                best_value, best_index = value, index
+            if maximizing:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table.store(key, depth, best_value, flag, best_index)
+        return best_value, best_index
+
+    def chance(self, player, bonus, depth, alpha, beta):
+        """
+        Value of the position before the Player rolls, averaged over the 6 rolls. Uses Star1 pruning: stops early once
+        the rolls left can't bring the average back inside (alpha, beta) even with the best or worst possible values.
+
+        :param player: Player or None. The Player about to roll, None if every Player is done.
+        :param bonus: True/False. True if the roll is a bonus roll.
+        :param depth: int. Decisions left to search.
+        :param alpha: float. Lowest value the root Player is already sure of.
+        :param beta: float. Highest value the opponents will allow.
+        :return: float
+        """
+        if player is None or depth == 0 or self.game_over():
+            return evaluate(self._order, self._root)
+        self.count_node()
+        key = position_key(self._order) ^ self._search_key ^ ZOBRIST["to_move"][SEATS.index(player.get_player_pos())]
+        if bonus:
+            key ^= ZOBRIST["bonus"]
+        slot = self._table.probe(key, depth)
+        if slot is not None:
+            if slot[3] == EXACT or (slot[3] == LOWER_BOUND and slot[2] >= beta) or \
+                    (slot[3] == UPPER_BOUND and slot[2] <= alpha):
+                return slot[2]
+        total = 0.0
+        for roll in range(1, 7):
+            left = 6 - roll  # rolls still to search after this one
+            child_alpha = 6 * alpha - total - left * HIGHEST
+            child_beta = 6 * beta - total - left * LOWEST
+            value, _ = self.decision(player, roll, bonus, depth, max(child_alpha, LOWEST), min(child_beta, HIGHEST))
+            if value <= child_alpha:  # can't reach alpha any more
+                bound = (total + value + left * HIGHEST) / 6
+                self._table.store(key, depth, bound, UPPER_BOUND)
+                return bound
+            if value >= child_beta:  # can't get under beta any more
+                bound = (total + value + left * LOWEST) / 6
+                self._table.store(key, depth, bound, LOWER_BOUND)
+                return bound
+            total += value
+        value = total / 6
+        self._table.store(key, depth, value, EXACT)
+        return value
+
+
+class SearchPolicy:
+    """
+    A policy for LudoGame.set_policy() that picks tokens with a SearchEngine. Turns played through play_turn() don't
+    say if a roll is the extra roll after a 6, so every roll is searched as a normal roll.
+    """
+    def __init__(self, engine=None):
+        self._engine = engine if engine is not None else SearchEngine(max_depth=2, max_nodes=2000)
+
+    def get_engine(self):
+        """
+        Returns the SearchEngine this policy searches with.
+
+        :return: SearchEngine
+        """
+        return self._engine
+
+    def choose_move(self, game, player, steps, moves):
+        """
+        Picks one of the moves the Player can make with this roll, see PriorityPolicy.choose_move().
+
+        :param game: LudoGame
+        :param player: Player
+        :param steps: int
+        :param moves: list of TokenMove
+        :return: TokenMove or None
+        """
+        if len(moves) < 2:
+            return moves[0] if moves else None
+        return self._engine.choose_move(game, player.get_player_pos(), steps)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the search bot on positions from random games.")
+    parser.add_argument("--positions", type=int, default=20, help="positions to search")
+    parser.add_argument("--depth", type=int, default=4, help="maximum search depth in decisions")
+    parser.add_argument("--nodes", type=int, default=None, help="node budget per move")
+    parser.add_argument("--time", type=float, default=0.05, help="time budget per move in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    engine = SearchEngine(max_depth=args.depth, max_nodes=args.nodes, time_limit=args.time)
+    players_list = ["A", "B", "C", "D"]
+    game = LudoGame()
+    searched = 0
+    while searched < args.positions:
+        game.reset_game(players_list)
+        for _ in range(rng.randint(20, 120)):
+            game.play_turn(rng.choice(players_list), rng.randint(1, 6))
+        player_char = rng.choice(players_list)
+        player = game.get_player_by_position(player_char)
+        roll = rng.randint(1, 6)
+        if player.get_completed() or len(engine.get_options(game, player, roll)) < 2:
+            continue
+        engine.choose_move(game, player_char, roll)
+        searched += 1
+    stats = engine.get_stats()
+    print("positions: {}  nodes: {:,}  nodes/second: {:,.0f}".format(args.positions, stats["nodes"],
+                                                                     stats["nodes_per_second"]))
+    print("table probes: {:,}  hits: {:,}  hit rate: {:.1%}  fill: {:.1%}".format(
+        stats["probes"], stats["hits"], stats["hit_rate"], stats["fill"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,539 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: An asyncio server hosting many game tables at once, keyed by table id. Clients send one event per line
+# over TCP, a Unix socket, or an in-process queue, every event is played through a GameSession, and the responses to
+# all the lines read at once go back in a single write. Only a bounded number of tables keep a live LudoGame; the rest
+# are parked as CompactGame states and swapped back in when their next event comes. Includes a load generator that
+# reports p50/p99 turn latency.
+#
+# Protocol, one command per line, one response line per command:
+#   NEW <table> <players>        -> OK <table> 0 <positions>
+#   ROLL <table> <seat> <roll>   -> OK <table> <turn> <positions>, followed by " OVER" once the game is over
+#                                   (seat must be at the table and roll from 1 to 6)
+#   POS <table>                  -> OK <table> <turn> <positions>
+#   END <table>                  -> OK <table>
+#   anything that fails          -> ERR <table or -> <message>
+# positions are the space names play_game() would return, joined with commas.
+
+import argparse
+import asyncio
+import collections
+import os
+import random
+import sys
+import time
+
+from LudoGame import GameSession, LudoGame, RULE_SETS
+from LudoState import CompactGame
+
+MAX_LIVE = 4096  # tables with a live LudoGame at a time, about 13 KB each
+READ_SIZE = 65536  # bytes read from a connection at once; their lines are answered in one write
+
+
+class Table:
+    """
+    One hosted game. Holds a live GameSession while the table is in the TableManager's live set, and a CompactGame of
+    its state while it is parked.
+    """
+    def __init__(self, table_id, players_list):
+        self._table_id = table_id
+        self._players_list = players_list
+        self._session = None
+        self._state = None  # CompactGame while parked
+        self._turns = 0  # turn count while parked
+
+    def get_table_id(self):
+        """
+        Returns the table id.
+
+        :return: str
+        """
+        return self._table_id
+
+    def get_players(self):
+        """
+        Returns the seats in play at the table.
+
+        :return: list of str
+        """
+        return self._players_list
+
+    def get_session(self):
+        """
+        Returns the live GameSession, or None if the table is parked.
+
+        :return: GameSession or None
+        """
+        return self._session
+
+    def is_parked(self):
+        """
+        Returns True if the table's state is parked as a CompactGame.
+
+        :return: True/False
+        """
+        return self._state is not None
+
+    def attach(self, game):
+        """
+        Gives the table a LudoGame to play on, loading its parked state into it if it has one.
+
+        :param game: LudoGame. Reset by this call.
+        :return: None
+        """
+        self._session = GameSession(self._players_list, game)
+        if self._state is not None:
+            self._state.to_game(game)
+            self._session.set_turn_count(self._turns)
+            self._state = None
+
+    def detach(self):
+        """
+        Parks the table as a CompactGame and returns the LudoGame it was playing on, for another table to use.
+
+        :return: LudoGame
+        """
+        game = self._session.get_game()
+        self._state = CompactGame.from_game(game)
+        self._turns = self._session.get_turn_count()
+        self._session = None
+        return game
+
+
+class TableManager:
+    """
+    Hosts tables by id and answers protocol lines. Keeps at most max_live tables attached to a LudoGame, least recently
+    used first out. Every table is played with rules, CLASSIC_RULES if None.
+    """
+    def __init__(self, max_live=MAX_LIVE, rules=None):
+        self._max_live = max_live
+        self._rules = rules
+        self._tables = {}
+        self._live = collections.OrderedDict()  # table id -> Table, least recently used first
+        self._swaps = 0
+
+    def get_table_count(self):
+        """
+        Returns how many tables are hosted.
+
+        :return: int
+        """
+        return len(self._tables)
+
+    def get_swap_count(self):
+        """
+        Returns how many times a parked table was swapped back in.
+
+        :return: int
+        """
+        return self._swaps
+
+    def make_live(self, table):
+        """
+        Makes sure a table has a live GameSession, parking the least recently used table if too many are live.
+
+        :param table: Table
+        :return: GameSession
+        """
+        table_id = table.get_table_id()
+        if table_id in self._live:
+            self._live.move_to_end(table_id)
+            return table.get_session()
+        if len(self._live) >= self._max_live:
+            _, oldest = self._live.popitem(last=False)
+            game = oldest.detach()
+        else:
+            game = LudoGame(rules=self._rules)
+        if table.is_parked():
+            self._swaps += 1
+        table.attach(game)
+        self._live[table_id] = table
+        return table.get_session()
+
+    def handle_line(self, line):
+        """
+        Answers one protocol line. A line that fails in a way answer_line() doesn't check for gets an ERR line too, so
+        it can't take down the other lines of its batch or the connection.
+
+        :param line: str. Without the newline.
+        :return: str. The response line, without the newline.
+        """
+        try:
+            return self.answer_line(line)
+        except Exception as error:
+            parts = line.split()
+            return "ERR {} {}: {}".format(parts[1] if len(parts) > 1 else "-", type(error).__name__, error)
+
+    def answer_line(self, line):
+        """
+        Answers one protocol line for handle_line().
+
+        :param line: str. Without the newline.
+        :return: str. The response line, without the newline.
+        """
+        parts = line.split()
+        if not parts:
+            return "ERR - empty line"
+        command = parts[0].upper()
+        table_id = parts[1] if len(parts) > 1 else "-"
+        if command == "NEW" and len(parts) == 3:
+            players_list = sorted(set(parts[2].upper()))
+            if table_id in self._tables:
+                return "ERR {} table exists".format(table_id)
+            if not players_list or any(char not in "ABCD" for char in players_list):
+                return "ERR {} players must be from ABCD".format(table_id)
+            table = Table(table_id, players_list)
+            self._tables[table_id] = table
+            return self.describe(table_id, self.make_live(table))
+        table = self._tables.get(table_id)
+        if table is None:
+            return "ERR {} no such table".format(table_id)
+        if command == "ROLL" and len(parts) == 4:
+            try:
+                steps = int(parts[3])
+            except ValueError:
+                return "ERR {} roll must be an int".format(table_id)
+            if not 1 <= steps <= 6:
+                return "ERR {} roll must be from 1 to 6".format(table_id)
+            player_char = parts[2].upper()
+            if player_char not in table.get_players():
+                return "ERR {} seat must be one of {}".format(table_id, "".join(table.get_players()))
+            session = self.make_live(table)
+            turns = session.get_turn_count()
+            try:
+                session.apply_turn(player_char, steps)
+            except Exception:
+                session.set_turn_count(turns)  # a turn that failed isn't counted
+                raise
+            return self.describe(table_id, session)
+        if command == "POS" and len(parts) == 2:
+            return self.describe(table_id, self.make_live(table))
+        if command == "END" and len(parts) == 2:
+            del self._tables[table_id]
+            if table_id in self._live:
+                del self._live[table_id]
+            return "OK {}".format(table_id)
+        return "ERR {} bad command".format(table_id)
+
+    def describe(self, table_id, session):
+        """
+        Returns the OK line with a table's turn count and positions.
+
+        :param table_id: str
+        :param session: GameSession
+        :return: str
+        """
+        line = "OK {} {} {}".format(table_id, session.get_turn_count(), ",".join(session.get_positions()))
+        return line + " OVER" if session.is_over() else line
+
+    def handle_lines(self, lines):
+        """
+        Answers a batch of protocol lines and returns all the responses as one block of bytes.
+
+        :param lines: list of bytes. Without the newlines.
+        :return: bytes
+        """
+        replies = "".join(self.handle_line(line.decode("ascii", "replace")) + "\n" for line in lines)
+        return replies.encode("ascii", "replace")
+
+
+class LudoServer:
+    """
+    Serves a TableManager over TCP or a Unix socket. Each connection reads up to READ_SIZE bytes at a time, answers
+    every complete line in them, and writes the answers back in one write, yielding to other connections in between.
+    """
+    def __init__(self, manager=None):
+        self._manager = manager if manager is not None else TableManager()
+        self._server = None
+        self._connections = set()  # tasks answering open connections
+
+    def get_manager(self):
+        """
+        Returns the TableManager being served.
+
+        :return: TableManager
+        """
+        return self._manager
+
+    async def handle_client(self, reader, writer):
+        """
+        Answers one connection until it closes.
+
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        pending = b""
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()  # part of a line that hasn't fully arrived
+                if lines:
+                    writer.write(self._manager.handle_lines(lines))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Starts listening on a Unix socket if path is given, otherwise on TCP.
+
+        :param host: str
+        :param port: int. 0 picks a free port.
+        :param path: str or None. Unix socket path.
+        :return: tuple or str. The (host, port) or the path being listened on.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_client, path)
+            return path
+        self._server = await asyncio.start_server(self.handle_client, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        """
+        Stops listening and waits for the open connections to finish and the server to close.
+
+        :return: None
+        """
+        self._server.close()
+        if self._connections:
+            await asyncio.wait(list(self._connections))
+        await self._server.wait_closed()
+
+
+class LocalConnection:
+    """
+    An in-process transport to a TableManager with the same interface the load generator uses for sockets: write()
+    queues bytes and read() returns the answers. Lines are answered by a task on the same event loop, so no socket or
+    second thread is involved.
+    """
+    def __init__(self, manager):
+        self._manager = manager
+        self._requests = asyncio.Queue()
+        self._responses = asyncio.Queue()
+        self._task = asyncio.ensure_future(self.serve())
+
+    async def serve(self):
+        """
+        Answers every batch written to this connection, in order.
+
+        :return: None
+        """
+        while True:
+            data = await self._requests.get()
+            if data is None:
+                return
+            lines = data.split(b"\n")
+            lines.pop()  # batches always end with a newline
+            await self._responses.put(self._manager.handle_lines(lines))
+
+    def write(self, data):
+        """
+        Sends a batch of complete lines.
+
+        :param data: bytes
+        :return: None
+        """
+        self._requests.put_nowait(data)
+
+    async def drain(self):
+        """
+        Nothing to flush, kept so LocalConnection can stand in for an asyncio.StreamWriter.
+
+        :return: None
+        """
+
+    async def read(self, size=-1):
+        """
+        Returns the next block of answers.
+
+        :param size: int. Ignored, a whole block is returned.
+        :return: bytes
+        """
+        return await self._responses.get()
+
+    def close(self):
+        """
+        Stops answering.
+
+        :return: None
+        """
+        self._requests.put_nowait(None)
+
+
+def percentile(sorted_values, fraction):
+    """
+    Returns the value at a fraction of a sorted list, by the nearest rank.
+
+    :param sorted_values: list of float
+    :param fraction: float. 0.5 for the median.
+    :return: float
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run_load(reader, writer, tables, turns, seed=0):
+    """
+    Plays turns on every one of tables tables at once over one connection. Every table always has one roll waiting for
+    an answer, and as soon as it is answered the table's next roll is sent, together with every other roll that became
+    due from the same block of answers.
+
+    :param reader: object with an async read(), like asyncio.StreamReader or LocalConnection.
+    :param writer: object with write() and an async drain(), like asyncio.StreamWriter or LocalConnection.
+    :param tables: int. Number of concurrent tables.
+    :param turns: int. Turns played on every table.
+    :param seed: int. Seed of the dice.
+    :return: dict. Turns played, seconds, turns per second, and p50/p99/max turn latency in milliseconds.
+    """
+    rng = random.Random(seed)
+    seats = "ABCD"
+    writer.write("".join("NEW t{} ABCD\n".format(table) for table in range(tables)).encode("ascii"))
+    await writer.drain()
+    await read_answers(reader, tables)
+
+    sent = [0.0] * tables
+    left = [turns] * tables
+    latencies = []
+    start = time.perf_counter()
+
+    def roll_line(table):
+        left[table] -= 1
+        sent[table] = time.perf_counter()
+        return "ROLL t{} {} {}\n".format(table, seats[(turns - left[table] - 1) % 4], int(rng.random() * 6) + 1)
+
+    writer.write("".join(roll_line(table) for table in range(tables)).encode("ascii"))
+    await writer.drain()
+    outstanding = tables
+    pending = b""
+    while outstanding:
+        data = await reader.read(READ_SIZE)
+        if not data:
+            raise ConnectionError("server closed the connection")
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        now = time.perf_counter()
+        due = []
+        for line in lines:
+            table = int(line.split(b" ", 2)[1][1:])
+            latencies.append(now - sent[table])
+            outstanding -= 1
+            if left[table]:
+                due.append(table)
+        if due:
+            writer.write("".join(roll_line(table) for table in due).encode("ascii"))
+            outstanding += len(due)
+            await writer.drain()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "tables": tables,
+        "turns": len(latencies),
+        "seconds": elapsed,
+        "turns_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3 if latencies else 0.0,
+    }
+
+
+async def read_answers(reader, count):
+    """
+    Reads and throws away count answer lines.
+
+    :param reader: object with an async read().
+    :param count: int
+    :return: None
+    """
+    pending = b""
+    while count:
+        data = await reader.read(READ_SIZE)
+        if not data:
+            raise ConnectionError("server closed the connection")
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        count -= len(lines)
+
+
+async def load_test(tables, turns, transport="tcp", max_live=MAX_LIVE, seed=0, rules=None):
+    """
+    Starts a server and the load generator on the same event loop, so both share one core, and returns the report of
+    run_load() with the number of table swaps added.
+
+    :param tables: int. Number of concurrent tables.
+    :param turns: int. Turns played on every table.
+    :param transport: str. "tcp", "unix", or "local".
+    :param max_live: int. Tables with a live LudoGame at a time.
+    :param seed: int. Seed of the dice.
+    :param rules: RuleSet or None. The house rules of every table, the README rules if None.
+    :return: dict
+    """
+    manager = TableManager(max_live, rules)
+    if transport == "local":
+        connection = LocalConnection(manager)
+        report = await run_load(connection, connection, tables, turns, seed)
+        connection.close()
+    else:
+        server = LudoServer(manager)
+        if transport == "unix":
+            path = "/tmp/ludo-{}.sock".format(os.getpid())
+            await server.start(path=path)
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            host, port = await server.start()
+            reader, writer = await asyncio.open_connection(host, port)
+        report = await run_load(reader, writer, tables, turns, seed)
+        writer.close()
+        await writer.wait_closed()
+        await server.stop()
+        if transport == "unix":
+            os.remove(path)
+    report["swaps"] = manager.get_swap_count()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Ludo tables, or load test the server with --load.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7162)
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of TCP")
+    parser.add_argument("--max-live", type=int, default=MAX_LIVE, help="tables with a live LudoGame at a time")
+    parser.add_argument("--load", action="store_true", help="run the load generator against an in-process server")
+    parser.add_argument("--tables", default="1000,10000,50000", help="with --load, concurrent tables to test")
+    parser.add_argument("--turns", type=int, default=5, help="with --load, turns played on every table")
+    parser.add_argument("--transport", default="tcp", choices=("tcp", "unix", "local"), help="with --load")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS), help="house rules of every table")
+    args = parser.parse_args(argv)
+
+    if args.load:
+        print("{:>8}{:>10}{:>14}{:>10}{:>10}{:>10}{:>10}".format("tables", "turns", "turns/second", "p50 ms",
+                                                                "p99 ms", "max ms", "swaps"))
+        for tables in [int(count) for count in args.tables.split(",")]:
+            report = asyncio.run(load_test(tables, args.turns, args.transport, args.max_live,
+                                           rules=RULE_SETS[args.rules]))
+            print("{:>8,}{:>10,}{:>14,.0f}{:>10.1f}{:>10.1f}{:>10.1f}{:>10,}".format(
+                tables, report["turns"], report["turns_per_second"], report["p50_ms"], report["p99_ms"],
+                report["max_ms"], report["swaps"]))
+        return
+
+    async def serve():
+        server = LudoServer(TableManager(args.max_live, RULE_SETS[args.rules]))
+        where = await server.start(args.host, args.port, args.unix)
+        print("serving on {}".format(where))
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
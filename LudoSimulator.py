@@ -0,0 +1,327 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Monte Carlo self-play for LudoGame. Rolls the die itself using the README rules (a 6 earns one extra
+# roll, a 6 on the extra roll doesn't earn another), plays every game until all Players but 1 are done, and keeps
+# running totals of wins, places, and game lengths per seat. Games are split into chunks that each get their own seeded
+# random number generator, so a run gives the exact same totals no matter how many worker processes play it. Games can
+# be played on any BoardLayout, like the 4 token or 6 seat presets of LAYOUTS, and with any RuleSet, like the house
+# rules of RULE_SETS. check_games() plays games checking after every turn that the Board and the Players agree.
+
+import argparse
+import concurrent.futures
+import os
+import random
+import sys
+
+from LudoGame import CLASSIC_LAYOUT, LAYOUTS, RULE_SETS, LudoGame
+
+MAX_TURNS = 10000  # a game still going after this many turns is counted as unfinished
+LENGTH_BUCKET = 10  # turns per bar of the game length histogram
+
+
+class SimulationStats:
+    """
+    Running totals for a set of simulated games. Everything is an int count so two SimulationStats can be merged in any
+    order and give the same totals, and memory doesn't grow with the number of games.
+    """
+    def __init__(self, players_list):
+        self._players_list = sorted(players_list)
+        self._games = 0
+        self._unfinished = 0  # games that hit the turn limit
+        self._turns = 0  # turns of finished games
+        self._turns_squared = 0
+        self._min_turns = None
+        self._max_turns = 0
+        self._lengths = {}  # histogram of game lengths by LENGTH_BUCKET
+        self._places = {char: [0] * len(self._players_list) for char in self._players_list}  # how often each place
+
+    def add_game(self, finish_order, turns, finished=True):
+        """
+        Adds one game to the totals.
+
+        :param finish_order: list of str. Players in the order they finished, without the last Player.
+        :param turns: int. Number of turns the game took.
+        :param finished: True/False. False if the game hit the turn limit.
+        :return: None
+        """
+        self._games += 1
+        if not finished:
+            self._unfinished += 1
+            return
+        self._turns += turns
+        self._turns_squared += turns * turns
+        self._min_turns = turns if self._min_turns is None else min(self._min_turns, turns)
+        self._max_turns = max(self._max_turns, turns)
+        bucket = turns // LENGTH_BUCKET
+        self._lengths[bucket] = self._lengths.get(bucket, 0) + 1
+        for place, char in enumerate(finish_order):
+            self._places[char][place] += 1
+        for char in self._players_list:  # the Player who never finished is last
+            if char not in finish_order:
+                self._places[char][len(self._players_list) - 1] += 1
+
+    def merge(self, other):
+        """
+        Adds the totals of another SimulationStats for the same players to this one.
+
+        :param other: SimulationStats
+        :return: None
+        """
+        if other._players_list != self._players_list:
+            raise ValueError("can only merge stats of the same players")
+        self._games += other._games
+        self._unfinished += other._unfinished
+        self._turns += other._turns
+        self._turns_squared += other._turns_squared
+        if other._min_turns is not None:
+            self._min_turns = other._min_turns if self._min_turns is None else min(self._min_turns, other._min_turns)
+        self._max_turns = max(self._max_turns, other._max_turns)
+        for bucket, count in other._lengths.items():
+            self._lengths[bucket] = self._lengths.get(bucket, 0) + count
+        for char, places in other._places.items():
+            for place, count in enumerate(places):
+                self._places[char][place] += count
+
+    def get_summary(self):
+        """
+        Returns the totals as a dictionary: games, unfinished games, win rate and place counts per seat, and the mean,
+        variance, min, and max of the game lengths.
+
+        :return: dict
+        """
+        finished = self._games - self._unfinished
+        mean = self._turns / finished if finished else 0.0
+        variance = self._turns_squared / finished - mean * mean if finished else 0.0
+        return {
+            "players": self._players_list,
+            "games": self._games,
+            "unfinished": self._unfinished,
+            "win_rate": {char: places[0] / finished if finished else 0.0 for char, places in self._places.items()},
+            "places": {char: list(places) for char, places in self._places.items()},
+            "mean_turns": mean,
+            "variance_turns": variance,
+            "min_turns": self._min_turns,
+            "max_turns": self._max_turns,
+            "length_histogram": {bucket * LENGTH_BUCKET: count for bucket, count in sorted(self._lengths.items())},
+        }
+
+
+def chunk_rng(seed, chunk_number):
+    """
+    Returns the random number generator for one chunk of games. Every (seed, chunk) pair gets its own stream.
+
+    :param seed: int. Seed of the whole run.
+    :param chunk_number: int. Which chunk of the run.
+    :return: random.Random
+    """
+    return random.Random("ludo-{}-{}".format(seed, chunk_number))
+
+
+def play_random_game(game, players_list, rng, extra_roll=True, max_turns=MAX_TURNS, recorder=None):
+    """
+    Plays one game to the end with dice from rng. Players take turns in sorted order and skip their turn once they are
+    done. A roll of 6 gives the same Player one extra roll when extra_roll is True, or as many as it keeps rolling 6s
+    when the game's RuleSet has three_sixes, where the game forfeits the third 6. With a recorder, like
+    LudoStats.GameRecorder, every turn is played through recorder.play_turn() so it can count what happens.
+
+    :param game: LudoGame. Reset before the game starts.
+    :param players_list: list of str. Sorted list of seats of the game's layout, like "A", "B", "C", or "D".
+    :param rng: random.Random
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for the game.
+    :param recorder: object with start() and play_turn() methods playing on game, or None.
+    :return: tuple of (list of str, int, True/False). Finish order, number of turns, and if the game finished.
+    """
+    game.reset_game(players_list)
+    game.clear_winners()
+    play_turn = game.play_turn
+    if recorder is not None:
+        recorder.start(players_list)
+        play_turn = recorder.play_turn
+    players = game.get_players()
+    max_rolls = 3 if game.get_rules().get_three_sixes() else 2  # rolls a Player can get in one turn
+    finish_order = []
+    turns = 0
+    seat = 0
+    while len(finish_order) < len(players_list) - 1:
+        player_char = players_list[seat]
+        seat = (seat + 1) % len(players_list)
+        player = players[player_char]
+        if player.get_completed():
+            continue
+        roll = int(rng.random() * 6) + 1
+        play_turn(player_char, roll)
+        turns += 1
+        rolls = 1
+        while extra_roll and roll == 6 and rolls < max_rolls and not player.get_completed():  # bonus rolls
+            roll = int(rng.random() * 6) + 1
+            play_turn(player_char, roll)
+            turns += 1
+            rolls += 1
+        if player.get_completed():
+            finish_order.append(player_char)
+            game.set_winners(player_char)
+        if turns >= max_turns:
+            return finish_order, turns, False
+    return finish_order, turns, True
+
+
+class BoardChecker:
+    """
+    A recorder for play_random_game() that plays every turn and then checks that the Board and the Players agree with
+    LudoGame.check_board(). Raises AssertionError at the first difference.
+    """
+    def __init__(self, game):
+        self._game = game
+        self._turns = 0
+
+    def start(self, players_list):
+        """
+        Starts counting the turns of a new game.
+
+        :param players_list: list of str. Sorted list of seats of the game.
+        :return: None
+        """
+        self._turns = 0
+
+    def play_turn(self, player_char, steps):
+        """
+        Plays one turn with LudoGame.play_turn() and checks the Board.
+
+        :param player_char: str. The Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: tuple of TokenMove. What play_turn() returned.
+        """
+        moves = self._game.play_turn(player_char, steps)
+        self._turns += 1
+        problems = self._game.check_board()
+        if problems:  # not an assert statement, so python -O still checks
+            raise AssertionError("turn {} ({}, {}): {}".format(self._turns, player_char, steps, "; ".join(problems)))
+        return moves
+
+
+def check_games(players_list, num_games, seed=0, layout=None, rules=None, extra_roll=True, max_turns=MAX_TURNS):
+    """
+    Plays seeded random games like simulate_chunk() and checks after every turn that the Board and the Players agree,
+    with BoardChecker. Meant for layouts other than the classic one, where a stack only holds tokens on one space.
+
+    :param players_list: list of str. List of seats of the layout, like "A", "B", "C", or "D".
+    :param num_games: int. Games to play.
+    :param seed: int. Seed of the run.
+    :param layout: BoardLayout or None. The board to play on, the classic one if None.
+    :param rules: RuleSet or None. The house rules to play with, the README rules if None.
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for each game.
+    :return: int. Turns checked.
+    """
+    game = LudoGame(layout, rules)
+    checker = BoardChecker(game)
+    rng = chunk_rng(seed, 0)
+    players_list = sorted(players_list)
+    turns = 0
+    for _ in range(num_games):
+        turns += play_random_game(game, players_list, rng, extra_roll, max_turns, checker)[1]
+    return turns
+
+
+def simulate_chunk(players_list, seed, chunk_number, num_games, extra_roll=True, max_turns=MAX_TURNS, layout=None,
+                   rules=None):
+    """
+    Plays one chunk of games with the chunk's own random number generator and returns their totals.
+
+    :param players_list: list of str. List of seats of the layout, like "A", "B", "C", or "D".
+    :param seed: int. Seed of the whole run.
+    :param chunk_number: int. Which chunk of the run.
+    :param num_games: int. Games in this chunk.
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for each game.
+    :param layout: BoardLayout or None. The board to play on, the classic one if None.
+    :param rules: RuleSet or None. The house rules to play with, the README rules if None.
+    :return: SimulationStats
+    """
+    players_list = sorted(players_list)
+    rng = chunk_rng(seed, chunk_number)
+    game = LudoGame(layout, rules)
+    stats = SimulationStats(players_list)
+    for _ in range(num_games):
+        stats.add_game(*play_random_game(game, players_list, rng, extra_roll, max_turns))
+    return stats
+
+
+def simulate(players_list, num_games, seed=0, workers=None, chunk_games=1000, extra_roll=True, max_turns=MAX_TURNS,
+             layout=None, rules=None):
+    """
+    Plays num_games games across worker processes and merges each chunk's totals as soon as it is done. The totals only
+    depend on players_list, num_games, seed, chunk_games, the layout, and the rule options.
+
+    :param players_list: list of str. List of seats of the layout, like "A", "B", "C", or "D".
+    :param num_games: int. Games to play.
+    :param seed: int. Seed of the run.
+    :param workers: int or None. Number of worker processes, all cores if None. 1 plays in this process.
+    :param chunk_games: int. Games per chunk.
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for each game.
+    :param layout: BoardLayout or None. The board to play on, the classic one if None.
+    :param rules: RuleSet or None. The house rules to play with, the README rules if None.
+    :return: SimulationStats
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [(chunk_number, min(chunk_games, num_games - start))
+              for chunk_number, start in enumerate(range(0, num_games, chunk_games))]
+    stats = SimulationStats(players_list)
+    if workers == 1:
+        for chunk_number, count in chunks:
+            stats.merge(simulate_chunk(players_list, seed, chunk_number, count, extra_roll, max_turns, layout, rules))
+        return stats
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        chunks = iter(chunks)
+        for chunk_number, count in chunks:
+            pending.add(executor.submit(simulate_chunk, players_list, seed, chunk_number, count, extra_roll, max_turns,
+                                        layout, rules))
+            if len(pending) >= workers * 4:  # keep a few chunks queued per worker
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    stats.merge(future.result())
+        for future in concurrent.futures.as_completed(pending):
+            stats.merge(future.result())
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Ludo games with random dice.")
+    parser.add_argument("--players", help="players in the game, for example AC, every seat of the layout by default")
+    parser.add_argument("--layout", default="classic", choices=sorted(LAYOUTS), help="board and number of tokens")
+    parser.add_argument("--rules", default="classic", choices=sorted(RULE_SETS), help="house rules to play with")
+    parser.add_argument("--games", type=int, default=10000, help="number of games")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, all cores by default")
+    parser.add_argument("--no-extra-roll", action="store_true", help="a 6 does not earn an extra roll")
+    parser.add_argument("--check", action="store_true",
+                        help="check after every turn that the Board and the Players agree, not on the classic layout")
+    args = parser.parse_args(argv)
+
+    layout = LAYOUTS[args.layout]
+    players_list = list((args.players or layout.get_seats()).upper())
+    if any(char not in layout.get_seats() for char in players_list):
+        parser.error("players must be seats of the {} layout: {}".format(args.layout, layout.get_seats()))
+    if args.check:
+        if layout == CLASSIC_LAYOUT:
+            parser.error("--check needs another layout, a classic stack can span two spaces")
+        turns = check_games(players_list, args.games, args.seed, layout, RULE_SETS[args.rules],
+                            not args.no_extra_roll)
+        print("{:,} games, {:,} turns: the Board and the Players agree after every turn".format(args.games, turns))
+        return
+    stats = simulate(players_list, args.games, args.seed, args.workers, extra_roll=not args.no_extra_roll,
+                     layout=layout, rules=RULE_SETS[args.rules])
+    summary = stats.get_summary()
+    print("games: {:,}  unfinished: {:,}".format(summary["games"], summary["unfinished"]))
+    print("turns: mean {:.1f}  std {:.1f}  min {}  max {}".format(
+        summary["mean_turns"], summary["variance_turns"] ** 0.5, summary["min_turns"], summary["max_turns"]))
+    for char in summary["players"]:
+        print("{}: win rate {:.3f}  places {}".format(char, summary["win_rate"][char], summary["places"][char]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
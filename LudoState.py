@@ -0,0 +1,349 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: A compact representation of a whole LudoGame state. Every token's step count, every token's status, and
+# the Player flags are packed into a few ints held by a slotted CompactGame class, so a process can keep tens of
+# thousands of games around without a Board dictionary of 80 lists and 4 Player objects for each one. CompactGame can
+# be made from a LudoGame and turned back into one, with the RuleSet the game was played with.
+
+from LudoGame import LudoGame, BOARD_SPACES, CLASSIC_LAYOUT, CLASSIC_RULES, SPACE_INDEX, SPACE_TABLES, MIN_STEPS
+from LudoGame import TOKEN_NAMES
+
+SEATS = "ABCD"  # player positions in the order they are packed
+TOKENS = "pq"
+
+# Token statuses as ints instead of strings.
+HOME = 0
+READY = 1
+ON_BOARD = 2
+FINISHED = 3
+STATUS_NAMES = ("HOME", "READY", "ON BOARD", "FINISHED")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+STEP_BITS = 6  # step count + 1 is 0 - 58
+STATUS_BITS = 2
+GHOST_BITS = 2
+FIRST_HOME_ROW = len(BOARD_SPACES) - 24  # index of "A1" in BOARD_SPACES
+
+# Bit offsets of the Player flags in CompactGame._flags. Each one has a bit per seat.
+IN_PLAY_SHIFT = 0
+FINISHED_SHIFT = 4
+DOUBLED_SHIFT = 8
+# Above the Player flags, the three_sixes streak: the seat of the Player that rolled it + 1 and its 6s in a row. All 0
+# when there is no streak, which is always the case without three_sixes.
+SIX_PLAYER_SHIFT = 12
+SIX_PLAYER_BITS = 3
+SIX_STREAK_SHIFT = SIX_PLAYER_SHIFT + SIX_PLAYER_BITS
+SIX_STREAK_BITS = 2
+
+# Bit layout of CompactGame._order: up to 4 winners, then the tokens in the finish in the order they got there. Each
+# entry is stored as its id + 1 so a 0 ends the list. The finish can have more than 8 entries because a finished token
+# is sent back to Home with its doubled partner.
+WINNER_BITS = 3
+MAX_WINNERS = 4
+FINISH_SHIFT = WINNER_BITS * MAX_WINNERS
+FINISH_TOKEN_BITS = 4
+
+def token_id(seat_index, token_index):
+    """
+    Returns the int id of a token, used as the slot of the token in the packed fields. Token p of "A" is 0, token q of
+    "A" is 1, token p of "B" is 2, and so on.
+
+    :param seat_index: int. 0 - 3 for "A" - "D".
+    :param token_index: int. 0 for token p, 1 for token q.
+    :return: int
+    """
+    return seat_index * 2 + token_index
+
+
+def token_id_by_name(token_name):
+    """
+    Returns the int id of a token from its name on the board, like "b_q".
+
+    :param token_name: str. Name of the token on the board.
+    :return: int
+    """
+    return token_id(SEATS.index(token_name[0].upper()), TOKENS.index(token_name[2]))
+
+
+class CompactGame:
+    """
+    Holds the state of one LudoGame in 5 ints. _tokens has 6 bits per token for step count + 1, _statuses has 2 bits
+    per token for its status code, _flags has the in play, finished, and doubled flag of each Player, _order has the
+    order tokens reached the finish and the order of the winners, and _ghosts counts token names that the Board still
+    lists on a home row space after a doubled Player was sent back to Home. _flags also holds the three_sixes streak.
+    All 0 is a new game with nobody in play. _rules is the RuleSet the game is played with, CLASSIC_RULES if none is
+    given; it isn't one of the packed fields, so whatever stores the fields keeps the RuleSet on its own.
+    """
+    __slots__ = ("_tokens", "_statuses", "_flags", "_order", "_ghosts", "_rules")
+
+    def __init__(self, tokens=0, statuses=0, flags=0, order=0, ghosts=0, rules=None):
+        self._tokens = tokens
+        self._statuses = statuses
+        self._flags = flags
+        self._order = order
+        self._ghosts = ghosts
+        self._rules = rules if rules is not None else CLASSIC_RULES
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactGame):
+            return NotImplemented
+        return self.get_fields() == other.get_fields() and self._rules == other._rules
+
+    def __hash__(self):
+        return hash(self.get_fields())
+
+    def __repr__(self):
+        return "CompactGame(tokens={:#x}, statuses={:#x}, flags={:#x}, order={:#x}, ghosts={:#x}, rules={!r})".format(
+            *self.get_fields(), self._rules)
+
+    def get_fields(self):
+        """
+        Returns the 5 packed ints, in the same order as the constructor takes them.
+
+        :return: tuple of int
+        """
+        return self._tokens, self._statuses, self._flags, self._order, self._ghosts
+
+    def get_rules(self):
+        """
+        Returns the RuleSet of the game this state is from.
+
+        :return: RuleSet
+        """
+        return self._rules
+
+    def get_token_steps(self, seat_index, token_index):
+        """
+        Returns the step count of one token. -1 for Home, 0 for the ready position, and 57 for finished.
+
+        :param seat_index: int. 0 - 3 for "A" - "D".
+        :param token_index: int. 0 for token p, 1 for token q.
+        :return: int
+        """
+        shift = token_id(seat_index, token_index) * STEP_BITS
+        return ((self._tokens >> shift) & ((1 << STEP_BITS) - 1)) + MIN_STEPS
+
+    def get_token_status(self, seat_index, token_index):
+        """
+        Returns the status code of one token. HOME, READY, ON_BOARD, or FINISHED.
+
+        :param seat_index: int. 0 - 3 for "A" - "D".
+        :param token_index: int. 0 for token p, 1 for token q.
+        :return: int
+        """
+        shift = token_id(seat_index, token_index) * STATUS_BITS
+        return (self._statuses >> shift) & ((1 << STATUS_BITS) - 1)
+
+    def get_in_play(self, seat_index):
+        """
+        Returns True/False if the Player in this seat is in the game.
+
+        :param seat_index: int. 0 - 3 for "A" - "D".
+        :return: True/False
+        """
+        return bool(self._flags >> (IN_PLAY_SHIFT + seat_index) & 1)
+
+    def get_finished(self, seat_index):
+        """
+        Returns the finished flag of the Player in this seat.
+
+        :param seat_index: int. 0 - 3 for "A" - "D".
+        :return: True/False
+        """
+        return bool(self._flags >> (FINISHED_SHIFT + seat_index) & 1)
+
+    def get_doubled(self, seat_index):
+        """
+        Returns True/False if the Player in this seat has its tokens doubled.
+
+        :param seat_index: int. 0 - 3 for "A" - "D".
+        :return: True/False
+        """
+        return bool(self._flags >> (DOUBLED_SHIFT + seat_index) & 1)
+
+    def get_six_streak(self):
+        """
+        Returns the Player of the three_sixes streak and its 6s in a row, like LudoGame.get_six_streak(). (None, 0)
+        without a streak.
+
+        :return: tuple of (str or None, int)
+        """
+        six_seat = (self._flags >> SIX_PLAYER_SHIFT) & ((1 << SIX_PLAYER_BITS) - 1)
+        if not six_seat:
+            return None, 0
+        return SEATS[six_seat - 1], (self._flags >> SIX_STREAK_SHIFT) & ((1 << SIX_STREAK_BITS) - 1)
+
+    def get_finish(self):
+        """
+        Returns the names of the tokens in the finish in the order they got there, like Board.get_finish().
+
+        :return: list of str
+        """
+        finish = []
+        finish_bits = self._order >> FINISH_SHIFT
+        while finish_bits:
+            token = (finish_bits & ((1 << FINISH_TOKEN_BITS) - 1)) - 1
+            finish.append(TOKEN_NAMES[SEATS[token // 2]][token % 2])
+            finish_bits >>= FINISH_TOKEN_BITS
+        return finish
+
+    def get_winners(self):
+        """
+        Returns the list of winners in the order they won, like LudoGame.get_winners().
+
+        :return: list of str
+        """
+        winners = []
+        winners_bits = self._order & ((1 << FINISH_SHIFT) - 1)
+        while winners_bits:
+            winners.append(SEATS[(winners_bits & ((1 << WINNER_BITS) - 1)) - 1])
+            winners_bits >>= WINNER_BITS
+        return winners
+
+    def get_ghosts(self):
+        """
+        Returns the token names the Board lists on a home row space even though the token isn't there anymore.
+
+        :return: list of tuples. Tuple is (space name, token name).
+        """
+        ghosts = []
+        ghost_bits = self._ghosts
+        slot = 0
+        while ghost_bits:
+            count = ghost_bits & ((1 << GHOST_BITS) - 1)
+            space = BOARD_SPACES[FIRST_HOME_ROW + slot // 2]
+            token_name = TOKEN_NAMES[space[0]][slot % 2]
+            ghosts.extend([(space, token_name)] * count)
+            ghost_bits >>= GHOST_BITS
+            slot += 1
+        return ghosts
+
+    def get_positions(self, players_list):
+        """
+        Returns the same list of space names play_game() returns for this state.
+
+        :param players_list: list of str. Sorted list of "A", "B", "C", or "D" players.
+        :return: list of str.
+        """
+        positions = []
+        for char in players_list:
+            names = SPACE_TABLES[char][0]
+            seat_index = SEATS.index(char)
+            positions.append(names[self.get_token_steps(seat_index, 0) - MIN_STEPS])
+            positions.append(names[self.get_token_steps(seat_index, 1) - MIN_STEPS])
+        return positions
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Packs the state of a LudoGame, along with its RuleSet and three_sixes streak. Raises ValueError if the Board has
+        a token name it can't account for, or if the game isn't played on CLASSIC_LAYOUT, the only board the packing has
+        room for.
+
+        :param game: LudoGame
+        :return: CompactGame
+        """
+        if game.get_layout() != CLASSIC_LAYOUT:
+            raise ValueError("only games on the classic layout can be packed: {!r}".format(game.get_layout()))
+        tokens = statuses = flags = 0
+        expected = {}  # live token names each board space should have
+        players = game.get_players()
+        for seat_index, char in enumerate(SEATS):
+            player = players[char]
+            steps = (player.get_token_p_step_count(), player.get_token_q_step_count())
+            token_statuses = (player.get_p_status(), player.get_q_status())
+            for token_index in range(2):
+                token = token_id(seat_index, token_index)
+                tokens |= (steps[token_index] - MIN_STEPS) << (token * STEP_BITS)
+                statuses |= STATUS_CODES[token_statuses[token_index]] << (token * STATUS_BITS)
+                space = player.get_space_name(steps[token_index])
+                if space in SPACE_INDEX:
+                    expected.setdefault(space, []).append(TOKEN_NAMES[char][token_index])
+            flags |= player.get_in_play() << (IN_PLAY_SHIFT + seat_index)
+            flags |= player.get_finished() << (FINISHED_SHIFT + seat_index)
+            flags |= player.get_doubled() << (DOUBLED_SHIFT + seat_index)
+
+        ghosts = 0
+        for space, space_tokens in game.get_board().get_board().items():
+            extra = list(space_tokens)
+            for token_name in expected.get(space, []):
+                if token_name not in extra:
+                    raise ValueError("token {} is not on space {}".format(token_name, space))
+                extra.remove(token_name)
+            if extra and SPACE_INDEX[space] < FIRST_HOME_ROW:
+                raise ValueError("unexpected tokens {} on space {}".format(extra, space))
+            for token_name in extra:
+                slot = (SPACE_INDEX[space] - FIRST_HOME_ROW) * 2 + TOKENS.index(token_name[2])
+                if (ghosts >> (slot * GHOST_BITS)) & ((1 << GHOST_BITS) - 1) == (1 << GHOST_BITS) - 1:
+                    raise ValueError("too many copies of {} on space {}".format(token_name, space))
+                ghosts += 1 << (slot * GHOST_BITS)
+
+        winners = game.get_winners()
+        if len(winners) > MAX_WINNERS:
+            raise ValueError("only {} winners can be packed".format(MAX_WINNERS))
+        order = 0
+        for num, char in enumerate(winners):
+            order |= (SEATS.index(char) + 1) << (num * WINNER_BITS)
+        for num, token_name in enumerate(game.get_board().get_finish()):
+            order |= (token_id_by_name(token_name) + 1) << (FINISH_SHIFT + num * FINISH_TOKEN_BITS)
+        six_player, six_streak = game.get_six_streak()
+        if six_streak and six_player in SEATS:  # a streak of a Player that isn't a seat plays like no streak
+            flags |= (SEATS.index(six_player) + 1) << SIX_PLAYER_SHIFT
+            flags |= six_streak << SIX_STREAK_SHIFT
+        return cls(tokens, statuses, flags, order, ghosts, game.get_rules())
+
+    def to_game(self, game=None):
+        """
+        Loads this state into a LudoGame, resetting whatever game it was playing. Makes a new LudoGame with this state's
+        RuleSet if none is given. Raises ValueError for a game that isn't played on CLASSIC_LAYOUT or with this state's
+        RuleSet.
+
+        :param game: LudoGame or None.
+        :return: LudoGame
+        """
+        if game is None:
+            game = LudoGame(rules=self._rules)
+        elif game.get_layout() != CLASSIC_LAYOUT:
+            raise ValueError("only games on the classic layout can be unpacked: {!r}".format(game.get_layout()))
+        elif game.get_rules() != self._rules:
+            raise ValueError("state of a game with {!r} can't be unpacked into a game with {!r}".format(
+                self._rules, game.get_rules()))
+        game.reset_game([char for seat_index, char in enumerate(SEATS) if self.get_in_play(seat_index)])
+        board = game.get_board()
+        players = game.get_players()
+        for seat_index, char in enumerate(SEATS):
+            player = players[char]
+            setters = ((player.set_token_p_step_count, player.set_p_status),
+                       (player.set_token_q_step_count, player.set_q_status))
+            for token_index, (set_steps, set_status) in enumerate(setters):
+                steps = self.get_token_steps(seat_index, token_index)
+                set_steps(steps)
+                set_status(STATUS_NAMES[self.get_token_status(seat_index, token_index)])
+                space = player.get_space_name(steps)
+                if space in SPACE_INDEX:
+                    board.add_token(space, TOKEN_NAMES[char][token_index])
+            if self.get_doubled(seat_index):
+                player.set_doubled()
+            if self.get_finished(seat_index):
+                player.set_finished()
+        for space, token_name in self.get_ghosts():
+            board.add_token(space, token_name)
+        for token_name in self.get_finish():
+            board.set_finish_tokens(token_name)
+        game.clear_winners()
+        for char in self.get_winners():
+            game.set_winners(char)
+        game.set_six_streak(*self.get_six_streak())
+        return game
+
+
+def fork_game(game):
+    """
+    Returns a new LudoGame in the same state as game and with the same RuleSet, for trying out moves without touching
+    the original.
+
+    :param game: LudoGame
+    :return: LudoGame
+    """
+    return CompactGame.from_game(game).to_game()
@@ -0,0 +1,652 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Streaming statistics for large replay and simulation runs. GameRecorder plays a game turn by turn and
+# counts its kicks, stacks, and bounces and the order its Players finish in. GameStats adds every game to mergeable
+# accumulators (Histogram, Moments, and QuantileSketch) whose size doesn't grow with the number of games, so each worker
+# process fills its own GameStats and they are merged at the end. Every accumulator only keeps int counts and sums, so
+# merging in any order gives the exact same totals.
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import math
+import os
+import sys
+
+from LudoGame import LAYOUTS, LudoGame, Player
+from LudoLog import GameLog
+from LudoPool import split_chunks
+from LudoSimulator import MAX_TURNS, chunk_rng, play_random_game
+
+LENGTH_BUCKET = 10  # turns per bar of the game length histogram
+SKETCH_ACCURACY = 0.01  # relative error of the quantiles of QuantileSketch
+QUANTILES = (0.5, 0.9, 0.99)  # quantiles of the game length in the summary
+
+# What GameRecorder counted for one game. players is the sorted players list, turns is the number of turns played
+# (skipped ones too), kicks is the moves that sent opponent tokens back to Home, stacks is the turns that stacked a
+# Player's tokens, bounces is the moves that went past "E" and came back, and finish_order is the Players in the order
+# they finished.
+GameRecord = collections.namedtuple("GameRecord", ["players", "turns", "kicks", "stacks", "bounces", "finish_order"])
+
+
+class Histogram:
+    """
+    Counts of int values grouped into buckets of bucket_width. Only buckets that were hit are kept.
+    """
+    def __init__(self, bucket_width=1):
+        self._bucket_width = bucket_width
+        self._counts = {}  # bucket number -> count
+
+    def add(self, value, count=1):
+        """
+        Adds a value to its bucket.
+
+        :param value: int
+        :param count: int. How many times to add it.
+        :return: None
+        """
+        bucket = value // self._bucket_width
+        self._counts[bucket] = self._counts.get(bucket, 0) + count
+
+    def merge(self, other):
+        """
+        Adds the counts of another Histogram with the same bucket width to this one.
+
+        :param other: Histogram
+        :return: None
+        """
+        if other._bucket_width != self._bucket_width:
+            raise ValueError("can only merge histograms with the same bucket width")
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+
+    def get_counts(self):
+        """
+        Returns the count of every bucket that was hit, keyed by the lowest value of the bucket, in order.
+
+        :return: dict with int as keys and int as values
+        """
+        return {bucket * self._bucket_width: count for bucket, count in sorted(self._counts.items())}
+
+
+class Moments:
+    """
+    Count, sum, sum of squares, min, and max of int values, for their mean and variance. Keeps the sums as ints so they
+    stay exact no matter how many values are added or in what order accumulators are merged.
+    """
+    def __init__(self):
+        self._count = 0
+        self._total = 0
+        self._total_squared = 0
+        self._min = None
+        self._max = None
+
+    def add(self, value):
+        """
+        Adds one value.
+
+        :param value: int
+        :return: None
+        """
+        self._count += 1
+        self._total += value
+        self._total_squared += value * value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def merge(self, other):
+        """
+        Adds the values of another Moments to this one.
+
+        :param other: Moments
+        :return: None
+        """
+        self._count += other._count
+        self._total += other._total
+        self._total_squared += other._total_squared
+        if other._min is not None and (self._min is None or other._min < self._min):
+            self._min = other._min
+        if other._max is not None and (self._max is None or other._max > self._max):
+            self._max = other._max
+
+    def get_count(self):
+        """
+        Returns how many values were added.
+
+        :return: int
+        """
+        return self._count
+
+    def get_total(self):
+        """
+        Returns the sum of the values.
+
+        :return: int
+        """
+        return self._total
+
+    def get_mean(self):
+        """
+        Returns the mean of the values, 0.0 if there are none.
+
+        :return: float
+        """
+        return self._total / self._count if self._count else 0.0
+
+    def get_variance(self):
+        """
+        Returns the population variance of the values, 0.0 if there are none. Worked out from the exact int sums, so it
+        doesn't lose precision the way a float running variance would.
+
+        :return: float
+        """
+        if not self._count:
+            return 0.0
+        return (self._count * self._total_squared - self._total * self._total) / (self._count * self._count)
+
+    def get_min(self):
+        """
+        Returns the smallest value, None if there are none.
+
+        :return: int or None
+        """
+        return self._min
+
+    def get_max(self):
+        """
+        Returns the largest value, None if there are none.
+
+        :return: int or None
+        """
+        return self._max
+
+
+class QuantileSketch:
+    """
+    Quantiles of non-negative values in memory that only grows with the log of the largest value. Values go into
+    buckets whose bounds grow by a factor of (1 + accuracy) / (1 - accuracy), so any quantile is within accuracy of the
+    true value relative to it. Zeros get their own count. Two sketches with the same accuracy merge by adding their
+    bucket counts.
+    """
+    def __init__(self, accuracy=SKETCH_ACCURACY):
+        self._accuracy = accuracy
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._zeros = 0
+        self._counts = {}  # bucket number -> count, bucket i holds values in (gamma ** (i - 1), gamma ** i]
+        self._count = 0
+
+    def add(self, value, count=1):
+        """
+        Adds a value. Raises ValueError for a negative value.
+
+        :param value: int or float
+        :param count: int. How many times to add it.
+        :return: None
+        """
+        if value < 0:
+            raise ValueError("QuantileSketch only takes values of 0 and up: {!r}".format(value))
+        self._count += count
+        if value == 0:
+            self._zeros += count
+            return
+        bucket = math.ceil(math.log(value) / self._log_gamma)
+        self._counts[bucket] = self._counts.get(bucket, 0) + count
+
+    def merge(self, other):
+        """
+        Adds the counts of another QuantileSketch with the same accuracy to this one.
+
+        :param other: QuantileSketch
+        :return: None
+        """
+        if other._accuracy != self._accuracy:
+            raise ValueError("can only merge sketches with the same accuracy")
+        self._count += other._count
+        self._zeros += other._zeros
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+
+    def get_count(self):
+        """
+        Returns how many values were added.
+
+        :return: int
+        """
+        return self._count
+
+    def get_bucket_count(self):
+        """
+        Returns how many buckets are in use, which is what the memory of the sketch grows with.
+
+        :return: int
+        """
+        return len(self._counts) + 1
+
+    def quantile(self, fraction):
+        """
+        Returns the value below which fraction of the values fall, to within the sketch's accuracy. Returns None if
+        nothing was added.
+
+        :param fraction: float. From 0 to 1, like 0.99.
+        :return: float or None
+        """
+        if not self._count:
+            return None
+        rank = fraction * (self._count - 1)  # values ranked from 0
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if rank < seen:
+                return 2 * self._gamma ** bucket / (self._gamma + 1)  # middle of the bucket in relative terms
+        return 2 * self._gamma ** max(self._counts) / (self._gamma + 1)
+
+
+class GameRecorder:
+    """
+    Plays turns on a LudoGame and counts what happens in the current game. play_game() plays a whole game the way
+    LudoGame.play_game() does. For games played some other way, like LudoSimulator.play_random_game(), call start()
+    after the game is reset and play every turn with play_turn().
+    """
+    def __init__(self, game=None):
+        self._game = game if game is not None else LudoGame()
+        self._players_list = []
+        self._turns = 0
+        self._kicks = 0
+        self._stacks = 0
+        self._bounces = 0
+        self._finish_order = []
+
+    def get_game(self):
+        """
+        Returns the LudoGame the recorder plays on.
+
+        :return: LudoGame
+        """
+        return self._game
+
+    def start(self, players_list):
+        """
+        Starts counting a new game. Doesn't reset the LudoGame.
+
+        :param players_list: list of str. The players of the game.
+        :return: None
+        """
+        self._players_list = sorted(char.upper() for char in players_list)
+        self._turns = 0
+        self._kicks = 0
+        self._stacks = 0
+        self._bounces = 0
+        self._finish_order = []
+
+    def play_turn(self, player_char, steps):
+        """
+        Plays one turn with LudoGame.play_turn() and counts what it did.
+
+        :param player_char: str. The Player taking this turn.
+        :param steps: int. The steps for a player's turn.
+        :return: tuple of TokenMove. What play_turn() returned.
+        """
+        game = self._game
+        player = game.get_player_by_position(player_char)
+        was_stacked = player.get_stacked_count() if isinstance(player, Player) else 0
+        moves = game.play_turn(player_char, steps)
+        self._turns += 1
+        if moves:
+            for move in moves:
+                if move.kicked:
+                    self._kicks += 1
+                if move.bounced:
+                    self._bounces += 1
+            if player.get_stacked_count() > was_stacked:
+                self._stacks += 1
+            if player.get_completed() and player.get_player_pos() not in self._finish_order:
+                self._finish_order.append(player.get_player_pos())
+        return moves
+
+    def play_game(self, players_list, turns_list):
+        """
+        Resets the LudoGame and plays every turn like LudoGame.play_game(), stopping at the same point it does, then
+        returns what was counted. Doesn't sort the caller's players_list.
+
+        :param players_list: list of str. The players of the game.
+        :param turns_list: iterable of tuples. Tuple is (player char, step count) for that turn.
+        :return: GameRecord
+        """
+        players_list = sorted(players_list)
+        self._game.reset_game(players_list)
+        self.start(players_list)
+        last_winner = len(players_list) - 1
+        winners = self._game.get_winners()
+        for player_char, steps in turns_list:
+            if len(winners) == last_winner:  # every Player but 1 finishes
+                break
+            self.play_turn(player_char, steps)
+        return self.get_record()
+
+    def get_record(self):
+        """
+        Returns what was counted in the current game so far. The finish order is the order Players got every token to
+        the end, which is what get_winners() holds for games that call set_winners() like LudoSimulator does.
+
+        :return: GameRecord
+        """
+        return GameRecord(self._players_list, self._turns, self._kicks, self._stacks, self._bounces,
+                          tuple(self._finish_order))
+
+
+class GameStats:
+    """
+    Streaming totals of many games: game lengths (Moments, a Histogram, and a QuantileSketch), kicks, stacks, and
+    bounces per game, how often each seat finished in each place, and how often each full finish order happened. A game
+    is finished when every Player but 1 got all its tokens to the end. Memory only grows with the number of different
+    values seen, never with the number of games, and two GameStats merge in any order to the same totals.
+    """
+    def __init__(self):
+        self._games = 0
+        self._unfinished = 0  # games that ended with more than 1 Player still playing
+        self._turns = Moments()
+        self._lengths = Histogram(LENGTH_BUCKET)
+        self._length_sketch = QuantileSketch()
+        self._kicks = Moments()
+        self._kick_counts = Histogram()
+        self._stacks = Moments()
+        self._stacked_games = 0  # games where at least one Player stacked its tokens
+        self._bounces = Moments()
+        self._places = {}  # seat -> list of how often it finished in each place
+        self._orders = {}  # full finish order -> count
+
+    def add_game(self, record):
+        """
+        Adds one game to the totals.
+
+        :param record: GameRecord
+        :return: None
+        """
+        self._games += 1
+        self._turns.add(record.turns)
+        self._lengths.add(record.turns)
+        self._length_sketch.add(record.turns)
+        self._kicks.add(record.kicks)
+        self._kick_counts.add(record.kicks)
+        self._stacks.add(record.stacks)
+        self._stacked_games += record.stacks > 0
+        self._bounces.add(record.bounces)
+        order = list(record.finish_order)
+        if len(order) < len(record.players) - 1:
+            self._unfinished += 1
+        elif len(order) == len(record.players) - 1:  # the Player who never finished is last
+            order.extend(char for char in record.players if char not in order)
+        for place, char in enumerate(order):
+            places = self._places.setdefault(char, [])
+            places.extend([0] * (place + 1 - len(places)))
+            places[place] += 1
+        if len(order) == len(record.players):
+            key = "".join(order)
+            self._orders[key] = self._orders.get(key, 0) + 1
+
+    def merge(self, other):
+        """
+        Adds the totals of another GameStats to this one.
+
+        :param other: GameStats
+        :return: None
+        """
+        self._games += other._games
+        self._unfinished += other._unfinished
+        self._turns.merge(other._turns)
+        self._lengths.merge(other._lengths)
+        self._length_sketch.merge(other._length_sketch)
+        self._kicks.merge(other._kicks)
+        self._kick_counts.merge(other._kick_counts)
+        self._stacks.merge(other._stacks)
+        self._stacked_games += other._stacked_games
+        self._bounces.merge(other._bounces)
+        for char, other_places in other._places.items():
+            places = self._places.setdefault(char, [])
+            places.extend([0] * (len(other_places) - len(places)))
+            for place, count in enumerate(other_places):
+                places[place] += count
+        for key, count in other._orders.items():
+            self._orders[key] = self._orders.get(key, 0) + count
+
+    def get_game_count(self):
+        """
+        Returns how many games were added.
+
+        :return: int
+        """
+        return self._games
+
+    def get_turn_count(self):
+        """
+        Returns how many turns the added games had in total.
+
+        :return: int
+        """
+        return self._turns.get_total()
+
+    def get_summary(self):
+        """
+        Returns the totals as a dictionary that can be written as JSON.
+
+        :return: dict
+        """
+        def moments(values):
+            return {"mean": values.get_mean(), "std": values.get_variance() ** 0.5, "min": values.get_min(),
+                    "max": values.get_max(), "total": values.get_total()}
+
+        turns = moments(self._turns)
+        for fraction in QUANTILES:
+            turns["p{:g}".format(fraction * 100)] = self._length_sketch.quantile(fraction)
+        return {
+            "games": self._games,
+            "unfinished": self._unfinished,
+            "turns": turns,
+            "length_histogram": self._lengths.get_counts(),
+            "kicks": moments(self._kicks),
+            "kicks_histogram": self._kick_counts.get_counts(),
+            "stacks": moments(self._stacks),
+            "stacked_game_rate": self._stacked_games / self._games if self._games else 0.0,
+            "bounces": moments(self._bounces),
+            "places": {char: list(places) for char, places in sorted(self._places.items())},
+            "finish_orders": dict(sorted(self._orders.items(), key=lambda item: (-item[1], item[0]))),
+        }
+
+    def format_report(self, top_orders=5):
+        """
+        Returns the summary as lines of text.
+
+        :param top_orders: int. How many of the most common finish orders to list.
+        :return: str
+        """
+        summary = self.get_summary()
+        turns = summary["turns"]
+        lines = ["games: {:,}  unfinished: {:,}  turns: {:,}".format(summary["games"], summary["unfinished"],
+                                                                     turns["total"])]
+        if not summary["games"]:
+            return lines[0]
+        lines.append("turns/game: mean {:.1f}  std {:.1f}  min {}  p50 {:.0f}  p90 {:.0f}  p99 {:.0f}  max {}".format(
+            turns["mean"], turns["std"], turns["min"], turns["p50"], turns["p90"], turns["p99"], turns["max"]))
+        for name in ("kicks", "stacks", "bounces"):
+            values = summary[name]
+            lines.append("{}/game: mean {:.2f}  std {:.2f}  max {}".format(name, values["mean"], values["std"],
+                                                                          values["max"]))
+        lines.append("games with a stack: {:.1%}".format(summary["stacked_game_rate"]))
+        for char, places in summary["places"].items():
+            lines.append("{}: places {}".format(char, places))
+        for order, count in list(summary["finish_orders"].items())[:top_orders]:
+            lines.append("order {}: {:,} ({:.1%})".format(order, count, count / summary["games"]))
+        return "\n".join(lines)
+
+
+def stats_chunk(jobs, layout=None):
+    """
+    Replays a chunk of (players_list, turns_list) jobs and returns their totals.
+
+    :param jobs: list of tuples. Tuple is (players_list, turns_list) for one game.
+    :param layout: BoardLayout or None. The board the games were played on, the classic one if None.
+    :return: GameStats
+    """
+    recorder = GameRecorder(LudoGame(layout))
+    stats = GameStats()
+    for players_list, turns_list in jobs:
+        stats.add_game(recorder.play_game(players_list, turns_list))
+    return stats
+
+
+def log_chunk(path, start, stop):
+    """
+    Replays games start to stop - 1 of a GameLog file and returns their totals. Each worker maps the file itself, so
+    only the game numbers are sent to it.
+
+    :param path: str. Path of the log file.
+    :param start: int. First game.
+    :param stop: int. One past the last game.
+    :return: GameStats
+    """
+    log = GameLog(path)
+    recorder = GameRecorder()
+    stats = GameStats()
+    for number in range(start, stop):
+        stats.add_game(recorder.play_game(log.get_players(number), log.iter_turns(number)))
+    log.close()
+    return stats
+
+
+def simulate_chunk(players_list, seed, chunk_number, num_games, extra_roll=True, max_turns=MAX_TURNS, layout=None):
+    """
+    Plays one chunk of random games with the same dice as LudoSimulator.simulate_chunk() and returns their totals.
+
+    :param players_list: list of str. List of seats of the layout.
+    :param seed: int. Seed of the whole run.
+    :param chunk_number: int. Which chunk of the run.
+    :param num_games: int. Games in this chunk.
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for each game.
+    :param layout: BoardLayout or None. The board to play on, the classic one if None.
+    :return: GameStats
+    """
+    players_list = sorted(players_list)
+    rng = chunk_rng(seed, chunk_number)
+    game = LudoGame(layout)
+    recorder = GameRecorder(game)
+    stats = GameStats()
+    for _ in range(num_games):
+        play_random_game(game, players_list, rng, extra_roll, max_turns, recorder)
+        stats.add_game(recorder.get_record())
+    return stats
+
+
+def merge_chunks(tasks, workers=1):
+    """
+    Runs (function, args) tasks that each return a GameStats and merges them into one. With more than 1 worker the tasks
+    run on a process pool with only a few per worker in flight, so tasks can be a long generator.
+
+    :param tasks: iterable of tuples. Tuple is (function, tuple of args).
+    :param workers: int or None. Number of worker processes, all cores if None. 1 runs in this process.
+    :return: GameStats
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = GameStats()
+    if workers == 1:
+        for function, args in tasks:
+            stats.merge(function(*args))
+        return stats
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for function, args in tasks:
+            pending.add(executor.submit(function, *args))
+            if len(pending) >= workers * 4:  # keep a few chunks queued per worker
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    stats.merge(future.result())
+        for future in concurrent.futures.as_completed(pending):
+            stats.merge(future.result())
+    return stats
+
+
+def replay_stats(jobs, workers=1, chunk_games=1000, layout=None):
+    """
+    Replays (players_list, turns_list) jobs, like the ones LudoPool.play_games() takes, and returns their totals.
+
+    :param jobs: iterable of tuples. Tuple is (players_list, turns_list) for one game.
+    :param workers: int or None. Number of worker processes, all cores if None.
+    :param chunk_games: int. Games sent to a worker at once.
+    :param layout: BoardLayout or None. The board the games were played on, the classic one if None.
+    :return: GameStats
+    """
+    return merge_chunks(((stats_chunk, (chunk, layout)) for chunk in split_chunks(jobs, chunk_games)), workers)
+
+
+def log_stats(path, workers=1, chunk_games=10000):
+    """
+    Replays every game of a GameLog file and returns their totals.
+
+    :param path: str. Path of the log file.
+    :param workers: int or None. Number of worker processes, all cores if None.
+    :param chunk_games: int. Games replayed by a worker at once.
+    :return: GameStats
+    """
+    log = GameLog(path)
+    count = len(log)
+    log.close()
+    return merge_chunks(((log_chunk, (path, start, min(start + chunk_games, count)))
+                         for start in range(0, count, chunk_games)), workers)
+
+
+def simulate_stats(players_list, num_games, seed=0, workers=1, chunk_games=1000, extra_roll=True, max_turns=MAX_TURNS,
+                   layout=None):
+    """
+    Plays num_games random games, with the same dice as LudoSimulator.simulate() for the same seed, and returns their
+    totals.
+
+    :param players_list: list of str. List of seats of the layout.
+    :param num_games: int. Games to play.
+    :param seed: int. Seed of the run.
+    :param workers: int or None. Number of worker processes, all cores if None.
+    :param chunk_games: int. Games per chunk.
+    :param extra_roll: True/False. Whether a 6 earns an extra roll.
+    :param max_turns: int. Turn limit for each game.
+    :param layout: BoardLayout or None. The board to play on, the classic one if None.
+    :return: GameStats
+    """
+    tasks = ((simulate_chunk, (players_list, seed, chunk_number, min(chunk_games, num_games - start), extra_roll,
+                               max_turns, layout))
+             for chunk_number, start in enumerate(range(0, num_games, chunk_games)))
+    return merge_chunks(tasks, workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming statistics of replayed or simulated games.")
+    parser.add_argument("--log", help="game log file (see LudoLog.py) to replay")
+    parser.add_argument("--games", type=int, default=10000, help="without --log, number of random games to play")
+    parser.add_argument("--players", help="without --log, players in the game, every seat of the layout by default")
+    parser.add_argument("--layout", default="classic", choices=sorted(LAYOUTS), help="without --log, board to play on")
+    parser.add_argument("--seed", type=int, default=0, help="without --log, seed of the run")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, all cores by default")
+    parser.add_argument("--json", help="also write the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.log:
+        stats = log_stats(args.log, args.workers)
+    else:
+        layout = LAYOUTS[args.layout]
+        players_list = list((args.players or layout.get_seats()).upper())
+        if any(char not in layout.get_seats() for char in players_list):
+            parser.error("players must be seats of the {} layout: {}".format(args.layout, layout.get_seats()))
+        stats = simulate_stats(players_list, args.games, args.seed, args.workers, layout=layout)
+    print(stats.format_report())
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(stats.get_summary(), json_file, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+# Author: Jeffrey Wang
+# GitHub username: Jeffrey-Wang98
+# Date: October 18, 2026
+# Description: Round-robin tournaments between move policies. Every seating of the policies is played in every set of
+# 2, 3, and 4 seats, with dice seeded by the seats and game number so each seating of the same seats rolls the same
+# dice. With fewer policies than seats, a policy sits in more than one seat. Matches are played across a pool of worker
+# processes and their results are streamed, in match order, into a table of Elo ratings, win rates, and head to head
+# records.
+
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import os
+import random
+import sys
+
+from LudoGame import LudoGame, PriorityPolicy
+from LudoSimulator import MAX_TURNS, play_random_game
+
+SEATS = "ABCD"
+START_RATING = 1500.0
+K_FACTOR = 16.0  # Elo points at stake between two policies in one match
+
+# One match of a tournament. seating is a tuple of (seat, policy name) pairs in seat order, and game is the number of
+# the game played with these seats, which picks the dice.
+Match = collections.namedtuple("Match", ["number", "seating", "game"])
+
+# The result of one match. finish_order is the seats in the order they finished, without the last one.
+MatchResult = collections.namedtuple("MatchResult", ["match", "finish_order", "turns", "finished"])
+
+
+class FurthestPolicy:
+    """
+    Races the token that is furthest ahead, except that a 6 still brings a token out of Home. Ignores kicks.
+    """
+    def choose_move(self, game, player, steps, moves):
+        """
+        Picks one of the moves the Player can make with this roll, see PriorityPolicy.choose_move().
+
+        :param game: LudoGame
+        :param player: Player
+        :param steps: int
+        :param moves: list of TokenMove
+        :return: TokenMove or None
+        """
+        best = None
+        for move in moves:
+            if move.start_steps == -1:
+                return move
+            if best is None or move.start_steps > best.start_steps:
+                best = move
+        return best
+
+
+class RandomPolicy:
+    """
+    Picks any move that can be made, using its own seeded random number generator.
+    """
+    def __init__(self, seed=0):
+        self._rng = random.Random(seed)
+
+    def choose_move(self, game, player, steps, moves):
+        """
+        Picks one of the moves the Player can make with this roll, see PriorityPolicy.choose_move().
+
+        :param game: LudoGame
+        :param player: Player
+        :param steps: int
+        :param moves: list of TokenMove
+        :return: TokenMove or None
+        """
+        if not moves:
+            return None
+        return moves[int(self._rng.random() * len(moves))]
+
+
+def make_priority(seed):
+    """
+    Makes the default policy of LudoGame for a match.
+
+    :param seed: int. Not used, the default policy doesn't roll anything.
+    :return: PriorityPolicy
+    """
+    return PriorityPolicy()
+
+
+def make_furthest(seed):
+    """
+    Makes a FurthestPolicy for a match.
+
+    :param seed: int. Not used.
+    :return: FurthestPolicy
+    """
+    return FurthestPolicy()
+
+
+def make_random(seed):
+    """
+    Makes a RandomPolicy seeded for a match.
+
+    :param seed: int. Seed of the policy's random number generator.
+    :return: RandomPolicy
+    """
+    return RandomPolicy(seed)
+
+
+def make_search(seed):
+    """
+    Makes a SearchPolicy with a small node budget so a match takes about a second.
+
+    :param seed: int. Not used, the search doesn't roll anything.
+    :return: LudoSearch.SearchPolicy
+    """
+    from LudoSearch import SearchEngine, SearchPolicy
+    return SearchPolicy(SearchEngine(max_depth=2, max_nodes=500, table_bits=14))
+
+
+# Policies a tournament can use by name. Each maker takes a seed and returns a new policy for one match, so a policy can
+# keep state during a match without it leaking into the next one.
+POLICIES = {
+    "priority": make_priority,
+    "furthest": make_furthest,
+    "random": make_random,
+    "search": make_search,
+}
+
+
+def make_matches(policy_names, games=1, player_counts=(2, 3, 4)):
+    """
+    Yields every match of a round robin: for each number of players, each set of seats, and each seating of the
+    policies in those seats, games matches. A seating gives every seat a policy and uses as many different policies as
+    it can: with at least as many seats as policies, every policy sits in at least one seat, and with fewer seats than
+    policies, no policy sits in two. So 2 policies play 2, 6, and 14 seatings of 2, 3, and 4 seats.
+
+    :param policy_names: list of str. Names of the policies in the tournament.
+    :param games: int. Matches played with every seating.
+    :param player_counts: iterable of int. Numbers of players per match, from 2 to 4.
+    :return: generator of Match
+    """
+    number = 0
+    for count in player_counts:
+        for seats in itertools.combinations(SEATS, count):
+            for game in range(games):
+                for names in itertools.product(policy_names, repeat=count):
+                    if len(set(names)) == min(count, len(set(policy_names))):
+                        yield Match(number, tuple(zip(seats, names)), game)
+                        number += 1
+
+
+def match_seed(seed, match, part):
+    """
+    Returns the seed for one part of a match: "dice" for the dice, or a seat for that seat's policy. The dice only
+    depend on the seats and the game number, so every ordering of the policies in the same seats plays with the same
+    dice.
+
+    :param seed: int. Seed of the tournament.
+    :param match: Match
+    :param part: str. "dice" or a seat.
+    :return: str
+    """
+    seats = "".join(seat for seat, _ in match.seating)
+    return "ludo-tournament-{}-{}-{}-{}".format(seed, seats, match.game, part)
+
+
+def play_match(game, match, makers, seed, max_turns=MAX_TURNS):
+    """
+    Plays one match on game with a new policy for every seat and seeded dice, then puts the default policies back.
+
+    :param game: LudoGame
+    :param match: Match
+    :param makers: dict with str as keys and functions as values. Policy makers by name, like POLICIES.
+    :param seed: int. Seed of the tournament.
+    :param max_turns: int. Turn limit for the match.
+    :return: MatchResult
+    """
+    players_list = []
+    for seat, name in match.seating:
+        game.set_policy(seat, makers[name](match_seed(seed, match, seat)))
+        players_list.append(seat)
+    try:
+        finish_order, turns, finished = play_random_game(game, players_list,
+                                                         random.Random(match_seed(seed, match, "dice")),
+                                                         max_turns=max_turns)
+    finally:
+        for seat in players_list:
+            game.set_policy(seat)
+    return MatchResult(match, finish_order, turns, finished)
+
+
+_worker_game = None  # the LudoGame each worker process reuses
+_worker_makers = None
+
+
+def start_worker(makers):
+    """
+    Makes the LudoGame a worker process reuses for every match and remembers the policy makers. Runs once in each
+    worker.
+
+    :param makers: dict with str as keys and functions as values.
+    :return: None
+    """
+    global _worker_game, _worker_makers
+    _worker_game = LudoGame()
+    _worker_makers = makers
+
+
+def play_chunk(chunk, seed, max_turns):
+    """
+    Plays a chunk of matches with the worker's LudoGame.
+
+    :param chunk: list of Match
+    :param seed: int. Seed of the tournament.
+    :param max_turns: int. Turn limit for each match.
+    :return: list of MatchResult
+    """
+    return [play_match(_worker_game, match, _worker_makers, seed, max_turns) for match in chunk]
+
+
+def run_tournament(policy_names, games=1, seed=0, workers=None, chunksize=16, player_counts=(2, 3, 4), makers=None,
+                   max_turns=MAX_TURNS):
+    """
+    Plays every match of make_matches() and yields the results in match order as soon as all earlier matches are done.
+    Only a few chunks per worker are in flight or waiting for an earlier chunk at a time. The results only depend on
+    the arguments, not on how many workers play them.
+
+    :param policy_names: list of str. Names of the policies in the tournament.
+    :param games: int. Matches played with every seating.
+    :param seed: int. Seed of the tournament.
+    :param workers: int or None. Number of worker processes, all cores if None. 1 plays in this process.
+    :param chunksize: int. Matches sent to a worker at once.
+    :param player_counts: iterable of int. Numbers of players per match, from 2 to 4.
+    :param makers: dict or None. Policy makers by name, POLICIES if None. Makers must be top level functions or classes
+        so they can be sent to the workers.
+    :param max_turns: int. Turn limit for each match.
+    :return: generator of MatchResult
+    """
+    makers = makers if makers is not None else POLICIES
+    for name in policy_names:
+        if name not in makers:
+            raise ValueError("unknown policy: {}".format(name))
+    matches = make_matches(policy_names, games, player_counts)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        game = LudoGame()
+        for match in matches:
+            yield play_match(game, match, makers, seed, max_turns)
+        return
+    chunks = enumerate(iter(lambda: list(itertools.islice(matches, chunksize)), []))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=start_worker,
+                                                initargs=(makers,)) as executor:
+        pending = {}  # future -> chunk number
+        finished = {}  # chunk number -> results, waiting for earlier chunks
+        next_chunk = 0
+        out_of_matches = False
+        while True:
+            while not out_of_matches and len(pending) + len(finished) < workers * 4:  # like LudoPool.play_games()
+                try:
+                    number, chunk = next(chunks)
+                except StopIteration:
+                    out_of_matches = True
+                    break
+                pending[executor.submit(play_chunk, chunk, seed, max_turns)] = number
+            if not pending:
+                return
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+            while next_chunk in finished:
+                yield from finished.pop(next_chunk)
+                next_chunk += 1
+
+
+class TournamentTable:
+    """
+    Running Elo ratings, win rates, and head to head records of the policies in a tournament. A match counts every
+    policy as beating every other policy that finished after it, and all of a match's rating changes are worked out from
+    the ratings before the match. A policy in more than one seat gets its rating change once, but a game and a score
+    for every seat. Matches that hit the turn limit are only counted as unfinished.
+    """
+    def __init__(self, policy_names, k_factor=K_FACTOR):
+        self._names = list(policy_names)
+        self._k_factor = k_factor
+        self._ratings = dict.fromkeys(self._names, START_RATING)
+        self._games = dict.fromkeys(self._names, 0)
+        self._wins = dict.fromkeys(self._names, 0)
+        self._score = dict.fromkeys(self._names, 0.0)  # 1 for first place down to 0 for last, summed over matches
+        self._beats = {name: dict.fromkeys(self._names, 0) for name in self._names}  # beats[a][b]: a finished ahead
+        self._matches = 0
+        self._unfinished = 0
+
+    def add_result(self, result):
+        """
+        Adds one match to the table.
+
+        :param result: MatchResult
+        :return: None
+        """
+        self._matches += 1
+        if not result.finished:
+            self._unfinished += 1
+            return
+        names = dict(result.match.seating)
+        order = [names[seat] for seat in result.finish_order]
+        order += [names[seat] for seat, _ in result.match.seating if seat not in result.finish_order]
+        last = len(order) - 1
+        scale = self._k_factor / last  # so a match is worth the same points however many play it
+        changes = dict.fromkeys(order, 0.0)
+        for ahead, behind in itertools.combinations(range(len(order)), 2):
+            winner, loser = order[ahead], order[behind]
+            if winner == loser:
+                continue
+            expected = 1.0 / (1.0 + 10.0 ** ((self._ratings[loser] - self._ratings[winner]) / 400.0))
+            changes[winner] += scale * (1.0 - expected)
+            changes[loser] -= scale * (1.0 - expected)
+            self._beats[winner][loser] += 1
+        for name, change in changes.items():
+            self._ratings[name] += change
+        for place, name in enumerate(order):
+            self._games[name] += 1
+            self._score[name] += (last - place) / last
+        self._wins[order[0]] += 1
+
+    def get_matches(self):
+        """
+        Returns how many matches were added, including unfinished ones.
+
+        :return: int
+        """
+        return self._matches
+
+    def get_rows(self):
+        """
+        Returns one dictionary per policy, best rating first, with its rating, games, wins, win rate, and mean score.
+
+        :return: list of dict
+        """
+        rows = []
+        for name in self._names:
+            games = self._games[name]
+            rows.append({
+                "policy": name,
+                "elo": self._ratings[name],
+                "games": games,
+                "wins": self._wins[name],
+                "win_rate": self._wins[name] / games if games else 0.0,
+                "score": self._score[name] / games if games else 0.0,
+            })
+        rows.sort(key=lambda row: -row["elo"])
+        return rows
+
+    def get_head_to_head(self, name, other):
+        """
+        Returns how often policy name finished ahead of policy other in the same match.
+
+        :param name: str
+        :param other: str
+        :return: int
+        """
+        return self._beats[name][other]
+
+    def format_table(self):
+        """
+        Returns the table as text, one line per policy, followed by the head to head records.
+
+        :return: str
+        """
+        lines = ["matches: {:,}  unfinished: {:,}".format(self._matches, self._unfinished),
+                 "{:<12}{:>8}{:>8}{:>8}{:>10}{:>8}".format("policy", "elo", "games", "wins", "win rate", "score")]
+        for row in self.get_rows():
+            lines.append("{:<12}{:>8.0f}{:>8,}{:>8,}{:>10.3f}{:>8.3f}".format(
+                row["policy"], row["elo"], row["games"], row["wins"], row["win_rate"], row["score"]))
+        lines.append("{:<12}".format("ahead of") + "".join("{:>10}".format(name) for name in self._names))
+        for name in self._names:
+            lines.append("{:<12}".format(name) + "".join("{:>10,}".format(self._beats[name][other])
+                                                         for other in self._names))
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play a round-robin tournament between move policies.")
+    parser.add_argument("--policies", default="priority,furthest,random",
+                        help="comma separated policies from: " + ", ".join(POLICIES))
+    parser.add_argument("--games", type=int, default=10, help="matches played with every seating")
+    parser.add_argument("--players", default="234", help="numbers of players per match, for example 24")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the tournament")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, all cores by default")
+    parser.add_argument("--report-every", type=int, default=0, help="print the table every this many matches")
+    args = parser.parse_args(argv)
+
+    policy_names = args.policies.split(",")
+    table = TournamentTable(policy_names)
+    for result in run_tournament(policy_names, args.games, args.seed, args.workers,
+                                 player_counts=[int(count) for count in args.players]):
+        table.add_result(result)
+        if args.report_every and table.get_matches() % args.report_every == 0:
+            print(table.format_table() + "\n")
+    print(table.format_table())
+
+
+if __name__ == "__main__":
+    sys.exit(main())